@@ -0,0 +1,132 @@
+"""
+Helpers shared by the FRA data generation scripts
+Scripts import this module from their own directory, so run them as scripts/<name>.py
+"""
+
+import json
+import os
+import numpy as np
+from types import MappingProxyType
+
+try:
+    from numba import njit  # type: ignore
+except Exception:
+    njit = None
+
+try:
+    import orjson  # type: ignore
+except Exception:
+    orjson = None
+
+# Per-claim-type properties that never vary between Telangana features
+CFR_BASE = MappingProxyType({
+    'claim_type': 'CFR',
+    'fra_type': 'Community Forest Resource Rights',
+    'state': 'Telangana',
+    'area_unit': 'hectares',
+})
+IFR_BASE = MappingProxyType({
+    'claim_type': 'IFR',
+    'fra_type': 'Individual Forest Rights',
+    'state': 'Telangana',
+    'area_unit': 'hectares',
+})
+CR_BASE = MappingProxyType({
+    'claim_type': 'CR',
+    'fra_type': 'Community Rights',
+    'state': 'Telangana',
+    'area_unit': 'hectares',
+    'community_management': True,
+})
+
+def jit(func):
+    """Compile with Numba when it is installed, otherwise run as plain Python"""
+    if njit is None:
+        return func
+    return njit(cache=True, fastmath=True)(func)
+
+def triangulate(poly):
+    """Ear-clip a closed simple (n, 2) ring into an (n-2, 3, 2) array of triangles"""
+    pts = poly[:-1]
+    x, y = pts[:, 0], pts[:, 1]
+    ccw = (np.dot(x, np.roll(y, -1)) - np.dot(np.roll(x, -1), y)) > 0
+    idx = list(range(len(pts))) if ccw else list(range(len(pts)))[::-1]
+    
+    def cross(o, a, b):
+        return (a[0] - o[0]) * (b[1] - o[1]) - (a[1] - o[1]) * (b[0] - o[0])
+    
+    triangles = []
+    while len(idx) > 3:
+        for k in range(len(idx)):
+            i_prev, i, i_next = idx[k - 1], idx[k], idx[(k + 1) % len(idx)]
+            a, b, c = pts[i_prev], pts[i], pts[i_next]
+            if cross(a, b, c) <= 0:
+                continue  # reflex vertex
+            if any(cross(a, b, pts[j]) >= 0 and cross(b, c, pts[j]) >= 0 and cross(c, a, pts[j]) >= 0
+                   for j in idx if j not in (i_prev, i, i_next)):
+                continue  # another vertex lies inside this ear
+            triangles.append((a, b, c))
+            del idx[k]
+            break
+        else:
+            break  # degenerate ring, keep what has been clipped so far
+    if len(idx) == 3:
+        triangles.append(tuple(pts[j] for j in idx))
+    return np.array(triangles)
+
+def triangle_sampler(poly):
+    """Triangles of a closed ring plus their cumulative area fractions, or None if degenerate"""
+    triangles = triangulate(poly)
+    if not len(triangles):
+        return None
+    ab = triangles[:, 1] - triangles[:, 0]
+    ac = triangles[:, 2] - triangles[:, 0]
+    tri_areas = 0.5 * np.abs(ab[:, 0] * ac[:, 1] - ab[:, 1] * ac[:, 0])
+    if tri_areas.sum() <= 0:
+        return None
+    return triangles, np.cumsum(tri_areas) / tri_areas.sum()
+
+def encode_json(obj, indent=False):
+    """UTF-8 JSON bytes, via orjson when available; compact unless indent is set"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY | (orjson.OPT_INDENT_2 if indent else 0))
+    return json.dumps(obj, ensure_ascii=False, indent=2 if indent else None).encode('utf-8')
+
+class GeoJSONStreamWriter:
+    """Write a FeatureCollection to disk one feature at a time
+    
+    The header is written on enter, each write_feature() call encodes and appends a
+    single feature, and the collection `properties` are written as the footer on exit.
+    If the block raises, the partial file is removed rather than closed off as
+    valid GeoJSON.
+    """
+    
+    def __init__(self, output_file, indent=False):
+        self.output_file = output_file
+        self.indent = indent
+        self.properties = {}
+        self.count = 0
+        self._f = None
+    
+    def __enter__(self):
+        self._f = open(self.output_file, 'wb')
+        self._f.write(b'{"type": "FeatureCollection", "features": [\n')
+        return self
+    
+    def write_feature(self, feature):
+        if self.count:
+            self._f.write(b',\n')
+        self._f.write(encode_json(feature, self.indent))
+        self.count += 1
+    
+    def __exit__(self, exc_type, exc, tb):
+        complete = False
+        try:
+            if exc_type is None:
+                self._f.write(b'\n], "properties": ' + encode_json(self.properties, self.indent) + b'}\n')
+                complete = True
+        finally:
+            self._f.close()
+            if not complete:
+                os.remove(self.output_file)
+        return False
@@ -4,14 +4,42 @@ Generate Telangana FRA data at specific forest coordinates provided by user
 Places CFR, IFR, and CR polygons around exact coordinate locations
 """
 
-import json
-import random
+import argparse
 import math
-from datetime import datetime, timedelta
+import numpy as np
+from datetime import date, datetime
 import os
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+from fra_common import CFR_BASE, CR_BASE, IFR_BASE, GeoJSONStreamWriter
+
+def build_fan_sampler(center_xy, ring_xy):
+    """Triangulate a ring that is star-shaped around center_xy into a fan
+    
+    Returns the (n, 2, 2) outer edges of the fan triangles and the cumulative
+    area distribution used to pick a triangle proportionally to its area.
+    """
+    edges = np.stack([ring_xy[:-1], ring_xy[1:]], axis=1)
+    rel = edges - center_xy
+    areas = 0.5 * np.abs(rel[:, 0, 0] * rel[:, 1, 1] - rel[:, 0, 1] * rel[:, 1, 0])
+    cdf = np.cumsum(areas)
+    return edges, cdf / cdf[-1]
+
+def sample_fan(center_xy, edges, cdf, count, rng):
+    """Draw `count` uniform (x, y) points from a triangle fan without rejection"""
+    tri = np.minimum(np.searchsorted(cdf, rng.random(count)), len(cdf) - 1)
+    sqrt_r1 = np.sqrt(rng.random(count))[:, None]
+    r2 = rng.random(count)[:, None]
+    b = edges[tri, 0]
+    c = edges[tri, 1]
+    return (1 - sqrt_r1) * center_xy + sqrt_r1 * (1 - r2) * b + sqrt_r1 * r2 * c
 
 class CoordinateBasedFRAGenerator:
-    def __init__(self):
+    def __init__(self, seed=None):
+        # One Generator drives every random draw; pass a seed for reproducible output
+        self.rng = np.random.default_rng(seed)
+        
         # Specific forest coordinates provided by user (from coordinate images)
         self.forest_coordinates = [
             {'lat': 17.95, 'lon': 80.45, 'name': 'Eastern_Forest', 'district': 'Khammam'},
@@ -19,6 +47,11 @@ class CoordinateBasedFRAGenerator:
             {'lat': 16.15, 'lon': 78.72, 'name': 'Southern_Forest', 'district': 'Mahbubnagar'}
         ]
         
+        # Short codes used in claim IDs, derived once per location
+        for loc in self.forest_coordinates:
+            loc['district_code'] = loc['district'][:3].upper()
+            loc['name_code'] = loc['name'][:3].upper()
+        
         # Telangana forest districts
         self.forest_districts = ['Adilabad', 'Kumuram Bheem', 'Khammam', 'Mahbubnagar', 'Warangal', 'Mancherial']
         
@@ -28,11 +61,29 @@ class CoordinateBasedFRAGenerator:
         # Village patterns for Telangana
         self.village_patterns = ['palli', 'guda', 'nagar', 'puram']
         
+        # Submission dates are offsets from one "today" taken per run
+        self.today_ordinal = date.today().toordinal()
+        
+        # Household heads for IFR claims
+        self.household_heads = [
+            'Ramesh Kumar', 'Sita Devi', 'Lakshman Singh', 'Ganga Bai', 
+            'Ravi Rao', 'Kamala Devi', 'Suresh Kumar', 'Radha Bai',
+            'Gopal Singh', 'Anita Devi', 'Kiran Kumar', 'Pushpa Bai'
+        ]
+        
+    def choice(self, population):
+        """Pick one element of a short list via an integer draw from self.rng"""
+        return population[self.rng.integers(len(population))]
+    
+    def choices(self, population, k):
+        """Pick k elements (with replacement) of a short list in one draw"""
+        return [population[i] for i in self.rng.integers(len(population), size=k)]
+    
     def generate_realistic_village_name(self):
         """Generate realistic village names for Telangana"""
         prefixes = ['Raja', 'Krishna', 'Rama', 'Sita', 'Ganga', 'Venkate', 'Lakshmi', 'Bhima', 'Koti', 'Meka']
-        suffix = random.choice(self.village_patterns)
-        prefix = random.choice(prefixes)
+        suffix = self.choice(self.village_patterns)
+        prefix = self.choice(prefixes)
         return f"{prefix}{suffix}"
     
     def generate_point_near_coordinate(self, base_lat, base_lon, radius_km=3.0):
@@ -41,8 +92,9 @@ class CoordinateBasedFRAGenerator:
         radius_deg = radius_km / 111.0
         
         # Random angle and distance
-        angle = random.uniform(0, 2 * math.pi)
-        distance = random.uniform(0.1, radius_deg)  # Min 0.1 km away
+        angle = self.rng.uniform(0, 2 * math.pi)
+        # random.uniform tolerated 0.1 > radius_deg; Generator.uniform needs ordered bounds
+        distance = self.rng.uniform(min(0.1, radius_deg), max(0.1, radius_deg))
         
         # Calculate new coordinates
         lat = base_lat + distance * math.cos(angle)
@@ -50,69 +102,59 @@ class CoordinateBasedFRAGenerator:
         
         return lat, lon
     
-    def generate_polygon(self, center_lat, center_lon, area_hectares, shape='irregular'):
-        """Generate polygon with specified area around center point"""
+    def generate_polygon(self, center_lat, center_lon, area_hectares):
+        """Generate an irregular polygon with specified area around center point
+        
+        Returns (points, bounds) where bounds is (min_lon, min_lat, max_lon, max_lat).
+        Rectangular IFR plots are built in bulk by generate_rectangles().
+        """
         # Convert hectares to approximate degrees (rough approximation)
         area_deg_sq = area_hectares * 0.0001
         radius_deg = math.sqrt(area_deg_sq / math.pi)
         
-        if shape == 'rectangular':
-            # Rectangular plot (typical for agricultural IFR)
-            width = radius_deg * random.uniform(1.2, 2.5)
-            height = area_deg_sq / width
-            
-            # Add slight rotation
-            rotation = random.uniform(-math.pi/8, math.pi/8)
-            
-            corners = [
-                [-width/2, -height/2],
-                [width/2, -height/2], 
-                [width/2, height/2],
-                [-width/2, height/2]
-            ]
-            
-            points = []
-            for corner in corners:
-                x_rot = corner[0] * math.cos(rotation) - corner[1] * math.sin(rotation)
-                y_rot = corner[0] * math.sin(rotation) + corner[1] * math.cos(rotation)
-                points.append([center_lon + x_rot, center_lat + y_rot])
-            
-        else:
-            # Irregular polygon
-            num_points = random.randint(6, 10)
-            points = []
-            
-            for i in range(num_points):
-                angle = 2 * math.pi * i / num_points
-                r = radius_deg * random.uniform(0.7, 1.3)
-                
-                lat = center_lat + r * math.cos(angle)
-                lon = center_lon + r * math.sin(angle)
-                points.append([lon, lat])
+        num_points = int(self.rng.integers(6, 11))
+        angles = np.arange(num_points) * (2 * math.pi / num_points)
+        r = radius_deg * self.rng.uniform(0.7, 1.3, num_points)
+        
+        points = np.column_stack([
+            center_lon + r * np.sin(angles),
+            center_lat + r * np.cos(angles)
+        ])
+        
+        min_lon, min_lat = points.min(axis=0)
+        max_lon, max_lat = points.max(axis=0)
+        bounds = (float(min_lon), float(min_lat), float(max_lon), float(max_lat))
         
         # Close the polygon
-        points.append(points[0])
-        return points
+        return np.vstack([points, points[:1]]).tolist(), bounds
     
-    def point_in_polygon(self, point, polygon_coords):
-        """Check if a point is inside a polygon using ray casting algorithm"""
-        x, y = point
-        n = len(polygon_coords)
-        inside = False
-        
-        p1x, p1y = polygon_coords[0]
-        for i in range(1, n + 1):
-            p2x, p2y = polygon_coords[i % n]
-            if y > min(p1y, p2y):
-                if y <= max(p1y, p2y):
-                    if x <= max(p1x, p2x):
-                        if p1y != p2y:
-                            xinters = (y - p1y) * (p2x - p1x) / (p2y - p1y) + p1x
-                        if p1x == p2x or x <= xinters:
-                            inside = not inside
-            p1x, p1y = p2x, p2y
-        
-        return inside
+    def generate_rectangles(self, centers, areas_hectares):
+        """Generate rotated rectangular plots for many (lat, lon) centers at once
+        
+        Widths, heights and rotations are drawn as arrays and every 2x2 rotation
+        is applied in a single einsum. Returns closed rings as nested lists.
+        """
+        centers = np.asarray(centers, dtype=np.float64)
+        area_deg_sq = np.asarray(areas_hectares, dtype=np.float64) * 0.0001
+        radius_deg = np.sqrt(area_deg_sq / math.pi)
+        n = len(area_deg_sq)
+        
+        width = radius_deg * self.rng.uniform(1.2, 2.5, n)
+        # Keep the aspect ratio within ~[0.3, 3.0] so small plots never degenerate
+        side = np.sqrt(area_deg_sq)
+        width = np.clip(width, side / 1.8, side * 1.8)
+        height = area_deg_sq / width
+        rotations = self.rng.uniform(-math.pi/8, math.pi/8, n)
+        c, s = np.cos(rotations), np.sin(rotations)
+        
+        # (n, 2, 2) rotation matrices and (n, 4, 2) unrotated corners
+        R = np.stack([np.stack([c, -s], axis=-1), np.stack([s, c], axis=-1)], axis=1)
+        signs = np.array([[-1, -1], [1, -1], [1, 1], [-1, 1]]) * 0.5
+        corners = signs * np.stack([width, height], axis=-1)[:, None, :]
+        
+        points = np.einsum('nij,nkj->nki', R, corners) + centers[:, None, ::-1]
+        rings = np.concatenate([points, points[:, :1]], axis=1)
+        return rings.tolist()
     
     def generate_cfr_at_location(self, forest_loc, village_name, tribal_community):
         """Generate a CFR polygon at a specific forest location"""
@@ -122,10 +164,10 @@ class CoordinateBasedFRAGenerator:
         )
         
         # CFR should be substantial - 200-600 hectares
-        area_hectares = random.uniform(200, 600)
+        area_hectares = self.rng.uniform(200, 600)
         
-        polygon_coords = self.generate_polygon(
-            center_lat, center_lon, area_hectares, 'irregular'
+        polygon_coords, (min_lon, min_lat, max_lon, max_lat) = self.generate_polygon(
+            center_lat, center_lon, area_hectares
         )
         
         cfr_data = {
@@ -133,34 +175,38 @@ class CoordinateBasedFRAGenerator:
             'center': [center_lat, center_lon],
             'area_hectares': area_hectares,
             'district': forest_loc['district'],
+            'district_code': forest_loc['district_code'],
             'location_name': forest_loc['name'],
             'bounds': {
-                'min_lat': min(coord[1] for coord in polygon_coords),
-                'max_lat': max(coord[1] for coord in polygon_coords),
-                'min_lon': min(coord[0] for coord in polygon_coords),
-                'max_lon': max(coord[0] for coord in polygon_coords)
+                'min_lat': min_lat,
+                'max_lat': max_lat,
+                'min_lon': min_lon,
+                'max_lon': max_lon
             }
         }
         
+        # The ring is built radially around its center, so a triangle fan from
+        # the center covers it exactly and interior points need no rejection
+        cfr_data['fan_edges'], cfr_data['fan_cdf'] = build_fan_sampler(
+            np.array([center_lon, center_lat]), np.asarray(polygon_coords, dtype=np.float64)
+        )
+        
         cfr_feature = {
             'type': 'Feature',
             'properties': {
-                'claim_id': f'CFR_TG_{forest_loc["district"][:3].upper()}_{forest_loc["name"][:3].upper()}',
-                'claim_type': 'CFR',
-                'fra_type': 'Community Forest Resource Rights',
+                **CFR_BASE,
+                'claim_id': f'CFR_TG_{forest_loc["district_code"]}_{forest_loc["name_code"]}',
                 'village': village_name,
                 'district': forest_loc['district'],
-                'state': 'Telangana',
                 'area_claimed': round(area_hectares, 2),
-                'area_unit': 'hectares',
-                'status': random.choice(['Approved', 'Pending', 'Under Review']),
+                'status': self.choice(['Approved', 'Pending', 'Under Review']),
                 'tribal_community': tribal_community,
                 'gram_sabha': f'{village_name} Gram Sabha',
-                'total_households': random.randint(50, 150),
-                'forest_committee_formed': random.choice([True, False]),
-                'management_plan': random.choice(['Prepared', 'Under Preparation', 'Not Started']),
-                'submission_date': (datetime.now() - timedelta(days=random.randint(60, 900))).strftime('%Y-%m-%d'),
-                'forest_type': random.choice(['Dry Deciduous', 'Moist Deciduous', 'Scrub Forest']),
+                'total_households': int(self.rng.integers(50, 151)),
+                'forest_committee_formed': self.choice([True, False]),
+                'management_plan': self.choice(['Prepared', 'Under Preparation', 'Not Started']),
+                'submission_date': date.fromordinal(self.today_ordinal - int(self.rng.integers(60, 901))).isoformat(),
+                'forest_type': self.choice(['Dry Deciduous', 'Moist Deciduous', 'Scrub Forest']),
                 'forest_location': forest_loc['name'],
                 'base_coordinates': f"{forest_loc['lat']}, {forest_loc['lon']}"
             },
@@ -172,66 +218,59 @@ class CoordinateBasedFRAGenerator:
         
         return cfr_data, cfr_feature
     
-    def generate_point_inside_cfr(self, cfr_data):
-        """Generate a random point inside the CFR polygon"""
-        bounds = cfr_data['bounds']
-        max_attempts = 150
-        
-        for _ in range(max_attempts):
-            lon = random.uniform(bounds['min_lon'], bounds['max_lon'])
-            lat = random.uniform(bounds['min_lat'], bounds['max_lat'])
-            
-            if self.point_in_polygon([lon, lat], cfr_data['coordinates'][0]):
-                return lat, lon
+    def generate_points_inside_cfr(self, cfr_data, count):
+        """Generate `count` random (lat, lon) points inside the CFR polygon
         
-        # Fallback to CFR center
-        return cfr_data['center'][0], cfr_data['center'][1]
+        Points are drawn directly from the CFR's triangle fan, picking each
+        triangle proportionally to its area.
+        """
+        center_xy = np.array(cfr_data['center'][::-1])
+        points = sample_fan(center_xy, cfr_data['fan_edges'], cfr_data['fan_cdf'], count, self.rng)
+        return points[:, ::-1].tolist()
     
     def generate_ifr_polygons(self, cfr_data, village_name, tribal_community, num_ifrs=25):
-        """Generate IFR polygons inside CFR - individual property sizes (0.1-1.2 hectares)"""
-        ifr_features = []
+        """Yield IFR polygons inside CFR - individual property sizes (0.1-1.2 hectares)"""
         district = cfr_data['district']
+        claim_prefix = f"IFR_TG_{cfr_data['district_code']}_"
         
-        for i in range(num_ifrs):
-            # Generate point inside CFR
-            center_lat, center_lon = self.generate_point_inside_cfr(cfr_data)
-            
-            # IFR should be very small - individual household land (0.1 to 1.2 hectares)
-            area_hectares = random.uniform(0.1, 1.2)
-            
-            # Generate small rectangular plot (typical for individual holdings)
-            polygon_coords = self.generate_polygon(
-                center_lat, center_lon, area_hectares, 'rectangular'
-            )
-            
-            # Generate household head name
-            household_heads = [
-                'Ramesh Kumar', 'Sita Devi', 'Lakshman Singh', 'Ganga Bai', 
-                'Ravi Rao', 'Kamala Devi', 'Suresh Kumar', 'Radha Bai',
-                'Gopal Singh', 'Anita Devi', 'Kiran Kumar', 'Pushpa Bai'
-            ]
-            household_head = random.choice(household_heads)
+        # Generate all IFR centers inside the CFR in one batch
+        centers = self.generate_points_inside_cfr(cfr_data, num_ifrs)
+        
+        # Draw every per-IFR random field up front, one call per field
+        # IFR should be very small - individual household land (0.1 to 1.2 hectares)
+        areas = self.rng.uniform(0.1, 1.2, num_ifrs).tolist()
+        household_heads = self.choices(self.household_heads, num_ifrs)
+        statuses = self.choices(['Approved', 'Pending', 'Under Review'], num_ifrs)
+        family_members = self.rng.integers(3, 9, num_ifrs).tolist()
+        livelihoods = self.choices(['Agriculture', 'NTFP Collection', 'Animal Husbandry', 'Mixed'], num_ifrs)
+        submission_days = self.rng.integers(30, 731, num_ifrs).tolist()
+        survey_numbers = self.rng.integers(100, 1000, num_ifrs).tolist()
+        pattas_issued = self.choices([True, False], num_ifrs)
+        cultivation_types = self.choices(['Paddy', 'Cotton', 'Maize', 'Vegetables', 'Mixed Crops'], num_ifrs)
+        
+        # Generate small rectangular plots (typical for individual holdings)
+        rings = self.generate_rectangles(centers, areas)
+        
+        for i, polygon_coords in enumerate(rings):
+            area_hectares = areas[i]
             
             ifr_feature = {
                 'type': 'Feature',
                 'properties': {
-                    'claim_id': f'IFR_TG_{district[:3].upper()}_{i+1:03d}',
-                    'claim_type': 'IFR',
-                    'fra_type': 'Individual Forest Rights',
+                    **IFR_BASE,
+                    'claim_id': f'{claim_prefix}{i+1:03d}',
                     'village': village_name,
                     'district': district,
-                    'state': 'Telangana',
                     'area_claimed': round(area_hectares, 2),
-                    'area_unit': 'hectares',
-                    'status': random.choice(['Approved', 'Pending', 'Under Review']),
+                    'status': statuses[i],
                     'tribal_community': tribal_community,
-                    'household_head': household_head,
-                    'family_members': random.randint(3, 8),
-                    'livelihood': random.choice(['Agriculture', 'NTFP Collection', 'Animal Husbandry', 'Mixed']),
-                    'submission_date': (datetime.now() - timedelta(days=random.randint(30, 730))).strftime('%Y-%m-%d'),
-                    'survey_number': f'SY_{random.randint(100, 999)}',
-                    'patta_issued': random.choice([True, False]),
-                    'cultivation_type': random.choice(['Paddy', 'Cotton', 'Maize', 'Vegetables', 'Mixed Crops']),
+                    'household_head': household_heads[i],
+                    'family_members': family_members[i],
+                    'livelihood': livelihoods[i],
+                    'submission_date': date.fromordinal(self.today_ordinal - submission_days[i]).isoformat(),
+                    'survey_number': f'SY_{survey_numbers[i]}',
+                    'patta_issued': pattas_issued[i],
+                    'cultivation_type': cultivation_types[i],
                     'forest_location': cfr_data['location_name']
                 },
                 'geometry': {
@@ -240,48 +279,48 @@ class CoordinateBasedFRAGenerator:
                 }
             }
             
-            ifr_features.append(ifr_feature)
-        
-        return ifr_features
+            yield ifr_feature
     
     def generate_cr_features(self, cfr_data, village_name, tribal_community, num_crs=4):
-        """Generate CR features inside CFR - only as polygons, no point markers"""
-        cr_features = []
+        """Yield CR features inside CFR - only as polygons, no point markers"""
         district = cfr_data['district']
+        claim_prefix = f"CR_TG_{cfr_data['district_code']}_"
         
         cr_types = ['Grazing Ground', 'NTFP Collection Area', 'Sacred Grove', 'Community Water Source']
         
-        for i in range(num_crs):
-            cr_type = random.choice(cr_types)
-            
-            # Generate point inside CFR
-            center_lat, center_lon = self.generate_point_inside_cfr(cfr_data)
-            
-            # All CR features as polygons - small to medium areas (1-15 hectares)
-            area_hectares = random.uniform(1.0, 15.0)
+        # Generate all CR centers inside the CFR in one batch
+        centers = self.generate_points_inside_cfr(cfr_data, num_crs)
+        
+        # Draw every per-CR random field up front, one call per field
+        resource_types = self.choices(cr_types, num_crs)
+        # All CR features as polygons - small to medium areas (1-15 hectares)
+        areas = self.rng.uniform(1.0, 15.0, num_crs).tolist()
+        statuses = self.choices(['Approved', 'Pending'], num_crs)
+        beneficiaries = self.rng.integers(20, 81, num_crs).tolist()
+        usage_patterns = self.choices(['Seasonal', 'Year-round', 'Occasional'], num_crs)
+        traditional_uses = self.choices([True, False], num_crs)
+        
+        for i, (center_lat, center_lon) in enumerate(centers):
+            area_hectares = areas[i]
             
-            polygon_coords = self.generate_polygon(
-                center_lat, center_lon, area_hectares, 'irregular'
+            polygon_coords, _ = self.generate_polygon(
+                center_lat, center_lon, area_hectares
             )
             
             cr_feature = {
                 'type': 'Feature',
                 'properties': {
-                    'claim_id': f'CR_TG_{district[:3].upper()}_{i+1:03d}',
-                    'claim_type': 'CR',
-                    'fra_type': 'Community Rights',
-                    'resource_type': cr_type,
+                    **CR_BASE,
+                    'claim_id': f'{claim_prefix}{i+1:03d}',
+                    'resource_type': resource_types[i],
                     'village': village_name,
                     'district': district,
-                    'state': 'Telangana',
                     'area_claimed': round(area_hectares, 2),
-                    'area_unit': 'hectares',
-                    'status': random.choice(['Approved', 'Pending']),
+                    'status': statuses[i],
                     'tribal_community': tribal_community,
-                    'beneficiary_households': random.randint(20, 80),
-                    'usage_pattern': random.choice(['Seasonal', 'Year-round', 'Occasional']),
-                    'traditional_use': random.choice([True, False]),
-                    'community_management': True,
+                    'beneficiary_households': beneficiaries[i],
+                    'usage_pattern': usage_patterns[i],
+                    'traditional_use': traditional_uses[i],
                     'forest_location': cfr_data['location_name']
                 },
                 'geometry': {
@@ -290,99 +329,159 @@ class CoordinateBasedFRAGenerator:
                 }
             }
             
-            cr_features.append(cr_feature)
+            yield cr_feature
+    
+    def generate_location_features(self, forest_loc):
+        """Yield the CFR plus its IFR and CR features for one forest location"""
+        village_name = self.generate_realistic_village_name()
+        tribal_community = self.choice(self.tribal_communities)
+        
+        # Generate CFR at this forest location
+        cfr_data, cfr_feature = self.generate_cfr_at_location(forest_loc, village_name, tribal_community)
+        yield cfr_feature
         
-        return cr_features
+        # Generate IFR features inside CFR
+        yield from self.generate_ifr_polygons(
+            cfr_data, village_name, tribal_community, 
+            num_ifrs=int(self.rng.integers(15, 26))  # Fewer IFRs per location
+        )
+        
+        # Generate CR features inside CFR
+        yield from self.generate_cr_features(
+            cfr_data, village_name, tribal_community, 
+            num_crs=int(self.rng.integers(3, 6))
+        )
     
-    def generate_telangana_fra_data(self):
-        """Generate complete FRA data for the 3 specific forest locations"""
-        all_features = []
+    def iter_telangana_fra_features(self, workers=1):
+        """Yield FRA features for the 3 specific forest locations
         
+        Each location is built with its own seed drawn from this generator's rng, so
+        seeded runs give the same output whether they run serially (the default) or,
+        with workers > 1, in a process pool.
+        """
         print(f"Generating FRA data for {len(self.forest_coordinates)} forest locations...")
         
-        for idx, forest_loc in enumerate(self.forest_coordinates):
+        for forest_loc in self.forest_coordinates:
             print(f"Processing {forest_loc['name']} at {forest_loc['lat']}, {forest_loc['lon']}")
-            
-            village_name = self.generate_realistic_village_name()
-            tribal_community = random.choice(self.tribal_communities)
-            
-            # Generate CFR at this forest location
-            cfr_data, cfr_feature = self.generate_cfr_at_location(forest_loc, village_name, tribal_community)
-            all_features.append(cfr_feature)
-            
-            # Generate IFR features inside CFR
-            ifr_features = self.generate_ifr_polygons(
-                cfr_data, village_name, tribal_community, 
-                num_ifrs=random.randint(15, 25)  # Fewer IFRs per location
-            )
-            all_features.extend(ifr_features)
-            
-            # Generate CR features inside CFR
-            cr_features = self.generate_cr_features(
-                cfr_data, village_name, tribal_community, 
-                num_crs=random.randint(3, 5)
-            )
-            all_features.extend(cr_features)
+        
+        seeds = self.rng.integers(2**32, size=len(self.forest_coordinates)).tolist()
+        if workers > 1:
+            with ProcessPoolExecutor(max_workers=min(len(seeds), workers, os.cpu_count() or 1)) as executor:
+                for features in executor.map(_build_location, seeds, self.forest_coordinates):
+                    yield from features
+        else:
+            for features in map(_build_location, seeds, self.forest_coordinates):
+                yield from features
+    
+    def collection_properties(self, total_features):
+        """FeatureCollection-level properties for the generated data"""
+        return {
+            'title': 'Telangana Forest Rights Act Spatial Data (Coordinate-Based)',
+            'description': 'FRA claims data placed at specific forest coordinates provided by user',
+            'created_date': datetime.now().isoformat(),
+            'total_features': total_features,
+            'state': 'Telangana',
+            'spatial_reference': 'EPSG:4326 (WGS84)',
+            'data_quality': 'Synthetic but placed at user-specified forest locations',
+            'coordinate_locations': [
+                f"{loc['name']}: {loc['lat']}, {loc['lon']}" for loc in self.forest_coordinates
+            ]
+        }
+    
+    def generate_telangana_fra_data(self, workers=1):
+        """Generate complete FRA data for the 3 specific forest locations as one dict"""
+        all_features = list(self.iter_telangana_fra_features(workers))
         
         # Create GeoJSON structure
         fra_geojson = {
             'type': 'FeatureCollection',
-            'properties': {
-                'title': 'Telangana Forest Rights Act Spatial Data (Coordinate-Based)',
-                'description': 'FRA claims data placed at specific forest coordinates provided by user',
-                'created_date': datetime.now().isoformat(),
-                'total_features': len(all_features),
-                'state': 'Telangana',
-                'spatial_reference': 'EPSG:4326 (WGS84)',
-                'data_quality': 'Synthetic but placed at user-specified forest locations',
-                'coordinate_locations': [
-                    f"{loc['name']}: {loc['lat']}, {loc['lon']}" for loc in self.forest_coordinates
-                ]
-            },
+            'properties': self.collection_properties(len(all_features)),
             'features': all_features
         }
         
         return fra_geojson
 
+def _build_location(seed, forest_loc):
+    """Worker entry point: build one location's features with its own seeded rng"""
+    return list(CoordinateBasedFRAGenerator(seed).generate_location_features(forest_loc))
+
+def write_columnar_geojson(fra_data, output_file):
+    """Write the features through GeoPandas, building every polygon in one shapely call
+    
+    Rings are packed into a single (total_vertices, 2) array with a ring index per
+    vertex and properties are stored column-wise. Collection-level properties are
+    not carried over and properties absent on a claim type are written as null.
+    """
+    import geopandas as gpd
+    import shapely
+    
+    features = fra_data['features']
+    rings = [feature['geometry']['coordinates'][0] for feature in features]
+    lengths = np.fromiter((len(ring) for ring in rings), dtype=np.intp, count=len(rings))
+    coords = np.array([coord for ring in rings for coord in ring], dtype=np.float64)
+    ring_index = np.repeat(np.arange(len(rings)), lengths)
+    polygons = shapely.polygons(shapely.linearrings(coords, indices=ring_index))
+    
+    columns = {}
+    for feature in features:
+        for key in feature['properties']:
+            columns.setdefault(key, [])
+    for key, values in columns.items():
+        values.extend(feature['properties'].get(key) for feature in features)
+    
+    # Nullable dtypes keep int/bool columns typed where a claim type lacks the field
+    gdf = gpd.GeoDataFrame(columns, geometry=polygons, crs='EPSG:4326').convert_dtypes()
+    gdf.to_file(output_file, driver='GeoJSON')
+
 def main():
     """Generate Telangana FRA data at specific coordinates"""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--seed', type=int, default=None,
+                        help='Seed for the random generator (default: nondeterministic)')
+    parser.add_argument('--columnar', action='store_true',
+                        help='Write through GeoPandas/shapely instead of the streaming GeoJSON writer')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='Worker processes for location generation (default: 1, serial)')
+    args = parser.parse_args()
+    
     print("🎯 Generating Telangana FRA Data at Specified Forest Coordinates...")
     print("=" * 70)
     
-    generator = CoordinateBasedFRAGenerator()
+    generator = CoordinateBasedFRAGenerator(args.seed)
     
     # Show coordinate locations
     print("📍 Target Forest Locations:")
     for loc in generator.forest_coordinates:
         print(f"   • {loc['name']}: {loc['lat']}°N, {loc['lon']}°E ({loc['district']})")
     
-    # Generate FRA data
-    fra_data = generator.generate_telangana_fra_data()
-    
     # Save to file
     os.makedirs('output', exist_ok=True)
     output_file = 'output/telangana_fra_coordinates.geojson'
     
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(fra_data, f, indent=2, ensure_ascii=False)
+    if args.columnar:
+        fra_data = generator.generate_telangana_fra_data(args.workers)
+        write_columnar_geojson(fra_data, output_file)
+        props = [feature['properties'] for feature in fra_data['features']]
+    else:
+        # Stream features straight to disk, keeping only their properties for the summary
+        props = []
+        with GeoJSONStreamWriter(output_file) as writer:
+            for feature in generator.iter_telangana_fra_features(args.workers):
+                writer.write_feature(feature)
+                props.append(feature['properties'])
+            writer.properties = generator.collection_properties(writer.count)
     
     print(f"\n✅ Telangana FRA data generated successfully!")
     print(f"📁 Output file: {output_file}")
-    print(f"📊 Total features: {len(fra_data['features'])}")
+    print(f"📊 Total features: {len(props)}")
     
     # Print summary by feature type and location
-    feature_counts = {}
-    total_area_by_type = {}
-    location_counts = {}
+    types = np.array([p['claim_type'] for p in props])
+    areas = np.fromiter((p.get('area_claimed', 0) for p in props), dtype=np.float64, count=len(props))
     
-    for feature in fra_data['features']:
-        ftype = feature['properties']['claim_type']
-        area = feature['properties'].get('area_claimed', 0)
-        location = feature['properties'].get('forest_location', 'Unknown')
-        
-        feature_counts[ftype] = feature_counts.get(ftype, 0) + 1
-        total_area_by_type[ftype] = total_area_by_type.get(ftype, 0) + area
-        location_counts[location] = location_counts.get(location, 0) + 1
+    feature_counts = Counter(types.tolist())
+    total_area_by_type = {ftype: areas[types == ftype].sum() for ftype in feature_counts}
+    location_counts = Counter(p.get('forest_location', 'Unknown') for p in props)
     
     print("\n📈 Feature type distribution:")
     for ftype, count in feature_counts.items():
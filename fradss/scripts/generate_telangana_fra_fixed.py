@@ -5,18 +5,122 @@ Based on existing Telangana land-use data (Tree cover areas)
 Fixed version with proper CFR spacing and no CR point markers
 """
 
+import argparse
 import json
-import random
 import math
+import numpy as np
 from datetime import datetime, timedelta
 import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import starmap
+
+from fra_common import CFR_BASE, CR_BASE, IFR_BASE, triangle_sampler
+
+try:
+    import orjson  # type: ignore
+except Exception:
+    orjson = None
+
+try:
+    import ijson  # type: ignore
+except Exception:
+    ijson = None
+
+try:
+    import shapely  # type: ignore
+except Exception:
+    shapely = None
+
+# Value pools for the random property draws, built once at import
+VILLAGE_PREFIXES = ('Raja', 'Krishna', 'Rama', 'Sita', 'Ganga', 'Venkate', 'Lakshmi', 'Bhima', 'Koti', 'Meka')
+HOUSEHOLD_HEADS = (
+    'Ramesh Kumar', 'Sita Devi', 'Lakshman Singh', 'Ganga Bai', 
+    'Ravi Rao', 'Kamala Devi', 'Suresh Kumar', 'Radha Bai',
+    'Gopal Singh', 'Anita Devi', 'Kiran Kumar', 'Pushpa Bai'
+)
+CLAIM_STATUSES = ('Approved', 'Pending', 'Under Review')
+CR_STATUSES = ('Approved', 'Pending')
+LIVELIHOODS = ('Agriculture', 'NTFP Collection', 'Animal Husbandry', 'Mixed')
+CULTIVATION_TYPES = ('Paddy', 'Cotton', 'Maize', 'Vegetables', 'Mixed Crops')
+CR_TYPES = ('Grazing Ground', 'NTFP Collection Area', 'Sacred Grove', 'Community Water Source')
+USAGE_PATTERNS = ('Seasonal', 'Year-round', 'Occasional')
+MANAGEMENT_PLANS = ('Prepared', 'Under Preparation', 'Not Started')
+FOREST_TYPES = ('Dry Deciduous', 'Moist Deciduous', 'Scrub Forest')
+RATINGS = ('High', 'Medium', 'Low')
+YES_NO = (True, False)
+
+def _edges(poly):
+    """Per-edge (x1, y1, y2, dx, dy) arrays of a closed (n, 2) ring, built once per polygon"""
+    x1, y1 = poly[:-1, 0], poly[:-1, 1]
+    y2 = poly[1:, 1]
+    return x1, y1, y2, poly[1:, 0] - x1, y2 - y1
+
+def _pip_batch_precomp(xs, ys, edges):
+    """Vectorized winding-number test of (xs, ys) query points against precomputed edges"""
+    x1, y1, y2, dx, dy = edges
+    xs = xs[:, None]
+    ys = ys[:, None]
+    
+    # Sign of the cross product tells which side of each edge the point is on
+    is_left = dx * (ys - y1) - dy * (xs - x1)
+    upward = (y1 <= ys) & (y2 > ys) & (is_left > 0)
+    downward = (y1 > ys) & (y2 <= ys) & (is_left < 0)
+    
+    return (upward.sum(axis=1) - downward.sum(axis=1)) != 0
+
+def _sampling_plan(poly, bbox_area, fill_threshold=0.35):
+    """How to draw points inside a ring, decided once from how much of its bbox it fills
+    
+    Well-filled rings use rejection sampling in batches sized for ~5 expected hits;
+    sparse ones are triangulated so points can be drawn directly with no PIP test.
+    """
+    x, y = poly[:, 0], poly[:, 1]
+    area = 0.5 * abs(np.dot(x[:-1], y[1:]) - np.dot(x[1:], y[:-1]))
+    fill = area / bbox_area if bbox_area > 0 else 0.0
+    plan = {'fill': fill, 'batch_size': math.ceil(5 / fill) if fill > 0 else 1}
+    
+    if fill <= fill_threshold:
+        sampler = triangle_sampler(poly)
+        if sampler is not None:
+            plan['triangles'], plan['tri_cdf'] = sampler
+    return plan
+
+class CenterGrid:
+    """Uniform grid hash over placed CFR centers for fixed-radius neighbour lookups"""
+    
+    def __init__(self, cell_deg=0.15):
+        self.cell_deg = cell_deg
+        self.cells = {}
+        self.count = 0
+    
+    def _cell(self, lat, lon):
+        return math.floor(lat / self.cell_deg), math.floor(lon / self.cell_deg)
+    
+    def insert(self, lat, lon):
+        self.cells.setdefault(self._cell(lat, lon), []).append((lat, lon))
+        self.count += 1
+    
+    def neighbors(self, lat, lon, radius):
+        """Yield stored centers from every cell that could lie within radius of (lat, lon)"""
+        reach = math.ceil(radius / self.cell_deg)
+        ci, cj = self._cell(lat, lon)
+        for di in range(-reach, reach + 1):
+            for dj in range(-reach, reach + 1):
+                yield from self.cells.get((ci + di, cj + dj), ())
 
 class TelanganaFRAGenerator:
-    def __init__(self):
+    def __init__(self, seed=None, load_forest=True):
         # Load existing Telangana land-use data to get forest areas
         self.landuse_file = 'output/telangana_landuse_dummy.geojson'
         self.forest_areas = []
-        self.load_forest_boundaries()
+        self.forest_tree = None
+        if load_forest:
+            self.load_forest_boundaries()
+        
+        # Grid over placed CFR centers, kept in sync with the caller's used_cfr_areas list
+        self.cfr_index = CenterGrid()
+        self.cfr_centers = np.empty((0, 2))
+        self._indexed_cfrs = None
         
         # Telangana forest districts (areas with significant forest cover)
         self.forest_districts = ['Adilabad', 'Kumuram Bheem', 'Mancherial', 'Nirmal', 'Khammam', 'Warangal']
@@ -27,6 +131,11 @@ class TelanganaFRAGenerator:
         # Village patterns for Telangana
         self.village_patterns = ['palli', 'guda', 'nagar', 'puram']
         
+        self.rng = np.random.default_rng(seed)
+        
+        # Vertex angles for every irregular-polygon vertex count
+        self._angle_cache = {k: np.linspace(0, 2 * np.pi, k, endpoint=False) for k in range(6, 11)}
+        
     def load_forest_boundaries(self):
         """Load Tree cover areas from Telangana land-use data as forest boundaries"""
         if not os.path.exists(self.landuse_file):
@@ -34,14 +143,29 @@ class TelanganaFRAGenerator:
             return
             
         try:
-            with open(self.landuse_file, 'r') as f:
-                landuse_data = json.load(f)
-            
-            # Extract Tree cover polygons and sort by area (largest first)
-            for feature in landuse_data['features']:
-                if feature['properties'].get('landuse_type') == 'Tree cover':
+            with open(self.landuse_file, 'rb') as f:
+                # Stream features when ijson is available so only Tree cover polygons are kept
+                if ijson is not None:
+                    features = ijson.items(f, 'features.item', use_float=True)
+                else:
+                    features = json.load(f)['features']
+                
+                # Extract Tree cover polygons and sort by area (largest first)
+                for feature in features:
+                    if feature['properties'].get('landuse_type') != 'Tree cover':
+                        continue
+                    coords = feature['geometry']['coordinates'][0]
+                    # Contiguous vertex buffer for the edge arrays and triangulation
+                    coords_np = np.ascontiguousarray(coords, dtype=np.float64)
+                    min_lon, min_lat = coords_np.min(axis=0).tolist()
+                    max_lon, max_lat = coords_np.max(axis=0).tolist()
                     self.forest_areas.append({
-                        'coordinates': feature['geometry']['coordinates'][0],
+                        'coordinates': coords,
+                        'coords_np': coords_np,
+                        'edges': _edges(coords_np),
+                        'bbox': (min_lon, min_lat, max_lon, max_lat),
+                        'bbox_area': (max_lon - min_lon) * (max_lat - min_lat),
+                        **_sampling_plan(coords_np, (max_lon - min_lon) * (max_lat - min_lat)),
                         'district': feature['properties'].get('district', 'Unknown'),
                         'area_km2': feature['properties'].get('area_km2', 0)
                     })
@@ -49,68 +173,98 @@ class TelanganaFRAGenerator:
             # Sort forest areas by size (largest first) for better distribution
             self.forest_areas.sort(key=lambda x: x['area_km2'], reverse=True)
             
+            if self.forest_areas:
+                bboxes = np.array([fa['bbox'] for fa in self.forest_areas])
+                
+                # (lat, lon) bbox centers and half-diagonals for early rejection
+                self.forest_centroids = (bboxes[:, [1, 0]] + bboxes[:, [3, 2]]) / 2
+                self.forest_radii = np.hypot(bboxes[:, 2] - bboxes[:, 0], bboxes[:, 3] - bboxes[:, 1]) / 2
+                
+                # Area-proportional sampling weights (bbox area when area_km2 is missing),
+                # floored so every area keeps a nonzero chance of being drawn
+                weights = np.array([fa['area_km2'] or fa['bbox_area'] for fa in self.forest_areas], dtype=np.float64)
+                weights = np.maximum(weights, weights.max() * 1e-6 if weights.max() > 0 else 1.0)
+                self.forest_weights = weights / weights.sum()
+                self.forest_rejections = np.zeros(len(self.forest_areas), dtype=np.int64)
+                
+                # STR-tree over forest-area bounding boxes for CFR separation queries
+                if shapely is not None:
+                    self.forest_tree = shapely.STRtree(shapely.box(*bboxes.T))
+            
             print(f"✅ Loaded {len(self.forest_areas)} forest areas for FRA placement")
             
         except Exception as e:
             print(f"Error loading forest boundaries: {e}")
     
     def point_in_polygon(self, point, polygon_coords):
-        """Check if a point is inside a polygon using ray casting algorithm"""
-        x, y = point
-        n = len(polygon_coords)
-        inside = False
-        
-        p1x, p1y = polygon_coords[0]
-        for i in range(1, n + 1):
-            p2x, p2y = polygon_coords[i % n]
-            if y > min(p1y, p2y):
-                if y <= max(p1y, p2y):
-                    if x <= max(p1x, p2x):
-                        if p1y != p2y:
-                            xinters = (y - p1y) * (p2x - p1x) / (p2y - p1y) + p1x
-                        if p1x == p2x or x <= xinters:
-                            inside = not inside
-            p1x, p1y = p2x, p2y
-        
-        return inside
+        """Check if a [lon, lat] point is inside a closed polygon ring"""
+        edges = _edges(np.asarray(polygon_coords, dtype=np.float64))
+        return bool(_pip_batch_precomp(np.array([point[0]], dtype=np.float64),
+                                       np.array([point[1]], dtype=np.float64), edges)[0])
     
     def calculate_distance(self, point1, point2):
         """Calculate distance between two lat/lon points in degrees"""
         return math.sqrt((point1[0] - point2[0])**2 + (point1[1] - point2[1])**2)
     
+    def sample_point_in_polygon(self, polygon, bbox, max_attempts):
+        """Draw one (lon, lat) point inside a polygon dict following its sampling plan
+        
+        Triangulated polygons are sampled directly by area. Otherwise candidates are
+        drawn in batches of the polygon's batch_size until one lands inside or
+        max_attempts candidates are spent, in which case None is returned.
+        """
+        if 'tri_cdf' in polygon:
+            tri = min(int(np.searchsorted(polygon['tri_cdf'], self.rng.random())), len(polygon['tri_cdf']) - 1)
+            a, b, c = polygon['triangles'][tri]
+            sqrt_r1, r2 = math.sqrt(self.rng.random()), self.rng.random()
+            point = (1 - sqrt_r1) * a + sqrt_r1 * (1 - r2) * b + sqrt_r1 * r2 * c
+            return float(point[0]), float(point[1])
+        
+        min_lon, min_lat, max_lon, max_lat = bbox
+        batch_size = min(polygon['batch_size'], max_attempts)
+        for start in range(0, max_attempts, batch_size):
+            size = min(batch_size, max_attempts - start)
+            lons = self.rng.uniform(min_lon, max_lon, size=size)
+            lats = self.rng.uniform(min_lat, max_lat, size=size)
+            mask = _pip_batch_precomp(lons, lats, polygon['edges'])
+            if mask.any():
+                first = int(np.argmax(mask))
+                return float(lons[first]), float(lats[first])
+        return None
+    
     def generate_point_inside_forest_area(self, forest_area):
         """Generate a random point inside a specific forest area"""
-        coords = forest_area['coordinates']
-        
-        # Get bounding box of the forest area
-        min_lon = min(coord[0] for coord in coords)
-        max_lon = max(coord[0] for coord in coords)
-        min_lat = min(coord[1] for coord in coords)
-        max_lat = max(coord[1] for coord in coords)
-        
-        # Generate random points until we find one inside the forest polygon
-        max_attempts = 100
-        for _ in range(max_attempts):
-            lon = random.uniform(min_lon, max_lon)
-            lat = random.uniform(min_lat, max_lat)
-            
-            if self.point_in_polygon([lon, lat], coords):
-                return lat, lon, forest_area['district']
+        # Bounding box of the forest area, cached at load time
+        min_lon, min_lat, max_lon, max_lat = forest_area['bbox']
+        
+        point = self.sample_point_in_polygon(forest_area, (min_lon, min_lat, max_lon, max_lat), max_attempts=100)
+        if point is not None:
+            return point[1], point[0], forest_area['district']
         
         # If we can't find a point inside, use center of bounding box
         center_lat = (min_lat + max_lat) / 2
         center_lon = (min_lon + max_lon) / 2
         return center_lat, center_lon, forest_area['district']
     
+    def choice(self, population):
+        """Pick one element of a short list via an integer draw from self.rng"""
+        return population[self.rng.integers(len(population))]
+    
+    def choices(self, population, k):
+        """Pick k elements (with replacement) of a short list in one draw"""
+        return [population[i] for i in self.rng.integers(len(population), size=k)]
+    
     def generate_realistic_village_name(self):
         """Generate realistic village names for Telangana"""
-        prefixes = ['Raja', 'Krishna', 'Rama', 'Sita', 'Ganga', 'Venkate', 'Lakshmi', 'Bhima', 'Koti', 'Meka']
-        suffix = random.choice(self.village_patterns)
-        prefix = random.choice(prefixes)
+        suffix = self.choice(self.village_patterns)
+        prefix = self.choice(VILLAGE_PREFIXES)
         return f"{prefix}{suffix}"
     
     def generate_small_polygon(self, center_lat, center_lon, area_hectares, shape='irregular'):
-        """Generate small realistic polygon for IFR/CFR/CR with appropriate size"""
+        """Generate small realistic polygon for IFR/CFR/CR with appropriate size
+        
+        Returns the closed ring as an (n+1, 2) float64 array of [lon, lat] rows.
+        """
         # Convert hectares to approximate degrees
         # 1 hectare ≈ 0.0001 square degrees (rough approximation)
         area_deg_sq = area_hectares * 0.0001
@@ -118,84 +272,131 @@ class TelanganaFRAGenerator:
         
         if shape == 'rectangular':
             # Rectangular plot (typical for agricultural IFR)
-            width = radius_deg * random.uniform(1.2, 2.5)
+            width = radius_deg * self.rng.uniform(1.2, 2.5)
             height = area_deg_sq / width
             
             # Add slight rotation
-            rotation = random.uniform(-math.pi/8, math.pi/8)
+            rotation = self.rng.uniform(-math.pi/8, math.pi/8)
             
-            corners = [
+            cos_r, sin_r = math.cos(rotation), math.sin(rotation)
+            
+            corners = np.array([
                 [-width/2, -height/2],
                 [width/2, -height/2],
                 [width/2, height/2],
                 [-width/2, height/2]
-            ]
+            ])
             
-            points = []
-            for corner in corners:
-                x_rot = corner[0] * math.cos(rotation) - corner[1] * math.sin(rotation)
-                y_rot = corner[0] * math.sin(rotation) + corner[1] * math.cos(rotation)
-                points.append([center_lon + x_rot, center_lat + y_rot])
+            # Rotate all corners with one matmul, then translate to the center
+            rotation_matrix = np.array([[cos_r, -sin_r], [sin_r, cos_r]])
+            points = corners @ rotation_matrix.T + (center_lon, center_lat)
             
         else:
             # Irregular polygon
-            num_points = random.randint(6, 10)
-            points = []
+            num_points = int(self.rng.integers(6, 11))
+            angles = self._angle_cache[num_points]
+            rs = radius_deg * self.rng.uniform(0.7, 1.3, num_points)
             
-            for i in range(num_points):
-                angle = 2 * math.pi * i / num_points
-                r = radius_deg * random.uniform(0.7, 1.3)
-                
-                lat = center_lat + r * math.cos(angle)
-                lon = center_lon + r * math.sin(angle)
-                points.append([lon, lat])
+            points = np.column_stack([
+                center_lon + rs * np.sin(angles),
+                center_lat + rs * np.cos(angles)
+            ])
         
-        # Close the polygon
-        points.append(points[0])
-        return points
+        # Close the polygon; the ring stays an (n+1, 2) array all the way to the writer
+        return np.vstack([points, points[:1]])
+    
+    def sync_cfr_index(self, used_cfr_areas):
+        """Insert any CFR centers placed since the last call into self.cfr_index"""
+        if used_cfr_areas is not self._indexed_cfrs or self.cfr_index.count > len(used_cfr_areas):
+            self.cfr_index = CenterGrid()
+            self.cfr_centers = np.empty((0, 2))
+            self._indexed_cfrs = used_cfr_areas
+        new_cfrs = used_cfr_areas[self.cfr_index.count:]
+        for existing_cfr in new_cfrs:
+            self.cfr_index.insert(*existing_cfr['center'])
+        if new_cfrs:
+            self.cfr_centers = np.vstack([self.cfr_centers, [cfr['center'] for cfr in new_cfrs]])
+    
+    def dominated_forest_areas(self, separation):
+        """Mask of forest areas lying wholly inside some placed CFR's exclusion disc
+        
+        Every point drawn from such an area is too close, so its attempts loop can be skipped.
+        """
+        if not len(self.cfr_centers):
+            return np.zeros(len(self.forest_areas), dtype=bool)
+        dist = np.linalg.norm(self.forest_centroids[:, None, :] - self.cfr_centers[None, :, :], axis=2)
+        return ((dist + self.forest_radii[:, None]) < separation).any(axis=1)
+    
+    def crowded_forest_areas(self, used_cfr_areas, separation):
+        """Indices of forest areas whose bounding box comes within separation of a placed CFR
+        
+        Points drawn from any other forest area cannot be too close to an existing CFR,
+        so their distance checks can be skipped.
+        """
+        if not used_cfr_areas:
+            return set()
+        if self.forest_tree is None:
+            return set(range(len(self.forest_areas)))
+        
+        centers = np.array([cfr['center'] for cfr in used_cfr_areas])
+        lats, lons = centers[:, 0], centers[:, 1]
+        exclusion = shapely.box(lons - separation, lats - separation, lons + separation, lats + separation)
+        _, hits = self.forest_tree.query(exclusion)
+        return set(hits.tolist())
+    
+    def is_too_close(self, center_lat, center_lon, separation):
+        """Check the candidate center against nearby placed CFRs only"""
+        separation_sq = separation * separation
+        for existing_lat, existing_lon in self.cfr_index.neighbors(center_lat, center_lon, separation):
+            dlat = center_lat - existing_lat
+            dlon = center_lon - existing_lon
+            if dlat * dlat + dlon * dlon < separation_sq:
+                return True
+        return False
     
     def find_suitable_cfr_location(self, used_cfr_areas, min_separation=0.15):
         """Find a suitable location for CFR that doesn't overlap with existing ones"""
         if not self.forest_areas:
             return None, None, 'Unknown'
         
-        # Try each forest area in order (largest first)
-        for forest_area in self.forest_areas:
-            max_attempts_per_area = 20
+        self.sync_cfr_index(used_cfr_areas)
+        
+        # Visit forest areas in an area-weighted random order so early CFRs don't all
+        # land in the largest polygon, skipping areas that have proven over-full
+        crowded = self.crowded_forest_areas(used_cfr_areas, min_separation)
+        dominated = self.dominated_forest_areas(min_separation)
+        order = self.rng.choice(len(self.forest_areas), size=len(self.forest_areas),
+                                replace=False, p=self.forest_weights)
+        max_attempts_per_area = 20
+        for idx in order.tolist():
+            if dominated[idx] or self.forest_rejections[idx] >= 3 * max_attempts_per_area:
+                continue
+            forest_area = self.forest_areas[idx]
             
             for attempt in range(max_attempts_per_area):
                 center_lat, center_lon, district = self.generate_point_inside_forest_area(forest_area)
                 
-                # Check distance from existing CFR areas
-                too_close = False
-                for existing_cfr in used_cfr_areas:
-                    distance = self.calculate_distance([center_lat, center_lon], existing_cfr['center'])
-                    if distance < min_separation:  # Increased minimum separation to 15km
-                        too_close = True
-                        break
-                
-                if not too_close:
+                # Check distance from existing CFR areas (increased minimum separation to 15km)
+                if idx not in crowded or not self.is_too_close(center_lat, center_lon, min_separation):
                     return center_lat, center_lon, district
+                self.forest_rejections[idx] += 1
         
         # If we can't find a well-separated location, try with reduced separation
         for separation in [0.1, 0.08, 0.05]:  # Gradually reduce separation requirements
-            for forest_area in self.forest_areas:
+            crowded = self.crowded_forest_areas(used_cfr_areas, separation)
+            dominated = self.dominated_forest_areas(separation)
+            for idx, forest_area in enumerate(self.forest_areas):
+                if dominated[idx]:
+                    continue
                 for attempt in range(10):
                     center_lat, center_lon, district = self.generate_point_inside_forest_area(forest_area)
                     
-                    too_close = False
-                    for existing_cfr in used_cfr_areas:
-                        distance = self.calculate_distance([center_lat, center_lon], existing_cfr['center'])
-                        if distance < separation:
-                            too_close = True
-                            break
-                    
-                    if not too_close:
+                    if idx not in crowded or not self.is_too_close(center_lat, center_lon, separation):
                         return center_lat, center_lon, district
         
         # Last resort - use any available forest area
         if self.forest_areas:
-            return self.generate_point_inside_forest_area(random.choice(self.forest_areas))
+            return self.generate_point_inside_forest_area(self.choice(self.forest_areas))
         
         return None, None, 'Unknown'
     
@@ -211,7 +412,7 @@ class TelanganaFRAGenerator:
             return None
         
         # CFR should be substantial enough to contain multiple IFR plots - 150-400 hectares
-        area_hectares = random.uniform(150, 400)
+        area_hectares = self.rng.uniform(150, 400)
         
         polygon_coords = self.generate_small_polygon(
             center_lat, center_lon, area_hectares, 'irregular'
@@ -222,31 +423,37 @@ class TelanganaFRAGenerator:
             'center': [center_lat, center_lon],
             'area_hectares': area_hectares,
             'district': district,
+            'coords_np': polygon_coords,
             'bounds': {
-                'min_lat': min(coord[1] for coord in polygon_coords),
-                'max_lat': max(coord[1] for coord in polygon_coords),
-                'min_lon': min(coord[0] for coord in polygon_coords),
-                'max_lon': max(coord[0] for coord in polygon_coords)
+                'min_lat': float(polygon_coords[:, 1].min()),
+                'max_lat': float(polygon_coords[:, 1].max()),
+                'min_lon': float(polygon_coords[:, 0].min()),
+                'max_lon': float(polygon_coords[:, 0].max())
             }
         }
+        # Edge vectors are reused by every IFR/CR point drawn inside this CFR
+        cfr_data['edges'] = _edges(cfr_data['coords_np'])
+        bounds = cfr_data['bounds']
+        cfr_data.update(_sampling_plan(
+            cfr_data['coords_np'],
+            (bounds['max_lon'] - bounds['min_lon']) * (bounds['max_lat'] - bounds['min_lat'])
+        ))
         
         return cfr_data
     
     def point_inside_cfr(self, point, cfr_data):
         """Check if a point is inside the CFR polygon"""
-        return self.point_in_polygon(point, cfr_data['coordinates'][0])
+        return bool(_pip_batch_precomp(np.array([point[0]], dtype=np.float64),
+                                       np.array([point[1]], dtype=np.float64), cfr_data['edges'])[0])
     
     def generate_point_inside_cfr(self, cfr_data):
         """Generate a random point inside the CFR polygon"""
         bounds = cfr_data['bounds']
-        max_attempts = 150
+        bbox = (bounds['min_lon'], bounds['min_lat'], bounds['max_lon'], bounds['max_lat'])
         
-        for _ in range(max_attempts):
-            lon = random.uniform(bounds['min_lon'], bounds['max_lon'])
-            lat = random.uniform(bounds['min_lat'], bounds['max_lat'])
-            
-            if self.point_inside_cfr([lon, lat], cfr_data):
-                return lat, lon
+        point = self.sample_point_in_polygon(cfr_data, bbox, max_attempts=150)
+        if point is not None:
+            return point[1], point[0]
         
         # Fallback to CFR center
         return cfr_data['center'][0], cfr_data['center'][1]
@@ -256,46 +463,45 @@ class TelanganaFRAGenerator:
         ifr_features = []
         district = cfr_data['district']
         
+        # Draw every per-IFR random field up front, one call per field
+        # IFR should be very small - individual household land (0.1 to 1.2 hectares)
+        areas = self.rng.uniform(0.1, 1.2, num_ifrs).tolist()
+        household_heads = self.choices(HOUSEHOLD_HEADS, num_ifrs)
+        statuses = self.choices(CLAIM_STATUSES, num_ifrs)
+        family_members = self.rng.integers(3, 9, num_ifrs).tolist()
+        livelihoods = self.choices(LIVELIHOODS, num_ifrs)
+        submission_days = self.rng.integers(30, 731, num_ifrs).tolist()
+        survey_numbers = self.rng.integers(100, 1000, num_ifrs).tolist()
+        pattas_issued = self.choices(YES_NO, num_ifrs)
+        cultivation_types = self.choices(CULTIVATION_TYPES, num_ifrs)
+        
         for i in range(num_ifrs):
             # Generate point inside CFR
             center_lat, center_lon = self.generate_point_inside_cfr(cfr_data)
-            
-            # IFR should be very small - individual household land (0.1 to 1.2 hectares)
-            area_hectares = random.uniform(0.1, 1.2)
+            area_hectares = areas[i]
             
             # Generate small rectangular plot (typical for individual holdings)
             polygon_coords = self.generate_small_polygon(
                 center_lat, center_lon, area_hectares, 'rectangular'
             )
             
-            # Generate household head name
-            household_heads = [
-                'Ramesh Kumar', 'Sita Devi', 'Lakshman Singh', 'Ganga Bai', 
-                'Ravi Rao', 'Kamala Devi', 'Suresh Kumar', 'Radha Bai',
-                'Gopal Singh', 'Anita Devi', 'Kiran Kumar', 'Pushpa Bai'
-            ]
-            household_head = random.choice(household_heads)
-            
             ifr_feature = {
                 'type': 'Feature',
                 'properties': {
+                    **IFR_BASE,
                     'claim_id': f'IFR_TG_{district[:3].upper()}_{i+1:03d}',
-                    'claim_type': 'IFR',
-                    'fra_type': 'Individual Forest Rights',
                     'village': village_name,
                     'district': district,
-                    'state': 'Telangana',
                     'area_claimed': round(area_hectares, 2),
-                    'area_unit': 'hectares',
-                    'status': random.choice(['Approved', 'Pending', 'Under Review']),
+                    'status': statuses[i],
                     'tribal_community': tribal_community,
-                    'household_head': household_head,
-                    'family_members': random.randint(3, 8),
-                    'livelihood': random.choice(['Agriculture', 'NTFP Collection', 'Animal Husbandry', 'Mixed']),
-                    'submission_date': (datetime.now() - timedelta(days=random.randint(30, 730))).strftime('%Y-%m-%d'),
-                    'survey_number': f'SY_{random.randint(100, 999)}',
-                    'patta_issued': random.choice([True, False]),
-                    'cultivation_type': random.choice(['Paddy', 'Cotton', 'Maize', 'Vegetables', 'Mixed Crops'])
+                    'household_head': household_heads[i],
+                    'family_members': family_members[i],
+                    'livelihood': livelihoods[i],
+                    'submission_date': (datetime.now() - timedelta(days=submission_days[i])).strftime('%Y-%m-%d'),
+                    'survey_number': f'SY_{survey_numbers[i]}',
+                    'patta_issued': pattas_issued[i],
+                    'cultivation_type': cultivation_types[i]
                 },
                 'geometry': {
                     'type': 'Polygon',
@@ -312,16 +518,21 @@ class TelanganaFRAGenerator:
         cr_features = []
         district = cfr_data['district']
         
-        cr_types = ['Grazing Ground', 'NTFP Collection Area', 'Sacred Grove', 'Community Water Source']
+        # Draw every per-CR random field up front, one call per field
+        resource_types = self.choices(CR_TYPES, num_crs)
+        # All CR features as polygons - small to medium areas (1-12 hectares)
+        areas = self.rng.uniform(1.0, 12.0, num_crs).tolist()
+        statuses = self.choices(CR_STATUSES, num_crs)
+        beneficiaries = self.rng.integers(20, 81, num_crs).tolist()
+        usage_patterns = self.choices(USAGE_PATTERNS, num_crs)
+        traditional_uses = self.choices(YES_NO, num_crs)
         
         for i in range(num_crs):
-            cr_type = random.choice(cr_types)
+            cr_type = resource_types[i]
             
             # Generate point inside CFR
             center_lat, center_lon = self.generate_point_inside_cfr(cfr_data)
-            
-            # All CR features as polygons - small to medium areas (1-12 hectares)
-            area_hectares = random.uniform(1.0, 12.0)
+            area_hectares = areas[i]
             
             polygon_coords = self.generate_small_polygon(
                 center_lat, center_lon, area_hectares, 'irregular'
@@ -330,21 +541,17 @@ class TelanganaFRAGenerator:
             cr_feature = {
                 'type': 'Feature',
                 'properties': {
+                    **CR_BASE,
                     'claim_id': f'CR_TG_{district[:3].upper()}_{i+1:03d}',
-                    'claim_type': 'CR',
-                    'fra_type': 'Community Rights',
                     'resource_type': cr_type,
                     'village': village_name,
                     'district': district,
-                    'state': 'Telangana',
                     'area_claimed': round(area_hectares, 2),
-                    'area_unit': 'hectares',
-                    'status': random.choice(['Approved', 'Pending']),
+                    'status': statuses[i],
                     'tribal_community': tribal_community,
-                    'beneficiary_households': random.randint(20, 80),
-                    'usage_pattern': random.choice(['Seasonal', 'Year-round', 'Occasional']),
-                    'traditional_use': random.choice([True, False]),
-                    'community_management': True
+                    'beneficiary_households': beneficiaries[i],
+                    'usage_pattern': usage_patterns[i],
+                    'traditional_use': traditional_uses[i]
                 },
                 'geometry': {
                     'type': 'Polygon',
@@ -356,10 +563,17 @@ class TelanganaFRAGenerator:
         
         return cr_features
     
-    def generate_telangana_fra_data(self, num_villages=8):
-        """Generate complete FRA data for Telangana restricted to forest areas"""
+    def generate_telangana_fra_data(self, num_villages=8, workers=1):
+        """Generate complete FRA data for Telangana restricted to forest areas
+        
+        CFRs are placed serially since each one must keep its distance from the
+        previous ones; the IFRs and CRs inside each CFR are then filled in as one
+        seeded task per village, spread over a process pool when workers > 1.
+        """
         all_features = []
         used_cfr_areas = []
+        cfr_features = []
+        village_tasks = []
         
         if not self.forest_areas:
             print("⚠️ No forest areas found. Cannot generate forest-restricted FRA data.")
@@ -371,7 +585,7 @@ class TelanganaFRAGenerator:
         villages_created = 0
         for village_idx in range(num_villages):
             village_name = self.generate_realistic_village_name()
-            tribal_community = random.choice(self.tribal_communities)
+            tribal_community = self.choice(self.tribal_communities)
             
             # Generate CFR polygon within forest areas (well-separated)
             cfr_data = self.generate_cfr_polygon(used_cfr_areas)
@@ -389,24 +603,21 @@ class TelanganaFRAGenerator:
             cfr_feature = {
                 'type': 'Feature',
                 'properties': {
+                    **CFR_BASE,
                     'claim_id': f'CFR_TG_{district[:3].upper()}_{villages_created:03d}',
-                    'claim_type': 'CFR',
-                    'fra_type': 'Community Forest Resource Rights',
                     'village': village_name,
                     'district': district,
-                    'state': 'Telangana',
                     'area_claimed': round(cfr_data['area_hectares'], 2),
-                    'area_unit': 'hectares',
-                    'status': random.choice(['Approved', 'Pending', 'Under Review']),
+                    'status': self.choice(CLAIM_STATUSES),
                     'tribal_community': tribal_community,
                     'gram_sabha': f'{village_name} Gram Sabha',
-                    'total_households': random.randint(40, 120),
-                    'forest_committee_formed': random.choice([True, False]),
-                    'management_plan': random.choice(['Prepared', 'Under Preparation', 'Not Started']),
-                    'submission_date': (datetime.now() - timedelta(days=random.randint(60, 900))).strftime('%Y-%m-%d'),
-                    'forest_type': random.choice(['Dry Deciduous', 'Moist Deciduous', 'Scrub Forest']),
-                    'biodiversity_assessment': random.choice(['High', 'Medium', 'Low']),
-                    'ntfp_potential': random.choice(['High', 'Medium', 'Low'])
+                    'total_households': int(self.rng.integers(40, 121)),
+                    'forest_committee_formed': self.choice(YES_NO),
+                    'management_plan': self.choice(MANAGEMENT_PLANS),
+                    'submission_date': (datetime.now() - timedelta(days=int(self.rng.integers(60, 901)))).strftime('%Y-%m-%d'),
+                    'forest_type': self.choice(FOREST_TYPES),
+                    'biodiversity_assessment': self.choice(RATINGS),
+                    'ntfp_potential': self.choice(RATINGS)
                 },
                 'geometry': {
                     'type': 'Polygon',
@@ -414,21 +625,22 @@ class TelanganaFRAGenerator:
                 }
             }
             
+            cfr_features.append(cfr_feature)
+            village_tasks.append((
+                int(self.rng.integers(2**32)), cfr_data, village_name, tribal_community,
+                int(self.rng.integers(15, 26)),  # IFRs inside this CFR
+                int(self.rng.integers(2, 5))     # CRs inside this CFR
+            ))
+        
+        # Generate IFR and CR features inside each CFR, keeping village order
+        if workers > 1 and len(village_tasks) > 1:
+            with ProcessPoolExecutor(max_workers=min(len(village_tasks), workers, os.cpu_count() or 1)) as executor:
+                village_features = list(executor.map(_build_village_features, *zip(*village_tasks)))
+        else:
+            village_features = starmap(_build_village_features, village_tasks)
+        for cfr_feature, features in zip(cfr_features, village_features):
             all_features.append(cfr_feature)
-            
-            # Generate IFR features inside CFR
-            ifr_features = self.generate_ifr_polygons(
-                cfr_data, village_name, tribal_community, 
-                num_ifrs=random.randint(15, 25)
-            )
-            all_features.extend(ifr_features)
-            
-            # Generate CR features inside CFR
-            cr_features = self.generate_cr_features(
-                cfr_data, village_name, tribal_community, 
-                num_crs=random.randint(2, 4)
-            )
-            all_features.extend(cr_features)
+            all_features.extend(features)
         
         # Create GeoJSON structure
         fra_geojson = {
@@ -451,12 +663,31 @@ class TelanganaFRAGenerator:
         
         return fra_geojson
 
+def _build_village_features(seed, cfr_data, village_name, tribal_community, num_ifrs, num_crs):
+    """Worker entry point: IFR and CR features for one already-placed CFR"""
+    generator = TelanganaFRAGenerator(seed, load_forest=False)
+    ifr_features = generator.generate_ifr_polygons(cfr_data, village_name, tribal_community, num_ifrs=num_ifrs)
+    cr_features = generator.generate_cr_features(cfr_data, village_name, tribal_community, num_crs=num_crs)
+    return ifr_features + cr_features
+
+def _ndarray_to_list(obj):
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
 def main():
     """Generate Telangana FRA data with proper CFR separation"""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--seed', type=int, default=None,
+                        help='Seed for the random generator (default: nondeterministic)')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='Worker processes for filling in villages (default: 1, serial)')
+    args = parser.parse_args()
+    
     print("🌳 Generating Telangana FRA Data (Non-Overlapping & Well-Distributed CFRs)...")
     print("=" * 75)
     
-    generator = TelanganaFRAGenerator()
+    generator = TelanganaFRAGenerator(args.seed)
     
     if not generator.forest_areas:
         print("❌ Cannot proceed without forest boundary data.")
@@ -464,7 +695,7 @@ def main():
         return
     
     # Generate FRA data
-    fra_data = generator.generate_telangana_fra_data(num_villages=8)
+    fra_data = generator.generate_telangana_fra_data(num_villages=8, workers=args.workers)
     
     if fra_data is None:
         print("❌ Failed to generate FRA data.")
@@ -474,8 +705,12 @@ def main():
     os.makedirs('output', exist_ok=True)
     output_file = 'output/telangana_fra_forest_constrained.geojson'
     
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(fra_data, f, indent=2, ensure_ascii=False)
+    if orjson is not None:
+        with open(output_file, 'wb') as f:
+            f.write(orjson.dumps(fra_data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+    else:
+        with open(output_file, 'w', encoding='utf-8') as f:
+            json.dump(fra_data, f, indent=2, ensure_ascii=False, default=_ndarray_to_list)
     
     print(f"\n✅ Telangana FRA data generated successfully!")
     print(f"📁 Output file: {output_file}")
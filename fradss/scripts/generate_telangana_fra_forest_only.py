@@ -4,18 +4,145 @@ Generate Telangana FRA data (IFR, CFR, CR) STRICTLY within forest areas only
 Uses precise forest boundary checking from land-use data
 """
 
+import argparse
 import json
-import random
 import math
+import numpy as np
 from datetime import datetime, timedelta
 import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import starmap
+
+from fra_common import CFR_BASE, CR_BASE, IFR_BASE, jit, njit, triangle_sampler
+
+try:
+    import orjson  # type: ignore
+except Exception:
+    orjson = None
+
+@jit
+def _pip(px, py, poly):
+    """Ray-casting point-in-polygon test against an (n, 2) float64 vertex array"""
+    n = poly.shape[0]
+    inside = False
+    
+    j = n - 1
+    for i in range(n):
+        xi = poly[i, 0]
+        yi = poly[i, 1]
+        xj = poly[j, 0]
+        yj = poly[j, 1]
+        if (yi > py) != (yj > py):
+            if px < (xj - xi) * (py - yi) / (yj - yi) + xi:
+                inside = not inside
+        j = i
+    
+    return inside
+
+def _pip_batch(pts_xy, poly_xy):
+    """Vectorized ray cast: boolean mask of which (m, 2) points lie inside the (n, 2) ring"""
+    x = pts_xy[:, 0:1]
+    y = pts_xy[:, 1:2]
+    xi = poly_xy[:, 0]
+    yi = poly_xy[:, 1]
+    xj = np.roll(xi, 1)
+    yj = np.roll(yi, 1)
+    
+    # Horizontal edges never straddle y, so their inf/nan intercepts are masked out
+    straddles = (yi > y) != (yj > y)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        x_cross = (xj - xi) * (y - yi) / (yj - yi) + xi
+    return np.logical_xor.reduce(straddles & (x < x_cross), axis=1)
+
+def _bbox_mask(pts_xy, bbox):
+    """Boolean mask of which (m, 2) points fall inside a (minx, miny, maxx, maxy) box"""
+    x = pts_xy[:, 0]
+    y = pts_xy[:, 1]
+    return (x >= bbox[0]) & (y >= bbox[1]) & (x <= bbox[2]) & (y <= bbox[3])
+
+@jit
+def _pip_bbox(px, py, poly, bbox):
+    """Ray cast guarded by a (minx, miny, maxx, maxy) reject test that skips the edge walk"""
+    if px < bbox[0] or py < bbox[1] or px > bbox[2] or py > bbox[3]:
+        return False
+    return _pip(px, py, poly)
+
+def _pip_batch_bbox(pts_xy, poly_xy, bbox):
+    """_pip_batch that only ray-casts the points inside the ring's bbox"""
+    mask = _bbox_mask(pts_xy, bbox)
+    hits = np.flatnonzero(mask)
+    mask[hits] = _pip_batch(pts_xy[hits], poly_xy)
+    return mask
+
+if njit is not None:
+    @jit
+    def _pip_both(pts_xy, first, first_bbox, second, second_bbox):
+        """Mask of points inside both rings; second is only ray-cast where first passed"""
+        mask = np.zeros(pts_xy.shape[0], dtype=np.bool_)
+        for k in range(pts_xy.shape[0]):
+            px = pts_xy[k, 0]
+            py = pts_xy[k, 1]
+            mask[k] = _pip_bbox(px, py, first, first_bbox) and _pip_bbox(px, py, second, second_bbox)
+        return mask
+else:
+    def _pip_both(pts_xy, first, first_bbox, second, second_bbox):
+        """Mask of points inside both rings; second is only tested on first's survivors"""
+        mask = _bbox_mask(pts_xy, first_bbox) & _bbox_mask(pts_xy, second_bbox)
+        hits = np.flatnonzero(mask)
+        hits = hits[_pip_batch(pts_xy[hits], first)]
+        mask[:] = False
+        mask[hits[_pip_batch(pts_xy[hits], second)]] = True
+        return mask
+
+def _boundary_clearance(px, py, ring):
+    """Distance from (px, py) to the nearest edge of a closed (n, 2) ring"""
+    a = ring[:-1]
+    ab = ring[1:] - a
+    ap = np.array([px, py]) - a
+    
+    # Project onto each segment, clamped to its endpoints
+    seg_len_sq = np.einsum('ij,ij->i', ab, ab)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        t = np.clip(np.einsum('ij,ij->i', ap, ab) / seg_len_sq, 0.0, 1.0)
+    t[seg_len_sq == 0] = 0.0
+    offset = ap - t[:, None] * ab
+    return float(np.sqrt(np.einsum('ij,ij->i', offset, offset).min()))
+
+def _shoelace_area(coords_np):
+    """Planar area of an (n, 2) vertex ring via the shoelace formula"""
+    x = coords_np[:, 0]
+    y = coords_np[:, 1]
+    return 0.5 * abs(x @ np.roll(y, -1) - y @ np.roll(x, -1))
 
 class ForestOnlyFRAGenerator:
-    def __init__(self):
+    SAMPLE_BATCH = 256
+    MAX_SAMPLE_BATCHES = 4
+    # Below this observed hit rate a forest is sampled from its triangulation instead
+    MIN_SUCCESS_RATE = 0.05
+    
+    def __init__(self, seed=None, load_forest=True):
+        self.rng = np.random.default_rng(seed)
+        # Reference time for every submission date and the collection's created_date
+        self.run_time = datetime.now()
+        
         # Load existing Telangana land-use data to get precise forest boundaries
         self.landuse_file = 'output/telangana_landuse_dummy.geojson'
-        self.forest_polygons = []
-        self.load_forest_polygons()
+        self.forest_cache_file = 'output/_forest_cache.npz'
+        # Forest polygons as struct-of-arrays: ring i is forest_coords[forest_offsets[i]:forest_offsets[i + 1]]
+        self.forest_coords = np.empty((0, 2), dtype=np.float64)
+        self.forest_offsets = np.zeros(1, dtype=np.int64)
+        self.forest_polygon_districts = np.empty(0, dtype=object)
+        self.forest_bboxes = np.empty((0, 4), dtype=np.float64)
+        self.forest_centroids = np.empty((0, 2), dtype=np.float64)
+        self.forest_areas = np.empty(0, dtype=np.float64)
+        
+        # Rejection-sampling statistics per forest, and lazily built triangle samplers
+        self.forest_draws = np.zeros(0, dtype=np.int64)
+        self.forest_hits = np.zeros(0, dtype=np.int64)
+        self._triangle_samplers = {}
+        
+        if load_forest:
+            self.load_forest_polygons()
         
         # Telangana forest districts
         self.forest_districts = ['Adilabad', 'Kumuram Bheem', 'Mancherial', 'Nirmal', 'Khammam', 'Warangal']
@@ -26,186 +153,317 @@ class ForestOnlyFRAGenerator:
         # Village patterns
         self.village_patterns = ['palli', 'guda', 'nagar', 'puram']
         
+        # Unit-circle (sin, cos) vertex offsets for each polygon size create_small_forest_polygon draws
+        self._unit_rings = {}
+        for n in range(6, 9):
+            angles = np.linspace(0, 2 * np.pi, n, endpoint=False)
+            self._unit_rings[n] = np.column_stack((np.sin(angles), np.cos(angles)))
+        
     def load_forest_polygons(self):
         """Load ALL Tree cover polygons as individual forest areas"""
         if not os.path.exists(self.landuse_file):
             print(f"Warning: {self.landuse_file} not found. Cannot generate forest-restricted FRA data.")
             return
             
+        # Derived arrays are reused while the land-use file is unchanged
+        cache_key = np.array([os.path.getmtime(self.landuse_file), os.path.getsize(self.landuse_file)])
+        if self.load_forest_cache(cache_key):
+            print(f"✅ Loaded {self.forest_count} individual forest polygons for FRA placement (cached)")
+            return
+        
         try:
-            with open(self.landuse_file, 'r') as f:
-                landuse_data = json.load(f)
+            if orjson is not None:
+                with open(self.landuse_file, 'rb') as f:
+                    landuse_data = orjson.loads(f.read())
+            else:
+                with open(self.landuse_file, 'r') as f:
+                    landuse_data = json.load(f)
             
             # Extract ALL Tree cover polygons individually
+            rings = []
+            districts = []
             for feature in landuse_data['features']:
                 if feature['properties'].get('landuse_type') == 'Tree cover':
                     # Each polygon is treated as a separate forest area
                     for poly_coords in feature['geometry']['coordinates']:
                         if len(poly_coords) > 0:  # Valid polygon
-                            self.forest_polygons.append({
-                                'coordinates': poly_coords,
-                                'district': feature['properties'].get('district', 'Unknown'),
-                                'area_km2': feature['properties'].get('area_km2', 0)
-                            })
+                            rings.append(np.asarray(poly_coords, dtype=np.float64))
+                            districts.append(feature['properties'].get('district', 'Unknown'))
+            
+            if rings:
+                offsets = np.zeros(len(rings) + 1, dtype=np.int64)
+                np.cumsum([len(ring) for ring in rings], out=offsets[1:])
+                
+                # Per-polygon bbox (minx, miny, maxx, maxy), vertex centroid and shoelace area
+                self.set_forest_arrays(
+                    coords=np.concatenate(rings),
+                    offsets=offsets,
+                    districts=np.array(districts, dtype=object),
+                    bboxes=np.array([np.concatenate((ring.min(axis=0), ring.max(axis=0))) for ring in rings]),
+                    centroids=np.array([ring.mean(axis=0) for ring in rings]),
+                    areas=np.array([_shoelace_area(ring) for ring in rings])
+                )
+                self.save_forest_cache(cache_key)
             
-            print(f"✅ Loaded {len(self.forest_polygons)} individual forest polygons for FRA placement")
+            print(f"✅ Loaded {self.forest_count} individual forest polygons for FRA placement")
             
         except Exception as e:
             print(f"Error loading forest boundaries: {e}")
     
+    def set_forest_arrays(self, coords, offsets, districts, bboxes, centroids, areas):
+        """Install forest polygons in struct-of-arrays form and reset per-forest sampling state"""
+        self.forest_coords = np.ascontiguousarray(coords, dtype=np.float64)
+        self.forest_offsets = offsets
+        self.forest_polygon_districts = districts
+        self.forest_bboxes = bboxes
+        self.forest_centroids = centroids
+        self.forest_areas = areas
+        self.forest_draws = np.zeros(len(areas), dtype=np.int64)
+        self.forest_hits = np.zeros(len(areas), dtype=np.int64)
+        self._triangle_samplers = {}
+    
+    def forest_subset(self, forest_id):
+        """set_forest_arrays() arguments holding only one forest, so workers are sent one ring"""
+        ring = self.forest_ring(forest_id)
+        keep = slice(forest_id, forest_id + 1)
+        return {
+            'coords': ring.copy(),
+            'offsets': np.array([0, len(ring)], dtype=np.int64),
+            'districts': self.forest_polygon_districts[keep],
+            'bboxes': self.forest_bboxes[keep],
+            'centroids': self.forest_centroids[keep],
+            'areas': self.forest_areas[keep]
+        }
+    
+    def load_forest_cache(self, cache_key):
+        """Restore the forest arrays from the .npz cache if it was built from the same file"""
+        if not os.path.exists(self.forest_cache_file):
+            return False
+        try:
+            with np.load(self.forest_cache_file) as cache:
+                if not np.array_equal(cache['key'], cache_key):
+                    return False
+                self.set_forest_arrays(
+                    coords=cache['coords'],
+                    offsets=cache['offsets'],
+                    districts=cache['districts'].astype(object),
+                    bboxes=cache['bboxes'],
+                    centroids=cache['centroids'],
+                    areas=cache['areas']
+                )
+            return True
+        except Exception as e:
+            print(f"Ignoring unreadable forest cache: {e}")
+            return False
+    
+    def save_forest_cache(self, cache_key):
+        """Persist the derived forest arrays next to the land-use output"""
+        try:
+            np.savez(
+                self.forest_cache_file,
+                key=cache_key,
+                coords=self.forest_coords,
+                offsets=self.forest_offsets,
+                districts=self.forest_polygon_districts.astype(str),
+                bboxes=self.forest_bboxes,
+                centroids=self.forest_centroids,
+                areas=self.forest_areas
+            )
+        except OSError as e:
+            print(f"Could not write forest cache: {e}")
+    
+    @property
+    def forest_count(self):
+        """Number of loaded forest polygons"""
+        return len(self.forest_areas)
+    
+    def forest_ring(self, forest_id):
+        """Contiguous (n, 2) view of one forest polygon's ring"""
+        return self.forest_coords[self.forest_offsets[forest_id]:self.forest_offsets[forest_id + 1]]
+    
     def point_in_polygon(self, point, polygon_coords):
         """Precise point-in-polygon test using ray casting"""
-        x, y = point
-        n = len(polygon_coords)
-        inside = False
-        
-        p1x, p1y = polygon_coords[0]
-        for i in range(1, n + 1):
-            p2x, p2y = polygon_coords[i % n]
-            if y > min(p1y, p2y):
-                if y <= max(p1y, p2y):
-                    if x <= max(p1x, p2x):
-                        if p1y != p2y:
-                            xinters = (y - p1y) * (p2x - p1x) / (p2y - p1y) + p1x
-                        if p1x == p2x or x <= xinters:
-                            inside = not inside
-            p1x, p1y = p2x, p2y
-        
-        return inside
+        if not isinstance(polygon_coords, np.ndarray):
+            polygon_coords = np.ascontiguousarray(polygon_coords, dtype=np.float64)
+        return _pip(float(point[0]), float(point[1]), polygon_coords)
     
     def find_largest_forest_polygons(self, min_count=8):
-        """Find the largest forest polygons suitable for CFR placement"""
-        if not self.forest_polygons:
-            return []
-        
-        # Calculate area for each polygon
-        forest_areas = []
-        for idx, forest in enumerate(self.forest_polygons):
-            coords = forest['coordinates']
-            # Simple area calculation using shoelace formula
-            area = 0.0
-            n = len(coords)
-            for i in range(n):
-                j = (i + 1) % n
-                area += coords[i][0] * coords[j][1]
-                area -= coords[j][0] * coords[i][1]
-            area = abs(area) / 2.0
-            
-            forest_areas.append({
-                'index': idx,
-                'area': area,
-                'forest': forest
-            })
+        """Ids of the largest forest polygons suitable for CFR placement, largest first"""
+        if not self.forest_count:
+            return np.empty(0, dtype=np.int64)
+        
+        # Shoelace areas are computed once at load time
+        areas = self.forest_areas
         
-        # Sort by area (largest first) and take suitable ones
-        forest_areas.sort(key=lambda x: x['area'], reverse=True)
-        return forest_areas[:max(min_count, len(forest_areas) // 3)]
+        # Partition out the largest k, then order only those (largest first)
+        k = min(max(min_count, len(areas) // 3), len(areas))
+        top = np.argpartition(areas, len(areas) - k)[len(areas) - k:]
+        return top[np.argsort(-areas[top], kind='stable')]
     
-    def generate_point_inside_specific_forest(self, forest_polygon):
+    def generate_point_inside_specific_forest(self, forest_id):
         """Generate a point inside a specific forest polygon"""
-        coords = forest_polygon['coordinates']
-        district = forest_polygon['district']
-        
-        # Get bounding box
-        min_lon = min(coord[0] for coord in coords)
-        max_lon = max(coord[0] for coord in coords)
-        min_lat = min(coord[1] for coord in coords)
-        max_lat = max(coord[1] for coord in coords)
-        
-        # Generate points until we find one inside
-        max_attempts = 200
-        for _ in range(max_attempts):
-            lon = random.uniform(min_lon, max_lon)
-            lat = random.uniform(min_lat, max_lat)
-            
-            if self.point_in_polygon([lon, lat], coords):
-                return lat, lon, district
+        coords_np = self.forest_ring(forest_id)
+        district = self.forest_polygon_districts[forest_id]
+        
+        # Forests that mostly reject bbox draws go straight to triangle sampling
+        draws = self.forest_draws[forest_id]
+        if draws and self.forest_hits[forest_id] < self.MIN_SUCCESS_RATE * draws:
+            point = self.sample_forest_triangles(forest_id)
+            if point is not None:
+                return point[1], point[0], district
+        
+        # Draw candidates in batches over the cached bbox and keep the first one inside
+        bbox = self.forest_bboxes[forest_id]
+        low = bbox[:2]
+        high = bbox[2:]
+        for _ in range(self.MAX_SAMPLE_BATCHES):
+            candidates = self.rng.uniform(low, high, size=(self.SAMPLE_BATCH, 2))
+            hits = np.flatnonzero(_pip_batch(candidates, coords_np))
+            self.forest_draws[forest_id] += self.SAMPLE_BATCH
+            self.forest_hits[forest_id] += hits.size
+            if hits.size:
+                lon, lat = candidates[hits[0]]
+                return float(lat), float(lon), district
+        
+        point = self.sample_forest_triangles(forest_id)
+        if point is not None:
+            return point[1], point[0], district
         
         # Fallback to polygon centroid
-        center_lat = sum(coord[1] for coord in coords) / len(coords)
-        center_lon = sum(coord[0] for coord in coords) / len(coords)
-        return center_lat, center_lon, district
+        center_lon, center_lat = self.forest_centroids[forest_id]
+        return float(center_lat), float(center_lon), district
+    
+    def sample_forest_triangles(self, forest_id):
+        """Uniform (lon, lat) inside a forest via its area-weighted triangulation, or None"""
+        if forest_id not in self._triangle_samplers:
+            self._triangle_samplers[forest_id] = triangle_sampler(self.forest_ring(forest_id))
+        sampler = self._triangle_samplers[forest_id]
+        if sampler is None:
+            return None
+        
+        triangles, tri_cdf = sampler
+        tri = min(int(np.searchsorted(tri_cdf, self.rng.random())), len(tri_cdf) - 1)
+        a, b, c = triangles[tri]
+        u, v = self.rng.random(2)
+        if u + v > 1:
+            u, v = 1 - u, 1 - v
+        lon, lat = a + u * (b - a) + v * (c - a)
+        return float(lon), float(lat)
+    
+    def choice(self, population):
+        """Pick one element of a short list via an integer draw from self.rng"""
+        return population[self.rng.integers(len(population))]
+    
+    def choices(self, population, k):
+        """Pick k elements (with replacement) of a short list in one draw"""
+        return [population[i] for i in self.rng.integers(len(population), size=k)]
     
     def generate_realistic_village_name(self):
         """Generate realistic village names for Telangana"""
         prefixes = ['Raja', 'Krishna', 'Rama', 'Sita', 'Ganga', 'Venkate', 'Lakshmi', 'Bhima', 'Koti', 'Meka']
-        suffix = random.choice(self.village_patterns)
-        prefix = random.choice(prefixes)
+        suffix = self.choice(self.village_patterns)
+        prefix = self.choice(prefixes)
         return f"{prefix}{suffix}"
     
-    def create_small_forest_polygon(self, center_lat, center_lon, area_hectares, forest_boundary):
-        """Create a small polygon constrained within forest boundary"""
+    def create_small_forest_polygon(self, center_lat, center_lon, area_hectares, forest_boundary, forest_bbox,
+                                    clearance=0.0):
+        """Create a small polygon constrained within forest boundary
+        
+        clearance is a radius (degrees) around the center known to lie inside the
+        boundary; polygons that fit within it skip the containment test.
+        """
         # Convert hectares to approximate degrees
         area_deg_sq = area_hectares * 0.0001
         radius_deg = math.sqrt(area_deg_sq / math.pi) * 0.8  # Smaller to ensure it stays inside
         
-        # Generate polygon points
-        num_points = random.randint(6, 8)
-        points = []
+        # Scale and translate the cached unit ring to get all vertices at once
+        num_points = int(self.rng.integers(6, 9))
+        unit = self._unit_rings[num_points]
+        center = np.array([center_lon, center_lat])
+        r = radius_deg * self.rng.uniform(0.7, 1.0, num_points)
         
-        for i in range(num_points):
-            angle = 2 * math.pi * i / num_points
-            r = radius_deg * random.uniform(0.7, 1.0)
-            
-            lat = center_lat + r * math.cos(angle)
-            lon = center_lon + r * math.sin(angle)
-            
-            # Ensure the point is inside forest boundary
-            if self.point_in_polygon([lon, lat], forest_boundary):
-                points.append([lon, lat])
-            else:
-                # If outside, move towards center
-                lat = center_lat + r * 0.5 * math.cos(angle)
-                lon = center_lon + r * 0.5 * math.sin(angle)
-                points.append([lon, lat])
+        ring = np.empty((num_points + 1, 2))
+        ring[:-1] = center + unit * r[:, None]
+        
+        # Vertices outside the forest boundary are moved halfway towards the center
+        if r.max() < clearance:
+            outside = np.zeros(num_points, dtype=bool)
+        else:
+            outside = ~_pip_batch_bbox(ring[:-1], forest_boundary, forest_bbox)
+        if outside.any():
+            ring[:-1][outside] = center + unit[outside] * (0.5 * r[outside, None])
         
         # Close the polygon
-        points.append(points[0])
-        return points
+        ring[-1] = ring[0]
+        return ring
     
-    def generate_cfr_in_forest(self, forest_area_info, village_idx):
+    def generate_cfr_in_forest(self, forest_id, village_idx):
         """Generate a CFR polygon within a specific large forest area"""
-        forest = forest_area_info['forest']
+        forest_ring = self.forest_ring(forest_id)
         
         # Generate center point inside this forest
-        center_lat, center_lon, district = self.generate_point_inside_specific_forest(forest)
+        center_lat, center_lon, district = self.generate_point_inside_specific_forest(forest_id)
         
         # CFR should be substantial - 200-500 hectares
-        area_hectares = random.uniform(200, 500)
+        area_hectares = float(self.rng.uniform(200, 500))
+        
+        # Disk around the center that is free of forest edges (none if the center fell outside)
+        clearance = 0.0
+        if _pip(center_lon, center_lat, forest_ring):
+            clearance = _boundary_clearance(center_lon, center_lat, forest_ring)
         
-        polygon_coords = self.create_small_forest_polygon(
-            center_lat, center_lon, area_hectares, forest['coordinates']
+        cfr_np = self.create_small_forest_polygon(
+            center_lat, center_lon, area_hectares, forest_ring, self.forest_bboxes[forest_id], clearance
         )
         
+        min_lon, min_lat = cfr_np.min(axis=0)
+        max_lon, max_lat = cfr_np.max(axis=0)
+        
         cfr_data = {
-            'coordinates': [polygon_coords],
+            'coordinates': [cfr_np],
+            'coords_np': cfr_np,
+            'bbox': np.array([min_lon, min_lat, max_lon, max_lat]),
             'center': [center_lat, center_lon],
+            'center_clearance_deg': clearance,
             'area_hectares': area_hectares,
             'district': district,
-            'forest_boundary': forest['coordinates'],
+            'forest_boundary': forest_ring,
+            'forest_bbox': self.forest_bboxes[forest_id],
             'bounds': {
-                'min_lat': min(coord[1] for coord in polygon_coords),
-                'max_lat': max(coord[1] for coord in polygon_coords),
-                'min_lon': min(coord[0] for coord in polygon_coords),
-                'max_lon': max(coord[0] for coord in polygon_coords)
+                'min_lat': min_lat,
+                'max_lat': max_lat,
+                'min_lon': min_lon,
+                'max_lon': max_lon
             }
         }
         
         return cfr_data
     
+    def clearance_from_cfr_center(self, cfr_data, lat, lon):
+        """Lower bound on a point's distance to the forest boundary, from the CFR center's clearance"""
+        center_lat, center_lon = cfr_data['center']
+        return max(0.0, cfr_data['center_clearance_deg'] - math.hypot(lat - center_lat, lon - center_lon))
+    
     def generate_point_inside_cfr(self, cfr_data):
         """Generate a random point inside the CFR polygon"""
         bounds = cfr_data['bounds']
-        max_attempts = 200
+        low = (bounds['min_lon'], bounds['min_lat'])
+        high = (bounds['max_lon'], bounds['max_lat'])
+        
+        # Ray-cast the ring with fewer edges first so the other is skipped more often
+        rings = (cfr_data['coords_np'], cfr_data['bbox'], cfr_data['forest_boundary'], cfr_data['forest_bbox'])
+        if len(rings[2]) < len(rings[0]):
+            rings = rings[2:] + rings[:2]
         
-        for _ in range(max_attempts):
-            lon = random.uniform(bounds['min_lon'], bounds['max_lon'])
-            lat = random.uniform(bounds['min_lat'], bounds['max_lat'])
+        for _ in range(self.MAX_SAMPLE_BATCHES):
+            candidates = self.rng.uniform(low, high, size=(self.SAMPLE_BATCH, 2))
             
-            # Check if point is inside both CFR and original forest boundary
-            if (self.point_in_polygon([lon, lat], cfr_data['coordinates'][0]) and
-                self.point_in_polygon([lon, lat], cfr_data['forest_boundary'])):
-                return lat, lon
+            # One fused pass against both the CFR and the original forest
+            # boundary, each guarded by its bbox reject test
+            hits = np.flatnonzero(_pip_both(candidates, *rings))
+            if hits.size:
+                lon, lat = candidates[hits[0]]
+                return float(lat), float(lon)
         
         # Fallback to CFR center
         return cfr_data['center'][0], cfr_data['center'][1]
@@ -214,47 +472,54 @@ class ForestOnlyFRAGenerator:
         """Generate IFR polygons inside CFR and forest boundary"""
         ifr_features = []
         district = cfr_data['district']
+        claim_prefix = f'IFR_TG_{district[:3].upper()}_'
+        
+        household_heads = [
+            'Ramesh Kumar', 'Sita Devi', 'Lakshman Singh', 'Ganga Bai', 
+            'Ravi Rao', 'Kamala Devi', 'Suresh Kumar', 'Radha Bai',
+            'Gopal Singh', 'Anita Devi', 'Kiran Kumar', 'Pushpa Bai'
+        ]
+        
+        # Draw every per-IFR random field up front, one call per field
+        # IFR should be small - individual household land (0.1 to 1.5 hectares)
+        areas = self.rng.uniform(0.1, 1.5, num_ifrs).tolist()
+        heads = self.choices(household_heads, num_ifrs)
+        statuses = self.choices(['Approved', 'Pending', 'Under Review'], num_ifrs)
+        family_members = self.rng.integers(3, 9, num_ifrs).tolist()
+        livelihoods = self.choices(['Agriculture', 'NTFP Collection', 'Animal Husbandry', 'Mixed'], num_ifrs)
+        submission_days = self.rng.integers(30, 731, num_ifrs).tolist()
+        survey_numbers = self.rng.integers(100, 1000, num_ifrs).tolist()
+        pattas_issued = self.choices([True, False], num_ifrs)
+        cultivation_types = self.choices(['Paddy', 'Cotton', 'Maize', 'Vegetables', 'Mixed Crops'], num_ifrs)
         
         for i in range(num_ifrs):
             # Generate point inside both CFR and forest
             center_lat, center_lon = self.generate_point_inside_cfr(cfr_data)
-            
-            # IFR should be small - individual household land (0.1 to 1.5 hectares)
-            area_hectares = random.uniform(0.1, 1.5)
+            area_hectares = areas[i]
             
             # Create small polygon constrained to forest boundary
             polygon_coords = self.create_small_forest_polygon(
-                center_lat, center_lon, area_hectares, cfr_data['forest_boundary']
+                center_lat, center_lon, area_hectares, cfr_data['forest_boundary'], cfr_data['forest_bbox'],
+                self.clearance_from_cfr_center(cfr_data, center_lat, center_lon)
             )
             
-            # Generate household head name
-            household_heads = [
-                'Ramesh Kumar', 'Sita Devi', 'Lakshman Singh', 'Ganga Bai', 
-                'Ravi Rao', 'Kamala Devi', 'Suresh Kumar', 'Radha Bai',
-                'Gopal Singh', 'Anita Devi', 'Kiran Kumar', 'Pushpa Bai'
-            ]
-            household_head = random.choice(household_heads)
-            
             ifr_feature = {
                 'type': 'Feature',
                 'properties': {
-                    'claim_id': f'IFR_TG_{district[:3].upper()}_{i+1:03d}',
-                    'claim_type': 'IFR',
-                    'fra_type': 'Individual Forest Rights',
+                    **IFR_BASE,
+                    'claim_id': f'{claim_prefix}{i+1:03d}',
                     'village': village_name,
                     'district': district,
-                    'state': 'Telangana',
                     'area_claimed': round(area_hectares, 2),
-                    'area_unit': 'hectares',
-                    'status': random.choice(['Approved', 'Pending', 'Under Review']),
+                    'status': statuses[i],
                     'tribal_community': tribal_community,
-                    'household_head': household_head,
-                    'family_members': random.randint(3, 8),
-                    'livelihood': random.choice(['Agriculture', 'NTFP Collection', 'Animal Husbandry', 'Mixed']),
-                    'submission_date': (datetime.now() - timedelta(days=random.randint(30, 730))).strftime('%Y-%m-%d'),
-                    'survey_number': f'SY_{random.randint(100, 999)}',
-                    'patta_issued': random.choice([True, False]),
-                    'cultivation_type': random.choice(['Paddy', 'Cotton', 'Maize', 'Vegetables', 'Mixed Crops'])
+                    'household_head': heads[i],
+                    'family_members': family_members[i],
+                    'livelihood': livelihoods[i],
+                    'submission_date': (self.run_time - timedelta(days=submission_days[i])).strftime('%Y-%m-%d'),
+                    'survey_number': f'SY_{survey_numbers[i]}',
+                    'patta_issued': pattas_issued[i],
+                    'cultivation_type': cultivation_types[i]
                 },
                 'geometry': {
                     'type': 'Polygon',
@@ -270,40 +535,43 @@ class ForestOnlyFRAGenerator:
         """Generate CR features inside CFR and forest boundary"""
         cr_features = []
         district = cfr_data['district']
+        claim_prefix = f'CR_TG_{district[:3].upper()}_'
         
         cr_types = ['Grazing Ground', 'NTFP Collection Area', 'Sacred Grove', 'Community Water Source']
         
+        # Per-CR random fields, drawn as batches
+        # CR features as polygons - small to medium areas (1-12 hectares)
+        resource_types = self.choices(cr_types, num_crs)
+        areas = self.rng.uniform(1.0, 12.0, num_crs).tolist()
+        statuses = self.choices(['Approved', 'Pending'], num_crs)
+        beneficiaries = self.rng.integers(20, 81, num_crs).tolist()
+        usage_patterns = self.choices(['Seasonal', 'Year-round', 'Occasional'], num_crs)
+        traditional_uses = self.choices([True, False], num_crs)
+        
         for i in range(num_crs):
-            cr_type = random.choice(cr_types)
-            
             # Generate point inside both CFR and forest
             center_lat, center_lon = self.generate_point_inside_cfr(cfr_data)
-            
-            # CR features as polygons - small to medium areas (1-12 hectares)
-            area_hectares = random.uniform(1.0, 12.0)
+            area_hectares = areas[i]
             
             polygon_coords = self.create_small_forest_polygon(
-                center_lat, center_lon, area_hectares, cfr_data['forest_boundary']
+                center_lat, center_lon, area_hectares, cfr_data['forest_boundary'], cfr_data['forest_bbox'],
+                self.clearance_from_cfr_center(cfr_data, center_lat, center_lon)
             )
             
             cr_feature = {
                 'type': 'Feature',
                 'properties': {
-                    'claim_id': f'CR_TG_{district[:3].upper()}_{i+1:03d}',
-                    'claim_type': 'CR',
-                    'fra_type': 'Community Rights',
-                    'resource_type': cr_type,
+                    **CR_BASE,
+                    'claim_id': f'{claim_prefix}{i+1:03d}',
+                    'resource_type': resource_types[i],
                     'village': village_name,
                     'district': district,
-                    'state': 'Telangana',
                     'area_claimed': round(area_hectares, 2),
-                    'area_unit': 'hectares',
-                    'status': random.choice(['Approved', 'Pending']),
+                    'status': statuses[i],
                     'tribal_community': tribal_community,
-                    'beneficiary_households': random.randint(20, 80),
-                    'usage_pattern': random.choice(['Seasonal', 'Year-round', 'Occasional']),
-                    'traditional_use': random.choice([True, False]),
-                    'community_management': True
+                    'beneficiary_households': beneficiaries[i],
+                    'usage_pattern': usage_patterns[i],
+                    'traditional_use': traditional_uses[i]
                 },
                 'geometry': {
                     'type': 'Polygon',
@@ -315,11 +583,51 @@ class ForestOnlyFRAGenerator:
         
         return cr_features
     
-    def generate_telangana_fra_forest_only(self, num_villages=6):
-        """Generate FRA data STRICTLY within forest boundaries only"""
+    def build_village(self, forest_id, village_idx, village):
+        """CFR feature plus its IFR and CR features for one village in the given forest"""
+        district = village['district']
+        village_name = village['village_name']
+        tribal_community = village['tribal_community']
+        
+        # Generate CFR polygon within specific forest area
+        cfr_data = self.generate_cfr_in_forest(forest_id, village_idx)
+        
+        cfr_feature = {
+            'type': 'Feature',
+            'properties': {
+                **CFR_BASE,
+                'claim_id': f'CFR_TG_{district[:3].upper()}_{village_idx+1:03d}',
+                'village': village_name,
+                'district': district,
+                'area_claimed': round(cfr_data['area_hectares'], 2),
+                **village['cfr_properties']
+            },
+            'geometry': {
+                'type': 'Polygon',
+                'coordinates': cfr_data['coordinates']
+            }
+        }
+        
+        # Generate IFR and CR features inside CFR and forest
+        ifr_features = self.generate_ifr_polygons(
+            cfr_data, village_name, tribal_community, 
+            num_ifrs=village['num_ifrs']
+        )
+        cr_features = self.generate_cr_features(
+            cfr_data, village_name, tribal_community, 
+            num_crs=village['num_crs']
+        )
+        return [cfr_feature] + ifr_features + cr_features
+    
+    def generate_telangana_fra_forest_only(self, num_villages=6, workers=1):
+        """Generate FRA data STRICTLY within forest boundaries only
+        
+        Villages are built serially unless workers > 1, in which case they are
+        spread over a process pool; the output is the same either way.
+        """
         all_features = []
         
-        if not self.forest_polygons:
+        if not self.forest_count:
             print("⚠️ No forest polygons found. Cannot generate forest-constrained FRA data.")
             return None
         
@@ -332,63 +640,62 @@ class ForestOnlyFRAGenerator:
         
         print(f"Generating FRA data for {num_villages} villages in largest forest areas...")
         
+        # Per-village random fields, drawn as batches
+        tribal_communities = self.choices(self.tribal_communities, num_villages)
+        statuses = self.choices(['Approved', 'Pending', 'Under Review'], num_villages)
+        total_households = self.rng.integers(50, 151, num_villages).tolist()
+        committees_formed = self.choices([True, False], num_villages)
+        management_plans = self.choices(['Prepared', 'Under Preparation', 'Not Started'], num_villages)
+        submission_days = self.rng.integers(60, 901, num_villages).tolist()
+        forest_types = self.choices(['Dry Deciduous', 'Moist Deciduous', 'Scrub Forest'], num_villages)
+        biodiversity = self.choices(['High', 'Medium', 'Low'], num_villages)
+        ntfp_potential = self.choices(['High', 'Medium', 'Low'], num_villages)
+        ifr_counts = self.rng.integers(15, 26, num_villages).tolist()
+        cr_counts = self.rng.integers(3, 6, num_villages).tolist()
+        
+        village_tasks = []
         for village_idx in range(num_villages):
-            forest_area = suitable_forests[village_idx]
+            forest_id = int(suitable_forests[village_idx])
             
-            district = forest_area['forest']['district']
+            district = self.forest_polygon_districts[forest_id]
             if district == 'Unknown':
-                district = random.choice(self.forest_districts)
+                district = self.choice(self.forest_districts)
             
             village_name = self.generate_realistic_village_name()
-            tribal_community = random.choice(self.tribal_communities)
-            
-            # Generate CFR polygon within specific forest area
-            cfr_data = self.generate_cfr_in_forest(forest_area, village_idx)
-            
-            # Create CFR feature
-            cfr_feature = {
-                'type': 'Feature',
-                'properties': {
-                    'claim_id': f'CFR_TG_{district[:3].upper()}_{village_idx+1:03d}',
-                    'claim_type': 'CFR',
-                    'fra_type': 'Community Forest Resource Rights',
-                    'village': village_name,
-                    'district': district,
-                    'state': 'Telangana',
-                    'area_claimed': round(cfr_data['area_hectares'], 2),
-                    'area_unit': 'hectares',
-                    'status': random.choice(['Approved', 'Pending', 'Under Review']),
-                    'tribal_community': tribal_community,
+            village = {
+                'district': district,
+                'village_name': village_name,
+                'tribal_community': tribal_communities[village_idx],
+                'num_ifrs': ifr_counts[village_idx],
+                'num_crs': cr_counts[village_idx],
+                'cfr_properties': {
+                    'status': statuses[village_idx],
+                    'tribal_community': tribal_communities[village_idx],
                     'gram_sabha': f'{village_name} Gram Sabha',
-                    'total_households': random.randint(50, 150),
-                    'forest_committee_formed': random.choice([True, False]),
-                    'management_plan': random.choice(['Prepared', 'Under Preparation', 'Not Started']),
-                    'submission_date': (datetime.now() - timedelta(days=random.randint(60, 900))).strftime('%Y-%m-%d'),
-                    'forest_type': random.choice(['Dry Deciduous', 'Moist Deciduous', 'Scrub Forest']),
-                    'biodiversity_assessment': random.choice(['High', 'Medium', 'Low']),
-                    'ntfp_potential': random.choice(['High', 'Medium', 'Low'])
-                },
-                'geometry': {
-                    'type': 'Polygon',
-                    'coordinates': cfr_data['coordinates']
+                    'total_households': total_households[village_idx],
+                    'forest_committee_formed': committees_formed[village_idx],
+                    'management_plan': management_plans[village_idx],
+                    'submission_date': (self.run_time - timedelta(days=submission_days[village_idx])).strftime('%Y-%m-%d'),
+                    'forest_type': forest_types[village_idx],
+                    'biodiversity_assessment': biodiversity[village_idx],
+                    'ntfp_potential': ntfp_potential[village_idx]
                 }
             }
             
-            all_features.append(cfr_feature)
-            
-            # Generate IFR features inside CFR and forest
-            ifr_features = self.generate_ifr_polygons(
-                cfr_data, village_name, tribal_community, 
-                num_ifrs=random.randint(15, 25)
-            )
-            all_features.extend(ifr_features)
-            
-            # Generate CR features inside CFR and forest
-            cr_features = self.generate_cr_features(
-                cfr_data, village_name, tribal_community, 
-                num_crs=random.randint(3, 5)
-            )
-            all_features.extend(cr_features)
+            # Each worker gets its own seed and only the one forest ring it places into
+            village_tasks.append((
+                int(self.rng.integers(2**32)), self.run_time, self.forest_subset(forest_id),
+                village_idx, village
+            ))
+        
+        # Villages are independent; a pool only pays for its startup on large runs
+        if workers > 1 and len(village_tasks) > 1:
+            with ProcessPoolExecutor(max_workers=min(len(village_tasks), workers, os.cpu_count() or 1)) as executor:
+                for features in executor.map(_build_village, *zip(*village_tasks)):
+                    all_features.extend(features)
+        else:
+            for features in starmap(_build_village, village_tasks):
+                all_features.extend(features)
         
         # Create GeoJSON structure
         fra_geojson = {
@@ -396,34 +703,53 @@ class ForestOnlyFRAGenerator:
             'properties': {
                 'title': 'Telangana Forest Rights Act Data (Strictly Forest-Constrained)',
                 'description': 'FRA claims positioned ONLY within forest boundaries',
-                'created_date': datetime.now().isoformat(),
+                'created_date': self.run_time.isoformat(),
                 'total_features': len(all_features),
                 'state': 'Telangana',
                 'spatial_reference': 'EPSG:4326 (WGS84)',
                 'data_quality': 'Forest-boundary constrained using precise polygon intersection',
                 'forest_constraint': 'ALL features positioned within Tree cover polygon boundaries',
                 'forest_polygons_used': len(suitable_forests),
-                'total_forest_areas_available': len(self.forest_polygons)
+                'total_forest_areas_available': self.forest_count
             },
             'features': all_features
         }
         
         return fra_geojson
 
+def _build_village(seed, run_time, forest, village_idx, village):
+    """Worker entry point: all features for one village, placed in a single-forest generator"""
+    generator = ForestOnlyFRAGenerator(seed, load_forest=False)
+    generator.run_time = run_time
+    generator.set_forest_arrays(**forest)
+    return generator.build_village(0, village_idx, village)
+
+def _ndarray_to_list(obj):
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
 def main():
     """Generate Telangana FRA data strictly within forest areas only"""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--seed', type=int, default=None,
+                        help='Seed for the random generator (default: nondeterministic)')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='Worker processes for village generation (default: 1, serial)')
+    args = parser.parse_args()
+    
     print("🌲 Generating Telangana FRA Data (STRICTLY Forest-Boundary Constrained)...")
     print("=" * 80)
     
-    generator = ForestOnlyFRAGenerator()
+    generator = ForestOnlyFRAGenerator(args.seed)
     
-    if not generator.forest_polygons:
+    if not generator.forest_count:
         print("❌ Cannot proceed without forest boundary data.")
         print("Please ensure 'output/telangana_landuse_dummy.geojson' exists with Tree cover polygons.")
         return
     
     # Generate FRA data
-    fra_data = generator.generate_telangana_fra_forest_only(num_villages=6)
+    fra_data = generator.generate_telangana_fra_forest_only(num_villages=6, workers=args.workers)
     
     if fra_data is None:
         print("❌ Failed to generate FRA data.")
@@ -433,8 +759,13 @@ def main():
     os.makedirs('output', exist_ok=True)
     output_file = 'output/telangana_fra_forest_only.geojson'
     
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(fra_data, f, indent=2, ensure_ascii=False)
+    # Polygon rings are still ndarrays here; orjson writes them natively
+    if orjson is not None:
+        with open(output_file, 'wb') as f:
+            f.write(orjson.dumps(fra_data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+    else:
+        with open(output_file, 'w', encoding='utf-8') as f:
+            json.dump(fra_data, f, indent=2, ensure_ascii=False, default=_ndarray_to_list)
     
     print(f"\n✅ Forest-only FRA data generated successfully!")
     print(f"📁 Output file: {output_file}")
@@ -4,13 +4,40 @@ Generate dummy Telangana land-use data mimicking ESA WorldCover categories
 for Google Earth Engine-style WebGIS interface
 """
 
+import argparse
 import json
-import random
+import math
 import numpy as np
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
-def generate_telangana_landuse_data():
-    """Generate realistic dummy land-use data for Telangana state"""
+try:
+    import orjson  # type: ignore
+except Exception:
+    orjson = None
+
+try:
+    from pyproj import Geod  # type: ignore
+    WGS84_GEOD = Geod(ellps='WGS84')
+except Exception:
+    WGS84_GEOD = None
+
+# Polygon vertex counts are drawn from 6..12, so the unit-circle cos/sin
+# tables for every possible count are built once at import
+TRIG_TABLES = {
+    k: (np.cos(a), np.sin(a))
+    for k in range(6, 13)
+    for a in [np.linspace(0, 2*np.pi, k, endpoint=False)]
+}
+
+def generate_telangana_landuse_data(rng=None):
+    """Generate realistic dummy land-use data for Telangana state
+    
+    All randomness is drawn from ``rng`` (a ``numpy.random.Generator``);
+    pass a seeded one for reproducible output.
+    """
+    if rng is None:
+        rng = np.random.default_rng()
     
     # ESA WorldCover categories with colors and realistic distribution
     landuse_categories = {
@@ -80,8 +107,10 @@ def generate_telangana_landuse_data():
         'Nalgonda': {'Cropland': 50, 'Tree cover': 25, 'Grassland': 20, 'Permanent water bodies': 5}
     }
     
-    features = []
-    feature_id = 1
+    # Polygons are generated first and their properties assembled afterwards,
+    # so area/hectares/confidence rounding runs once over whole arrays
+    polygons = []
+    raw_areas = []
     
     # Generate polygons for each district pattern
     for district, pattern in district_patterns.items():
@@ -102,9 +131,9 @@ def generate_telangana_landuse_data():
         center_lon, center_lat = district_centers.get(district, [78.9629, 17.9689])
         
         # Generate 2-3 polygons per district
-        for i in range(random.randint(2, 4)):
+        for i in range(int(rng.integers(2, 5))):
             # Select land-use type based on district pattern
-            landuse_type = np.random.choice(
+            landuse_type = rng.choice(
                 list(pattern.keys()), 
                 p=[pattern[k]/100 for k in pattern.keys()]
             )
@@ -112,37 +141,28 @@ def generate_telangana_landuse_data():
             # Generate polygon around district center with some randomness
             polygon_coords = generate_realistic_polygon(
                 center_lat, center_lon, 
-                size_km=random.uniform(5, 25),
-                irregularity=0.3
+                size_km=float(rng.uniform(5, 25)),
+                irregularity=0.3,
+                rng=rng
             )
             
-            # Calculate area (approximate)
-            area_km2 = calculate_polygon_area(polygon_coords)
-            
-            feature = {
-                "type": "Feature",
-                "properties": {
-                    "id": f"TG_LU_{feature_id:03d}",
-                    "landuse_type": landuse_type,
-                    "landuse_code": landuse_categories[landuse_type]['code'],
-                    "color": landuse_categories[landuse_type]['color'],
-                    "description": landuse_categories[landuse_type]['description'],
-                    "district": district,
-                    "area_km2": round(area_km2, 2),
-                    "area_hectares": round(area_km2 * 100, 2),
-                    "confidence": round(random.uniform(0.85, 0.98), 2),
-                    "last_updated": "2024-01-15",
-                    "data_source": "ESA WorldCover 2021 (Simulated)",
-                    "resolution": "10m"
-                },
-                "geometry": {
-                    "type": "Polygon",
-                    "coordinates": [polygon_coords]
-                }
-            }
+            polygons.append((district, landuse_type, polygon_coords))
             
-            features.append(feature)
-            feature_id += 1
+            # Calculate area (approximate)
+            raw_areas.append(calculate_polygon_area(polygon_coords))
+    
+    raw_areas = np.asarray(raw_areas, dtype=np.float64)
+    areas_km2 = np.round(raw_areas, 2)
+    areas_hectares = np.round(raw_areas * 100, 2)
+    confidences = np.round(rng.uniform(0.85, 0.98, len(polygons)), 2)
+    
+    features = [
+        build_landuse_feature(
+            idx + 1, landuse_type, landuse_categories[landuse_type], district,
+            areas_km2[idx], areas_hectares[idx], confidences[idx], polygon_coords
+        )
+        for idx, (district, landuse_type, polygon_coords) in enumerate(polygons)
+    ]
     
     # Create GeoJSON structure
     geojson_data = {
@@ -162,69 +182,128 @@ def generate_telangana_landuse_data():
     
     return geojson_data, landuse_categories
 
-def generate_realistic_polygon(center_lat, center_lon, size_km=10, irregularity=0.2):
-    """Generate a realistic polygon around a center point"""
+def build_landuse_feature(feature_id, landuse_type, category, district,
+                          area_km2, area_hectares, confidence, polygon_coords):
+    """Build one land-use Feature as a single literal with a fixed key order"""
+    return {
+        "type": "Feature",
+        "properties": {
+            "id": f"TG_LU_{feature_id:03d}",
+            "landuse_type": landuse_type,
+            "landuse_code": category['code'],
+            "color": category['color'],
+            "description": category['description'],
+            "district": district,
+            "area_km2": float(area_km2),
+            "area_hectares": float(area_hectares),
+            "confidence": float(confidence),
+            "last_updated": "2024-01-15",
+            "data_source": "ESA WorldCover 2021 (Simulated)",
+            "resolution": "10m"
+        },
+        "geometry": {
+            "type": "Polygon",
+            "coordinates": [polygon_coords]
+        }
+    }
+
+def generate_realistic_polygon(center_lat, center_lon, size_km=10, irregularity=0.2, rng=None):
+    """Generate a realistic polygon around a center point
+    
+    Returns a closed ring as an (n + 1, 2) float64 array of [lon, lat] rows.
+    """
+    
+    if rng is None:
+        rng = np.random.default_rng()
     
     # Convert km to approximate degrees (rough conversion)
     size_deg = size_km / 111.0  # 1 degree ≈ 111 km
     
     # Generate points around a circle with irregularity
-    num_points = random.randint(6, 12)
-    angles = np.linspace(0, 2*np.pi, num_points, endpoint=False)
+    # Longitude scale depends only on the centre latitude
+    inv_cos_lat = 1.0 / math.cos(math.radians(center_lat))
     
-    coords = []
-    for angle in angles:
-        # Add irregularity to radius
-        radius = size_deg * (1 + random.uniform(-irregularity, irregularity))
-        
-        # Calculate point
-        lat = center_lat + radius * np.cos(angle)
-        lon = center_lon + radius * np.sin(angle) / np.cos(np.radians(center_lat))
-        
-        coords.append([lon, lat])
+    num_points = int(rng.integers(6, 13))
+    cos_a, sin_a = TRIG_TABLES[num_points]
+    radii = size_deg * (1 + rng.uniform(-irregularity, irregularity, num_points))
+    
+    coords = np.empty((num_points + 1, 2), dtype=np.float64)
+    coords[:-1, 0] = center_lon + radii * sin_a * inv_cos_lat
+    coords[:-1, 1] = center_lat + radii * cos_a
     
     # Close the polygon
-    coords.append(coords[0])
+    coords[-1] = coords[0]
     
     return coords
 
 def calculate_polygon_area(coords):
-    """Calculate approximate area of polygon in km²"""
-    # Simple approximation using shoelace formula
-    n = len(coords) - 1  # Exclude closing point
-    area = 0.0
+    """Calculate area of polygon in km²
     
-    for i in range(n):
-        j = (i + 1) % n
-        area += coords[i][0] * coords[j][1]
-        area -= coords[j][0] * coords[i][1]
+    Uses the geodesic WGS84 area from pyproj when it is installed and falls
+    back to a latitude-corrected shoelace approximation otherwise.
+    """
+    lon = coords[:-1, 0]  # Exclude closing point
+    lat = coords[:-1, 1]
     
-    area = abs(area) / 2.0
+    if WGS84_GEOD is not None:
+        area_m2, _ = WGS84_GEOD.polygon_area_perimeter(lon, lat)
+        return abs(area_m2) / 1e6
+    
+    # Simple approximation using shoelace formula
+    area = abs(np.dot(lon, np.roll(lat, -1)) - np.dot(lat, np.roll(lon, -1))) / 2.0
     
     # Convert from degrees² to km² (rough approximation)
     # 1 degree² ≈ 12321 km² at equator, adjust for latitude
-    avg_lat = sum(coord[1] for coord in coords[:-1]) / n
-    lat_correction = np.cos(np.radians(avg_lat))
+    lat_correction = np.cos(np.radians(lat.mean()))
     area_km2 = area * 12321 * lat_correction
     
     return area_km2
 
+def encode_geojson(data):
+    """Serialize to UTF-8 JSON bytes, keeping NumPy coordinate arrays as-is for orjson"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(data, indent=2, ensure_ascii=False, default=_ndarray_to_list).encode('utf-8')
+
+def _ndarray_to_list(obj):
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+def write_bytes(path, payload):
+    """Write an already-encoded payload to disk"""
+    with open(path, 'wb') as f:
+        f.write(payload)
+
 def main():
     """Generate and save Telangana land-use data"""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--seed', type=int, default=None,
+                        help='Seed for the random generator (reproducible output)')
+    args = parser.parse_args()
+    
     print("Generating Telangana land-use data...")
     
     # Generate data
-    geojson_data, categories = generate_telangana_landuse_data()
+    rng = np.random.default_rng(args.seed)
+    geojson_data, categories = generate_telangana_landuse_data(rng)
     
-    # Save to file
     output_file = 'output/telangana_landuse_dummy.geojson'
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(geojson_data, f, indent=2, ensure_ascii=False)
-    
-    # Save categories for legend
     categories_file = 'output/telangana_landuse_categories.json'
-    with open(categories_file, 'w', encoding='utf-8') as f:
-        json.dump(categories, f, indent=2, ensure_ascii=False)
+    
+    # Encoding is CPU-bound and file writes release the GIL, so each payload
+    # is flushed on a background thread while the next one is encoded
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        # Save to file
+        payload = encode_geojson(geojson_data)
+        writes = [executor.submit(write_bytes, output_file, payload)]
+        
+        # Save categories for legend
+        writes.append(executor.submit(write_bytes, categories_file, encode_geojson(categories)))
+        
+        # Surface any I/O error from the writer threads
+        for write in writes:
+            write.result()
     
     print(f"✅ Generated {len(geojson_data['features'])} land-use polygons")
     print(f"📁 Saved to: {output_file}")
@@ -232,26 +311,21 @@ def main():
     
     # Print summary
     print("\n📈 Land-use Summary:")
-    landuse_counts = {}
-    total_area = 0
+    properties = [feature['properties'] for feature in geojson_data['features']]
+    types = np.array([p['landuse_type'] for p in properties], dtype=object)
+    areas = np.fromiter((p['area_km2'] for p in properties), dtype=np.float64, count=len(properties))
     
-    for feature in geojson_data['features']:
-        landuse = feature['properties']['landuse_type']
-        area = feature['properties']['area_km2']
-        
-        if landuse not in landuse_counts:
-            landuse_counts[landuse] = {'count': 0, 'area': 0}
-        
-        landuse_counts[landuse]['count'] += 1
-        landuse_counts[landuse]['area'] += area
-        total_area += area
+    landuse_types, inverse = np.unique(types, return_inverse=True)
+    counts = np.bincount(inverse, minlength=len(landuse_types))
+    area_sums = np.bincount(inverse, weights=areas, minlength=len(landuse_types))
+    total_area = areas.sum()
     
-    for landuse, data in landuse_counts.items():
-        percentage = (data['area'] / total_area) * 100
-        print(f"  {landuse}: {data['count']} polygons, {data['area']:.1f} km² ({percentage:.1f}%)")
+    for landuse, count, area in zip(landuse_types, counts, area_sums):
+        percentage = (area / total_area) * 100
+        print(f"  {landuse}: {count} polygons, {area:.1f} km² ({percentage:.1f}%)")
     
     print(f"\n🗺️  Total area covered: {total_area:.1f} km²")
-    print(f"💾 File size: ~{len(json.dumps(geojson_data))/1024:.1f} KB")
+    print(f"💾 File size: ~{len(payload)/1024:.1f} KB")
 
 if __name__ == "__main__":
     main()
@@ -5,13 +5,107 @@ Generates realistic GeoJSON data for Forest Rights Act (FRA) visualization
 Following proper spatial hierarchy: CFR contains IFR and CR features
 """
 
-import json
-import random
+import argparse
+import sys
 import math
-from datetime import datetime, timedelta
+import numpy as np
+from datetime import datetime
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import starmap
+from types import MappingProxyType
+
+from fra_common import GeoJSONStreamWriter
+
+def _vocab(*words):
+    """Tuple of interned strings, so every feature shares one object per category value"""
+    return tuple(sys.intern(w) for w in words)
+
+# Controlled vocabularies repeated across thousands of feature properties
+_HECTARES = sys.intern('hectares')
+_CLAIM_STATUSES = _vocab('Approved', 'Pending', 'Under Review')
+_CR_STATUSES = _CLAIM_STATUSES[:2]
+_CFR, _IFR, _CR = _vocab('CFR', 'IFR', 'CR')
+_FRA_CFR, _FRA_IFR, _FRA_CR = _vocab('Community Forest Resource Rights', 'Individual Forest Rights',
+                                     'Community Rights')
+_USAGE_PATTERNS = _vocab('Seasonal', 'Year-round', 'Occasional')
+_WATER_USAGES = _vocab('Drinking', 'Irrigation', 'Livestock', 'Multiple')
+_WATER_QUALITIES = _vocab('Good', 'Moderate', 'Poor')
+_SOIL_TYPES = _vocab('Red Soil', 'Black Soil', 'Alluvial', 'Laterite')
+_AGRICULTURE, _WATER_BODY = _vocab('Agriculture', 'Water Body')
+
+# Choice lists for the remaining feature fields
+_YES_NO = (True, False)
+_HOUSEHOLD_HEADS = _vocab('Ram Singh', 'Shyam Lal', 'Ganga Devi', 'Sita Bai',
+                          'Ravi Kumar', 'Lakshmi Devi', 'Suresh Rao', 'Kamala Bai')
+_LIVELIHOODS = _vocab('Agriculture', 'NTFP Collection', 'Animal Husbandry', 'Mixed')
+_FRC_RECOMMENDATIONS = _vocab('Recommended', 'Pending', 'Additional Info Required')
+_CR_TYPES = _vocab('Grazing Ground', 'Community Pond', 'NTFP Collection Area', 'Sacred Grove', 'Community Well')
+_CR_POINT_TYPES = frozenset(('Community Pond', 'Community Well'))
+_CROP_TYPES = _vocab('Rice', 'Wheat', 'Maize', 'Millet', 'Pulses', 'Vegetables', 'Mixed Crops')
+_IRRIGATION_TYPES = _vocab('Rainfed', 'Canal', 'Borewell', 'Tank')
+_SEASONS = _vocab('Kharif', 'Rabi', 'Summer')
+_LAND_TYPES = _vocab('Forest Land', 'Revenue Land', 'Patta Land')
+_SLOPES = _vocab('Flat', 'Gentle', 'Moderate')
+_PRODUCTIVITY = _vocab('High', 'Medium', 'Low')
+_WATER_TYPES = _vocab('Stream', 'Seasonal Pond', 'Tank', 'Natural Spring', 'Check Dam')
+_WATER_ACCESSIBILITY = _vocab('Easy', 'Moderate', 'Difficult')
+_DEPTH_CATEGORIES = _vocab('Shallow', 'Medium', 'Deep')
+_MANAGEMENT_PLANS = _vocab('Prepared', 'Under Preparation', 'Not Started')
+_FOREST_TYPES = _vocab('Tropical Deciduous', 'Dry Deciduous', 'Moist Deciduous', 'Scrub')
+_VILLAGE_BASE_NAMES = MappingProxyType({
+    'Telangana': ('Ramagundam', 'Venkatesh', 'Lakshmi', 'Srinivas', 'Ananda'),
+    'Madhya Pradesh': ('Rampur', 'Shivpur', 'Krishnanagar', 'Rajpur', 'Devgarh'),
+    'Odisha': ('Jagannath', 'Rama', 'Krishna', 'Balaram', 'Hanuman'),
+    'Tripura': ('Agartala', 'Udaipur', 'Dharmanagar', 'Ambassa', 'Belonia'),
+})
+
+# Per-feature-type properties that never vary between features
+_CFR_BASE = MappingProxyType({'claim_type': _CFR, 'fra_type': _FRA_CFR, 'area_unit': _HECTARES})
+_IFR_BASE = MappingProxyType({'claim_type': _IFR, 'fra_type': _FRA_IFR, 'area_unit': _HECTARES})
+_CR_BASE = MappingProxyType({'claim_type': _CR, 'fra_type': _FRA_CR, 'community_management': True})
+_AGRICULTURE_BASE = MappingProxyType({'feature_type': _AGRICULTURE})
+_WATER_BASE = MappingProxyType({'feature_type': _WATER_BODY})
+
+# Closed unit rectangle centered on the origin, scaled per plot by (width, height)
+_UNIT_RECT = np.array([[-0.5, -0.5], [0.5, -0.5], [0.5, 0.5], [-0.5, 0.5], [-0.5, -0.5]])
+
+def _ring_to_list(ring):
+    """GeoJSON [[lon, lat], ...] ring from an (n, 2) ndarray, built only when the feature dict is"""
+    return ring.tolist()
+
+def _unit_ring(n):
+    """(n, 2) array of (sin, cos) at n evenly spaced angles"""
+    angles = np.linspace(0, math.tau, n, endpoint=False)
+    return np.column_stack((np.sin(angles), np.cos(angles)))
+
+# Every vertex count an irregular ring uses, so ring construction does no trig
+_UNIT_RINGS = {n: _unit_ring(n) for n in range(6, 13)}
+
+def _irregular_ring(cx, cy, radius_deg, n, jitter_lo, jitter_hi, rng):
+    """Closed (n + 1, 2) lon/lat ring of n vertices at evenly spaced angles around (cx, cy),
+    each at radius_deg scaled by a uniform jitter in [jitter_lo, jitter_hi)"""
+    r = radius_deg * rng.uniform(jitter_lo, jitter_hi, n)
+    ring = np.empty((n + 1, 2))
+    ring[:-1] = (cx, cy) + _UNIT_RINGS[n] * r[:, None]
+    ring[-1] = ring[0]
+    return ring
 
 class VanachitraFRAGenerator:
-    def __init__(self):
+    # Interior points pre-sampled per CFR (covers the 27 features placed in it)
+    SAMPLE_BATCH = 64
+    # Oldest submission date any feature can get, in days before the run
+    MAX_SUBMISSION_DAYS = 900
+    
+    def __init__(self, seed=None, now=None):
+        self.rng = np.random.default_rng(seed)
+        
+        # One reference time per run for every submission date and the created_date
+        self._now = now or datetime.now()
+        # 'YYYY-MM-DD' strings indexed by days before the run, formatted once
+        self._date_lut = (np.datetime64(self._now.date())
+                          - np.arange(self.MAX_SUBMISSION_DAYS + 1)).astype(str).tolist()
+        
         # Indian states with forest areas and their characteristics
         self.forest_states = {
             'Telangana': {
@@ -56,17 +150,22 @@ class VanachitraFRAGenerator:
             'Tripura': ['para', 'khorang', 'bari', 'tilla']
         }
 
+    def choice(self, population):
+        """Pick one element of a short list via an integer draw from self.rng"""
+        return population[self.rng.integers(len(population))]
+    
+    def choices(self, population, k):
+        """Pick k elements (with replacement) of a short list in one draw"""
+        return [population[i] for i in self.rng.integers(len(population), size=k)]
+    
+    def submission_dates(self, min_days, max_days, k):
+        """k 'YYYY-MM-DD' dates between min_days and max_days (inclusive) before today"""
+        return [self._date_lut[d] for d in self.rng.integers(min_days, max_days + 1, k)]
+
     def generate_realistic_village_name(self, state):
         """Generate realistic village names based on state patterns"""
-        base_names = {
-            'Telangana': ['Ramagundam', 'Venkatesh', 'Lakshmi', 'Srinivas', 'Ananda'],
-            'Madhya Pradesh': ['Rampur', 'Shivpur', 'Krishnanagar', 'Rajpur', 'Devgarh'],
-            'Odisha': ['Jagannath', 'Rama', 'Krishna', 'Balaram', 'Hanuman'],
-            'Tripura': ['Agartala', 'Udaipur', 'Dharmanagar', 'Ambassa', 'Belonia']
-        }
-        
-        base = random.choice(base_names[state])
-        suffix = random.choice(self.village_patterns[state])
+        base = self.choice(_VILLAGE_BASE_NAMES[state])
+        suffix = self.choice(self.village_patterns[state])
         return f"{base}{suffix}"
 
     def generate_cfr_polygon(self, state_info, district):
@@ -74,152 +173,122 @@ class VanachitraFRAGenerator:
         center_lat, center_lon = state_info['center']
         
         # Add some offset for district location
-        lat_offset = random.uniform(-1.5, 1.5)
-        lon_offset = random.uniform(-1.5, 1.5)
+        lat_offset = float(self.rng.uniform(-1.5, 1.5))
+        lon_offset = float(self.rng.uniform(-1.5, 1.5))
         
         cfr_center_lat = center_lat + lat_offset
         cfr_center_lon = center_lon + lon_offset
         
         # CFR area should be substantial (500-2000 hectares)
-        area_hectares = random.uniform(500, 2000)
+        area_hectares = float(self.rng.uniform(500, 2000))
         radius_km = math.sqrt(area_hectares / 100 / math.pi)  # Convert to km radius
         radius_deg = radius_km / 111.0  # Rough conversion to degrees
         
-        # Generate irregular forest boundary (8-12 points)
-        points = []
-        num_points = random.randint(8, 12)
+        # Generate irregular forest boundary (8-12 points), varying the radius per vertex
+        num_points = int(self.rng.integers(8, 13))
+        ring = _irregular_ring(cfr_center_lon, cfr_center_lat, radius_deg, num_points, 0.7, 1.4, self.rng)
         
-        for i in range(num_points):
-            angle = 2 * math.pi * i / num_points
-            # Vary radius to create irregular forest boundary
-            r = radius_deg * random.uniform(0.7, 1.4)
-            
-            lat = cfr_center_lat + r * math.cos(angle)
-            lon = cfr_center_lon + r * math.sin(angle)
-            points.append([lon, lat])
-        
-        # Close the polygon
-        points.append(points[0])
+        # The boundary is star-shaped around the center: fan triangles (center, p_i, p_i+1)
+        # tile it exactly, so interior points can be drawn without rejection
+        fan_center = np.array([cfr_center_lon, cfr_center_lat])
+        a = ring[:-1] - fan_center
+        b = ring[1:] - fan_center
+        fan_areas = 0.5 * np.abs(a[:, 0] * b[:, 1] - a[:, 1] * b[:, 0])
         
         return {
-            'coordinates': [points],
+            'ring': ring,
+            'fan_center': fan_center,
+            'fan_cdf': np.cumsum(fan_areas / fan_areas.sum()),
             'center': [cfr_center_lat, cfr_center_lon],
             'area_hectares': area_hectares
         }
 
-    def point_in_polygon(self, point, polygon):
-        """Check if a point is inside a polygon using ray casting algorithm"""
-        x, y = point
-        n = len(polygon)
-        inside = False
-        
-        p1x, p1y = polygon[0]
-        for i in range(1, n + 1):
-            p2x, p2y = polygon[i % n]
-            if y > min(p1y, p2y):
-                if y <= max(p1y, p2y):
-                    if x <= max(p1x, p2x):
-                        if p1y != p2y:
-                            xinters = (y - p1y) * (p2x - p1x) / (p2y - p1y) + p1x
-                        if p1x == p2x or x <= xinters:
-                            inside = not inside
-            p1x, p1y = p2x, p2y
-        
-        return inside
+    def _sample_interior_points(self, cfr_data, n):
+        """n uniform points inside the CFR polygon as [lat, lon] pairs, drawn as one batch"""
+        # Pick fan triangles by area, then uniform points in them (reflect r1 + r2 > 1)
+        cdf = cfr_data['fan_cdf']
+        tri = np.minimum(np.searchsorted(cdf, self.rng.random(n)), len(cdf) - 1)
+        r = self.rng.random((n, 2))
+        flip = r.sum(axis=1) > 1
+        r[flip] = 1 - r[flip]
+        center = cfr_data['fan_center']
+        ring = cfr_data['ring']
+        pts = center + r[:, :1] * (ring[tri] - center) + r[:, 1:] * (ring[tri + 1] - center)
+        return pts[:, ::-1].tolist()
 
-    def generate_point_inside_polygon(self, polygon_coords):
-        """Generate a random point inside the given polygon"""
-        # Get bounding box
-        lons = [p[0] for p in polygon_coords[0]]
-        lats = [p[1] for p in polygon_coords[0]]
-        
-        min_lon, max_lon = min(lons), max(lons)
-        min_lat, max_lat = min(lats), max(lats)
-        
-        # Try to generate point inside polygon (max 50 attempts)
-        for _ in range(50):
-            lon = random.uniform(min_lon, max_lon)
-            lat = random.uniform(min_lat, max_lat)
-            
-            if self.point_in_polygon([lon, lat], polygon_coords[0]):
-                return [lat, lon]
-        
-        # Fallback: return center of bounding box
-        return [(min_lat + max_lat) / 2, (min_lon + max_lon) / 2]
+    def generate_point_inside_polygon(self, cfr_data):
+        """Generate a random point inside the CFR polygon"""
+        # Served from a per-CFR pool of pre-sampled points, refilled a batch at a time
+        pool = cfr_data.get('interior_pool')
+        if not pool:
+            pool = cfr_data['interior_pool'] = self._sample_interior_points(cfr_data, self.SAMPLE_BATCH)
+        return pool.pop()
 
-    def generate_ifr_polygons(self, cfr_polygon, village_name, district, state, tribal_community, num_ifrs=12):
+    def generate_ifr_polygons(self, cfr_data, village_name, district, state, tribal_community, num_ifrs=12):
         """Generate IFR (Individual Forest Rights) polygons inside CFR"""
         ifr_features = []
         
+        # Draw every per-IFR property field up front, one call per field
+        # IFR area: 1-5 hectares per household
+        areas = self.rng.uniform(1.0, 5.0, num_ifrs).tolist()
+        household_heads = self.choices(_HOUSEHOLD_HEADS, num_ifrs)
+        statuses = self.choices(_CLAIM_STATUSES, num_ifrs)
+        family_members = self.rng.integers(3, 9, num_ifrs).tolist()
+        livelihoods = self.choices(_LIVELIHOODS, num_ifrs)
+        submission_dates = self.submission_dates(30, 730, num_ifrs)
+        survey_numbers = self.rng.integers(100, 1000, num_ifrs).tolist()
+        frc_recommendations = self.choices(_FRC_RECOMMENDATIONS, num_ifrs)
+        gps_verified = self.choices(_YES_NO, num_ifrs)
+        documents_complete = self.choices(_YES_NO, num_ifrs)
+        
+        # Plot geometry for all IFRs at once: rectangular or square footprints, rotated
+        # slightly about their centers inside the CFR
+        area_arr = np.asarray(areas)
+        radius_deg = np.sqrt(area_arr / 100) / 111.0  # Convert to degrees
+        centers = np.array([self.generate_point_inside_polygon(cfr_data) for _ in range(num_ifrs)])[:, ::-1]
+        rectangular = self.rng.random(num_ifrs) < 0.5
+        widths = np.where(rectangular, radius_deg * self.rng.uniform(0.8, 1.5, num_ifrs), radius_deg)
+        heights = np.where(rectangular, area_arr / 100 / (widths * 111.0) / 111.0, radius_deg)
+        rotations = self.rng.uniform(-np.pi / 8, np.pi / 8, num_ifrs)
+        
+        half_w, half_h = widths / 2, heights / 2
+        corners = np.stack([np.stack([-half_w, -half_h], axis=1),
+                            np.stack([half_w, -half_h], axis=1),
+                            np.stack([half_w, half_h], axis=1),
+                            np.stack([-half_w, half_h], axis=1)], axis=1)  # (num_ifrs, 4, 2)
+        cos_r, sin_r = np.cos(rotations), np.sin(rotations)
+        rot = np.stack([np.stack([cos_r, -sin_r], axis=1),
+                        np.stack([sin_r, cos_r], axis=1)], axis=1)  # (num_ifrs, 2, 2)
+        rings = np.einsum('nij,nkj->nki', rot, corners) + centers[:, None, :]
+        # Close each polygon
+        rings = np.concatenate([rings, rings[:, :1]], axis=1)
+        
+        base = {**_IFR_BASE, 'village': village_name, 'district': district, 'state': state,
+                'tribal_community': tribal_community}
+        
         for i in range(num_ifrs):
-            # IFR area: 1-5 hectares per household
-            area_hectares = random.uniform(1.0, 5.0)
-            radius_deg = math.sqrt(area_hectares / 100) / 111.0  # Convert to degrees
-            
-            # Generate center point inside CFR
-            center_lat, center_lon = self.generate_point_inside_polygon(cfr_polygon)
-            
-            # Generate small rectangular/square polygon (typical of agricultural plots)
-            if random.choice([True, False]):
-                # Rectangular plot
-                width = radius_deg * random.uniform(0.8, 1.5)
-                height = area_hectares / 100 / (width * 111.0) / 111.0
-            else:
-                # Square plot
-                width = height = radius_deg
-            
-            # Add slight rotation
-            rotation = random.uniform(-math.pi/8, math.pi/8)
-            
-            corners = [
-                [-width/2, -height/2],
-                [width/2, -height/2],
-                [width/2, height/2],
-                [-width/2, height/2]
-            ]
-            
-            points = []
-            for corner in corners:
-                # Apply rotation
-                x_rot = corner[0] * math.cos(rotation) - corner[1] * math.sin(rotation)
-                y_rot = corner[0] * math.sin(rotation) + corner[1] * math.cos(rotation)
-                
-                lat = center_lat + y_rot
-                lon = center_lon + x_rot
-                points.append([lon, lat])
-            
-            # Close polygon
-            points.append(points[0])
-            
-            # Generate realistic household details
-            household_head = random.choice(['Ram Singh', 'Shyam Lal', 'Ganga Devi', 'Sita Bai', 
-                                         'Ravi Kumar', 'Lakshmi Devi', 'Suresh Rao', 'Kamala Bai'])
+            area_hectares = areas[i]
+            ring = rings[i]
             
             ifr_feature = {
                 'type': 'Feature',
                 'properties': {
+                    **base,
                     'claim_id': f'IFR_{state[:2].upper()}_{district[:3].upper()}_{i+1:03d}',
-                    'claim_type': 'IFR',
-                    'fra_type': 'Individual Forest Rights',
-                    'village': village_name,
-                    'district': district,
-                    'state': state,
                     'area_claimed': round(area_hectares, 2),
-                    'area_unit': 'hectares',
-                    'status': random.choice(['Approved', 'Pending', 'Under Review']),
-                    'tribal_community': tribal_community,
-                    'household_head': household_head,
-                    'family_members': random.randint(3, 8),
-                    'livelihood': random.choice(['Agriculture', 'NTFP Collection', 'Animal Husbandry', 'Mixed']),
-                    'submission_date': (datetime.now() - timedelta(days=random.randint(30, 730))).strftime('%Y-%m-%d'),
-                    'survey_number': f'SY_{random.randint(100, 999)}',
-                    'frc_recommendation': random.choice(['Recommended', 'Pending', 'Additional Info Required']),
-                    'gps_verified': random.choice([True, False]),
-                    'documents_complete': random.choice([True, False])
+                    'status': statuses[i],
+                    'household_head': household_heads[i],
+                    'family_members': family_members[i],
+                    'livelihood': livelihoods[i],
+                    'submission_date': submission_dates[i],
+                    'survey_number': f'SY_{survey_numbers[i]}',
+                    'frc_recommendation': frc_recommendations[i],
+                    'gps_verified': gps_verified[i],
+                    'documents_complete': documents_complete[i]
                 },
                 'geometry': {
                     'type': 'Polygon',
-                    'coordinates': [points]
+                    'coordinates': [_ring_to_list(ring)]
                 }
             }
             
@@ -227,37 +296,41 @@ class VanachitraFRAGenerator:
         
         return ifr_features
 
-    def generate_cr_features(self, cfr_polygon, village_name, district, state, tribal_community, num_crs=3):
+    def generate_cr_features(self, cfr_data, village_name, district, state, tribal_community, num_crs=3):
         """Generate CR (Community Rights) features inside CFR"""
         cr_features = []
         
-        cr_types = ['Grazing Ground', 'Community Pond', 'NTFP Collection Area', 'Sacred Grove', 'Community Well']
+        # Per-CR property fields, drawn as batches
+        resource_types = self.choices(_CR_TYPES, num_crs)
+        statuses = self.choices(_CR_STATUSES, num_crs)
+        beneficiaries = self.rng.integers(20, 81, num_crs).tolist()
+        usage_patterns = self.choices(_USAGE_PATTERNS, num_crs)
+        submission_dates = self.submission_dates(30, 730, num_crs)
+        traditional_uses = self.choices(_YES_NO, num_crs)
+        management_committees = self.choices(_YES_NO, num_crs)
+        
+        base = {**_CR_BASE, 'village': village_name, 'district': district, 'state': state,
+                'tribal_community': tribal_community}
         
         for i in range(num_crs):
-            cr_type = random.choice(cr_types)
+            cr_type = resource_types[i]
             
             # Generate center point inside CFR
-            center_lat, center_lon = self.generate_point_inside_polygon(cfr_polygon)
+            center_lat, center_lon = self.generate_point_inside_polygon(cfr_data)
             
-            if cr_type in ['Community Pond', 'Community Well']:
+            if cr_type in _CR_POINT_TYPES:
                 # Point feature for wells/small ponds
                 cr_feature = {
                     'type': 'Feature',
                     'properties': {
+                        **base,
                         'claim_id': f'CR_{state[:2].upper()}_{district[:3].upper()}_{i+1:03d}',
-                        'claim_type': 'CR',
-                        'fra_type': 'Community Rights',
                         'resource_type': cr_type,
-                        'village': village_name,
-                        'district': district,
-                        'state': state,
-                        'status': random.choice(['Approved', 'Pending']),
-                        'tribal_community': tribal_community,
-                        'beneficiary_households': random.randint(20, 80),
-                        'usage_pattern': random.choice(['Seasonal', 'Year-round', 'Occasional']),
-                        'submission_date': (datetime.now() - timedelta(days=random.randint(30, 730))).strftime('%Y-%m-%d'),
-                        'traditional_use': random.choice([True, False]),
-                        'community_management': True
+                        'status': statuses[i],
+                        'beneficiary_households': beneficiaries[i],
+                        'usage_pattern': usage_patterns[i],
+                        'submission_date': submission_dates[i],
+                        'traditional_use': traditional_uses[i]
                     },
                     'geometry': {
                         'type': 'Point',
@@ -266,47 +339,31 @@ class VanachitraFRAGenerator:
                 }
             else:
                 # Polygon feature for larger community areas
-                area_hectares = random.uniform(5.0, 50.0)
+                area_hectares = float(self.rng.uniform(5.0, 50.0))
                 radius_deg = math.sqrt(area_hectares / 100) / 111.0
                 
                 # Generate irregular polygon
-                points = []
-                num_points = random.randint(6, 10)
-                
-                for j in range(num_points):
-                    angle = 2 * math.pi * j / num_points
-                    r = radius_deg * random.uniform(0.7, 1.3)
-                    
-                    lat = center_lat + r * math.cos(angle)
-                    lon = center_lon + r * math.sin(angle)
-                    points.append([lon, lat])
-                
-                points.append(points[0])
+                num_points = int(self.rng.integers(6, 11))
+                ring = _irregular_ring(center_lon, center_lat, radius_deg, num_points, 0.7, 1.3, self.rng)
                 
                 cr_feature = {
                     'type': 'Feature',
                     'properties': {
+                        **base,
                         'claim_id': f'CR_{state[:2].upper()}_{district[:3].upper()}_{i+1:03d}',
-                        'claim_type': 'CR',
-                        'fra_type': 'Community Rights',
                         'resource_type': cr_type,
-                        'village': village_name,
-                        'district': district,
-                        'state': state,
                         'area_claimed': round(area_hectares, 2) if cr_type != 'Community Well' else None,
-                        'area_unit': 'hectares',
-                        'status': random.choice(['Approved', 'Pending']),
-                        'tribal_community': tribal_community,
-                        'beneficiary_households': random.randint(20, 80),
-                        'usage_pattern': random.choice(['Seasonal', 'Year-round', 'Occasional']),
-                        'submission_date': (datetime.now() - timedelta(days=random.randint(30, 730))).strftime('%Y-%m-%d'),
-                        'traditional_use': random.choice([True, False]),
-                        'community_management': True,
-                        'management_committee': random.choice([True, False])
+                        'area_unit': _HECTARES,
+                        'status': statuses[i],
+                        'beneficiary_households': beneficiaries[i],
+                        'usage_pattern': usage_patterns[i],
+                        'submission_date': submission_dates[i],
+                        'traditional_use': traditional_uses[i],
+                        'management_committee': management_committees[i]
                     },
                     'geometry': {
                         'type': 'Polygon',
-                        'coordinates': [points]
+                        'coordinates': [_ring_to_list(ring)]
                     }
                 }
             
@@ -314,50 +371,41 @@ class VanachitraFRAGenerator:
         
         return cr_features
 
-    def generate_agriculture_features(self, cfr_polygon, village_name, district, state, num_plots=8):
+    def generate_agriculture_features(self, cfr_data, village_name, district, state, num_plots=8):
         """Generate agricultural land features inside/adjacent to CFR"""
         agriculture_features = []
         
-        crop_types = ['Rice', 'Wheat', 'Maize', 'Millet', 'Pulses', 'Vegetables', 'Mixed Crops']
+        base = {**_AGRICULTURE_BASE, 'village': village_name, 'district': district, 'state': state}
         
         for i in range(num_plots):
             # Generate point near CFR boundary or inside
-            center_lat, center_lon = self.generate_point_inside_polygon(cfr_polygon)
+            center_lat, center_lon = self.generate_point_inside_polygon(cfr_data)
             
             # Agricultural plot: 0.5-3 hectares
-            area_hectares = random.uniform(0.5, 3.0)
-            width = random.uniform(0.002, 0.008)  # degrees
+            area_hectares = float(self.rng.uniform(0.5, 3.0))
+            width = float(self.rng.uniform(0.002, 0.008))  # degrees
             height = area_hectares / 100 / (width * 111.0) / 111.0
             
             # Rectangular agricultural plot
-            points = [
-                [center_lon - width/2, center_lat - height/2],
-                [center_lon + width/2, center_lat - height/2],
-                [center_lon + width/2, center_lat + height/2],
-                [center_lon - width/2, center_lat + height/2],
-                [center_lon - width/2, center_lat - height/2]
-            ]
+            ring = np.array([center_lon, center_lat]) + _UNIT_RECT * (width, height)
             
             agriculture_feature = {
                 'type': 'Feature',
                 'properties': {
+                    **base,
                     'feature_id': f'AGR_{state[:2].upper()}_{district[:3].upper()}_{i+1:03d}',
-                    'feature_type': 'Agriculture',
-                    'crop_type': random.choice(crop_types),
-                    'village': village_name,
-                    'district': district,
-                    'state': state,
+                    'crop_type': self.choice(_CROP_TYPES),
                     'area_hectares': round(area_hectares, 2),
-                    'irrigation_type': random.choice(['Rainfed', 'Canal', 'Borewell', 'Tank']),
-                    'season': random.choice(['Kharif', 'Rabi', 'Summer']),
-                    'land_type': random.choice(['Forest Land', 'Revenue Land', 'Patta Land']),
-                    'soil_type': random.choice(['Red Soil', 'Black Soil', 'Alluvial', 'Laterite']),
-                    'slope': random.choice(['Flat', 'Gentle', 'Moderate']),
-                    'productivity': random.choice(['High', 'Medium', 'Low'])
+                    'irrigation_type': self.choice(_IRRIGATION_TYPES),
+                    'season': self.choice(_SEASONS),
+                    'land_type': self.choice(_LAND_TYPES),
+                    'soil_type': self.choice(_SOIL_TYPES),
+                    'slope': self.choice(_SLOPES),
+                    'productivity': self.choice(_PRODUCTIVITY)
                 },
                 'geometry': {
                     'type': 'Polygon',
-                    'coordinates': [points]
+                    'coordinates': [_ring_to_list(ring)]
                 }
             }
             
@@ -365,33 +413,30 @@ class VanachitraFRAGenerator:
         
         return agriculture_features
 
-    def generate_water_features(self, cfr_polygon, village_name, district, state, num_water=4):
+    def generate_water_features(self, cfr_data, village_name, district, state, num_water=4):
         """Generate water body features inside CFR"""
         water_features = []
         
-        water_types = ['Stream', 'Seasonal Pond', 'Tank', 'Natural Spring', 'Check Dam']
+        base = {**_WATER_BASE, 'village': village_name, 'district': district, 'state': state}
         
         for i in range(num_water):
-            water_type = random.choice(water_types)
+            water_type = self.choice(_WATER_TYPES)
             
             # Generate point inside CFR
-            center_lat, center_lon = self.generate_point_inside_polygon(cfr_polygon)
+            center_lat, center_lon = self.generate_point_inside_polygon(cfr_data)
             
-            if water_type in ['Natural Spring']:
+            if water_type == 'Natural Spring':
                 # Point feature
                 water_feature = {
                     'type': 'Feature',
                     'properties': {
+                        **base,
                         'feature_id': f'WTR_{state[:2].upper()}_{district[:3].upper()}_{i+1:03d}',
-                        'feature_type': 'Water Body',
                         'water_type': water_type,
-                        'village': village_name,
-                        'district': district,
-                        'state': state,
-                        'seasonal': random.choice([True, False]),
-                        'usage': random.choice(['Drinking', 'Irrigation', 'Livestock', 'Multiple']),
-                        'water_quality': random.choice(['Good', 'Moderate', 'Poor']),
-                        'accessibility': random.choice(['Easy', 'Moderate', 'Difficult'])
+                        'seasonal': self.choice(_YES_NO),
+                        'usage': self.choice(_WATER_USAGES),
+                        'water_quality': self.choice(_WATER_QUALITIES),
+                        'accessibility': self.choice(_WATER_ACCESSIBILITY)
                     },
                     'geometry': {
                         'type': 'Point',
@@ -400,42 +445,29 @@ class VanachitraFRAGenerator:
                 }
             else:
                 # Polygon feature for water bodies
-                area_hectares = random.uniform(0.2, 5.0)
+                area_hectares = float(self.rng.uniform(0.2, 5.0))
                 radius_deg = math.sqrt(area_hectares / 100) / 111.0
                 
                 # Generate irregular water body shape
-                points = []
-                num_points = random.randint(6, 12)
-                
-                for j in range(num_points):
-                    angle = 2 * math.pi * j / num_points
-                    r = radius_deg * random.uniform(0.6, 1.4)
-                    
-                    lat = center_lat + r * math.cos(angle)
-                    lon = center_lon + r * math.sin(angle)
-                    points.append([lon, lat])
-                
-                points.append(points[0])
+                num_points = int(self.rng.integers(6, 13))
+                ring = _irregular_ring(center_lon, center_lat, radius_deg, num_points, 0.6, 1.4, self.rng)
                 
                 water_feature = {
                     'type': 'Feature',
                     'properties': {
+                        **base,
                         'feature_id': f'WTR_{state[:2].upper()}_{district[:3].upper()}_{i+1:03d}',
-                        'feature_type': 'Water Body',
                         'water_type': water_type,
-                        'village': village_name,
-                        'district': district,
-                        'state': state,
                         'area_hectares': round(area_hectares, 2),
-                        'seasonal': random.choice([True, False]),
-                        'usage': random.choice(['Drinking', 'Irrigation', 'Livestock', 'Multiple']),
-                        'water_quality': random.choice(['Good', 'Moderate', 'Poor']),
-                        'depth_category': random.choice(['Shallow', 'Medium', 'Deep']),
-                        'fish_available': random.choice([True, False])
+                        'seasonal': self.choice(_YES_NO),
+                        'usage': self.choice(_WATER_USAGES),
+                        'water_quality': self.choice(_WATER_QUALITIES),
+                        'depth_category': self.choice(_DEPTH_CATEGORIES),
+                        'fish_available': self.choice(_YES_NO)
                     },
                     'geometry': {
                         'type': 'Polygon',
-                        'coordinates': [points]
+                        'coordinates': [_ring_to_list(ring)]
                     }
                 }
             
@@ -449,40 +481,40 @@ class VanachitraFRAGenerator:
         all_features = []
         
         for village_idx in range(num_villages):
-            district = random.choice(state_info['districts'])
+            district = self.choice(state_info['districts'])
             village_name = self.generate_realistic_village_name(state_name)
-            tribal_community = random.choice(self.tribal_communities[state_name])
+            tribal_community = self.choice(self.tribal_communities[state_name])
             
             # Generate CFR polygon
             cfr_data = self.generate_cfr_polygon(state_info, district)
+            # Interior points for every IFR/CR/agriculture/water feature of this village
+            cfr_data['interior_pool'] = self._sample_interior_points(cfr_data, self.SAMPLE_BATCH)
             
             # Create CFR feature
             cfr_feature = {
                 'type': 'Feature',
                 'properties': {
+                    **_CFR_BASE,
                     'claim_id': f'CFR_{state_name[:2].upper()}_{district[:3].upper()}_{village_idx+1:03d}',
-                    'claim_type': 'CFR',
-                    'fra_type': 'Community Forest Resource Rights',
                     'village': village_name,
                     'district': district,
                     'state': state_name,
                     'area_claimed': round(cfr_data['area_hectares'], 2),
-                    'area_unit': 'hectares',
-                    'status': random.choice(['Approved', 'Pending', 'Under Review']),
+                    'status': self.choice(_CLAIM_STATUSES),
                     'tribal_community': tribal_community,
                     'gram_sabha': f'{village_name} Gram Sabha',
-                    'total_households': random.randint(50, 200),
-                    'forest_committee_formed': random.choice([True, False]),
-                    'management_plan': random.choice(['Prepared', 'Under Preparation', 'Not Started']),
-                    'submission_date': (datetime.now() - timedelta(days=random.randint(60, 900))).strftime('%Y-%m-%d'),
-                    'forest_type': random.choice(['Tropical Deciduous', 'Dry Deciduous', 'Moist Deciduous', 'Scrub']),
-                    'biodiversity_rich': random.choice([True, False]),
-                    'ntfp_available': random.choice([True, False]),
-                    'wildlife_present': random.choice([True, False])
+                    'total_households': int(self.rng.integers(50, 201)),
+                    'forest_committee_formed': self.choice(_YES_NO),
+                    'management_plan': self.choice(_MANAGEMENT_PLANS),
+                    'submission_date': self.submission_dates(60, 900, 1)[0],
+                    'forest_type': self.choice(_FOREST_TYPES),
+                    'biodiversity_rich': self.choice(_YES_NO),
+                    'ntfp_available': self.choice(_YES_NO),
+                    'wildlife_present': self.choice(_YES_NO)
                 },
                 'geometry': {
                     'type': 'Polygon',
-                    'coordinates': cfr_data['coordinates']
+                    'coordinates': [_ring_to_list(cfr_data['ring'])]
                 }
             }
             
@@ -490,85 +522,115 @@ class VanachitraFRAGenerator:
             
             # Generate IFR features inside CFR
             ifr_features = self.generate_ifr_polygons(
-                cfr_data['coordinates'], village_name, district, state_name, tribal_community
+                cfr_data, village_name, district, state_name, tribal_community
             )
             all_features.extend(ifr_features)
             
             # Generate CR features inside CFR
             cr_features = self.generate_cr_features(
-                cfr_data['coordinates'], village_name, district, state_name, tribal_community
+                cfr_data, village_name, district, state_name, tribal_community
             )
             all_features.extend(cr_features)
             
             # Generate agriculture features
             agriculture_features = self.generate_agriculture_features(
-                cfr_data['coordinates'], village_name, district, state_name
+                cfr_data, village_name, district, state_name
             )
             all_features.extend(agriculture_features)
             
             # Generate water features
             water_features = self.generate_water_features(
-                cfr_data['coordinates'], village_name, district, state_name
+                cfr_data, village_name, district, state_name
             )
             all_features.extend(water_features)
         
         return all_features
 
-    def generate_complete_fra_dataset(self):
-        """Generate complete FRA dataset for multiple states"""
-        all_features = []
+    def iter_complete_fra_features(self, workers=1):
+        """Yield FRA features for every forest state, in state order
         
-        # Generate data for all forest states
+        Each state is built from a seed drawn from this generator's rng and the shared
+        run time, serially by default or in a process pool when workers > 1.
+        """
+        state_tasks = []
         for state_name in self.forest_states.keys():
             print(f"Generating FRA data for {state_name}...")
-            state_features = self.generate_village_fra_data(state_name, num_villages=2)
-            all_features.extend(state_features)
+            state_tasks.append((int(self.rng.integers(2**32)), self._now, state_name, 2))
+        
+        if workers > 1:
+            with ProcessPoolExecutor(max_workers=min(len(state_tasks), workers, os.cpu_count() or 1)) as executor:
+                for state_features in executor.map(_generate_state, *zip(*state_tasks)):
+                    yield from state_features
+        else:
+            for state_features in starmap(_generate_state, state_tasks):
+                yield from state_features
+    
+    def collection_properties(self, total_features):
+        """FeatureCollection-level properties for the generated data"""
+        return {
+            'title': 'Vanachitra.AI - Forest Rights Act Spatial Data',
+            'description': 'Realistic FRA claims data for WebGIS visualization',
+            'created_date': self._now.isoformat(),
+            'total_features': total_features,
+            'states_covered': list(self.forest_states.keys()),
+            'spatial_reference': 'EPSG:4326 (WGS84)',
+            'data_quality': 'Synthetic but spatially realistic',
+            'hierarchy': 'CFR polygons contain IFR and CR features',
+            'coordinate_system': 'Decimal degrees (longitude, latitude)'
+        }
+
+    def generate_complete_fra_dataset(self):
+        """Generate complete FRA dataset for multiple states as one dict"""
+        all_features = list(self.iter_complete_fra_features())
         
         # Create final GeoJSON
         fra_geojson = {
             'type': 'FeatureCollection',
-            'properties': {
-                'title': 'Vanachitra.AI - Forest Rights Act Spatial Data',
-                'description': 'Realistic FRA claims data for WebGIS visualization',
-                'created_date': datetime.now().isoformat(),
-                'total_features': len(all_features),
-                'states_covered': list(self.forest_states.keys()),
-                'spatial_reference': 'EPSG:4326 (WGS84)',
-                'data_quality': 'Synthetic but spatially realistic',
-                'hierarchy': 'CFR polygons contain IFR and CR features',
-                'coordinate_system': 'Decimal degrees (longitude, latitude)'
-            },
+            'properties': self.collection_properties(len(all_features)),
             'features': all_features
         }
         
         return fra_geojson
 
+def _generate_state(seed, now, state_name, num_villages):
+    """Worker entry point: all village features for one state"""
+    generator = VanachitraFRAGenerator(seed, now)
+    return generator.generate_village_fra_data(state_name, num_villages=num_villages)
+
 def main():
     """Generate and save FRA spatial data"""
-    generator = VanachitraFRAGenerator()
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--seed', type=int, default=None,
+                        help='Seed for the random generator (default: nondeterministic)')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='Worker processes for state generation (default: 1, serial)')
+    args = parser.parse_args()
+    
+    generator = VanachitraFRAGenerator(args.seed)
     
     print("🌳 Vanachitra.AI - Generating FRA Spatial Data...")
     print("=" * 50)
     
-    # Generate complete dataset
-    fra_data = generator.generate_complete_fra_dataset()
-    
-    # Save to file
+    # Stream features straight to disk, keeping only their properties for the summary
     output_file = 'output/vanachitra_fra_data.geojson'
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(fra_data, f, indent=2, ensure_ascii=False)
+    props = []
+    with GeoJSONStreamWriter(output_file) as writer:
+        for feature in generator.iter_complete_fra_features(args.workers):
+            writer.write_feature(feature)
+            props.append(feature['properties'])
+        writer.properties = generator.collection_properties(writer.count)
     
     print(f"\n✅ FRA data generated successfully!")
     print(f"📁 Output file: {output_file}")
-    print(f"📊 Total features: {len(fra_data['features'])}")
+    print(f"📊 Total features: {len(props)}")
     
     # Print summary by feature type
     feature_counts = {}
-    for feature in fra_data['features']:
-        if 'claim_type' in feature['properties']:
-            ftype = feature['properties']['claim_type']
+    for properties in props:
+        if 'claim_type' in properties:
+            ftype = properties['claim_type']
         else:
-            ftype = feature['properties']['feature_type']
+            ftype = properties['feature_type']
         
         feature_counts[ftype] = feature_counts.get(ftype, 0) + 1
     
@@ -576,7 +638,7 @@ def main():
     for ftype, count in feature_counts.items():
         print(f"   {ftype}: {count} features")
     
-    print(f"\n🗺️ States covered: {', '.join(fra_data['properties']['states_covered'])}")
+    print(f"\n🗺️ States covered: {', '.join(writer.properties['states_covered'])}")
     print("🎯 Spatial hierarchy: CFR polygons contain IFR and CR features")
     print("✅ All coordinates are within valid Indian land boundaries")
 
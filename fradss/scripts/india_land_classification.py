@@ -6,27 +6,83 @@ Extended MVP with comprehensive coverage and accurate classification
 
 import os
 import sys
+import argparse
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
 import numpy as np
-import pandas as pd
-import rasterio
-import geopandas as gpd
-from sklearn.ensemble import RandomForestClassifier
-from sklearn.model_selection import train_test_split
-from sklearn.metrics import classification_report, accuracy_score
-import joblib
-import json
-from rasterio.features import shapes
-from rasterio.transform import from_bounds
 import warnings
 warnings.filterwarnings('ignore')
 
+from fra_common import GeoJSONStreamWriter, jit, njit
+
 # Add project root to path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+# Vertex angles for the 8-point irregular and 12-point organic polygons, with their cosines and sines
+_ANGLES_8 = np.linspace(0, 2*np.pi, 8)
+_COS_8, _SIN_8 = np.cos(_ANGLES_8), np.sin(_ANGLES_8)
+_ANGLES_12 = np.linspace(0, 2*np.pi, 12)
+_COS_12, _SIN_12 = np.cos(_ANGLES_12), np.sin(_ANGLES_12)
+
+# Corners of the closed unit square centered on the origin, as x and y columns
+_SQUARE_X = np.array([-1, 1, 1, -1, -1], dtype=np.float64)
+_SQUARE_Y = np.array([-1, -1, 1, 1, -1], dtype=np.float64)
+
+# Widest closed ring any land-use shape produces (the 12-point organic polygon)
+_MAX_RING_SIZE = len(_ANGLES_12) + 1
+
+# Forest and crop types each land-use class draws from; other classes get None
+_FOREST_TYPES = {
+    'forest_dense': np.array(['Tropical Evergreen', 'Tropical Semi-Evergreen', 'Tropical Moist Deciduous'],
+                             dtype=object),
+    'forest_open': np.array(['Tropical Dry Deciduous', 'Tropical Thorn', 'Subtropical Pine'], dtype=object),
+    'mangrove': np.array(['Mangrove'], dtype=object),
+}
+_CROP_TYPES = {
+    'agriculture_irrigated': np.array(['Rice', 'Wheat', 'Sugarcane', 'Cotton', 'Vegetables'], dtype=object),
+    'agriculture_rainfed': np.array(['Millets', 'Pulses', 'Oilseeds', 'Maize'], dtype=object),
+}
+
+# FRA claim statuses with their cumulative probabilities (0.4 / 0.5 / 0.1)
+_CLAIM_STATUSES = ('pending', 'approved', 'rejected')
+_CLAIM_STATUS_CDF = np.array([0.4, 0.9, 1.0])
+
+@jit
+def _radial_rings_kernel(lats, lons, radii, cos_a, sin_a):
+    """(n, V + 1, 2) closed lon/lat rings for n centers and an (n, V) radius per angle"""
+    n, v = radii.shape
+    out = np.empty((n, v + 1, 2))
+    for i in range(n):
+        for k in range(v):
+            out[i, k, 0] = lons[i] + radii[i, k] * cos_a[k]
+            out[i, k, 1] = lats[i] + radii[i, k] * sin_a[k]
+        out[i, v, 0] = out[i, 0, 0]
+        out[i, v, 1] = out[i, 0, 1]
+    return out
+
+def _radial_ring(lat, lon, radius, cos_a, sin_a):
+    """Closed [[lon, lat], ...] ring with one vertex per (radius, angle)
+    
+    lat and lon may be scalars or (n,) arrays with radius shaped (..., V); arrays
+    give an (n, V + 1, 2) array of rings.
+    """
+    if njit is not None:
+        rings = _radial_rings_kernel(np.atleast_1d(np.asarray(lat, dtype=np.float64)),
+                                     np.atleast_1d(np.asarray(lon, dtype=np.float64)),
+                                     np.atleast_2d(radius), cos_a, sin_a)
+        return rings if np.ndim(lat) else rings[0]
+    
+    lat = np.asarray(lat)[..., None]
+    lon = np.asarray(lon)[..., None]
+    coords = np.stack([lon + radius * cos_a, lat + radius * sin_a], axis=-1)
+    return np.concatenate([coords, coords[..., :1, :]], axis=-2)
+
 class IndiaLandUseClassifier:
-    def __init__(self, output_dir):
+    def __init__(self, output_dir, seed=None):
         self.output_dir = output_dir
         self.model = None
+        self.rng = np.random.default_rng(seed)
         
         # Enhanced class mapping for India
         self.class_mapping = {
@@ -50,17 +106,8 @@ class IndiaLandUseClassifier:
             'west': 68.1
         }
         
-        # Create output directory if it doesn't exist
-        os.makedirs(output_dir, exist_ok=True)
-    
-    def generate_india_sample_data(self):
-        """Generate comprehensive sample data for India with realistic distribution."""
-        print("Generating India-wide sample data...")
-        
-        features = []
-        
         # State-wise data distribution (approximate)
-        states_data = {
+        self.states_data = {
             'Andhra Pradesh': {'lat': 15.9129, 'lon': 79.7400, 'scale': 0.8},
             'Arunachal Pradesh': {'lat': 28.2180, 'lon': 94.7278, 'scale': 0.6},
             'Assam': {'lat': 26.2006, 'lon': 92.9376, 'scale': 0.7},
@@ -92,7 +139,7 @@ class IndiaLandUseClassifier:
         }
         
         # Class distribution based on India's land use patterns
-        class_distribution = {
+        self.class_distribution = {
             'water': 0.08,
             'forest_dense': 0.15,
             'forest_open': 0.10,
@@ -105,130 +152,152 @@ class IndiaLandUseClassifier:
             'mangrove': 0.01
         }
         
-        for state_name, state_info in states_data.items():
+        # Create output directory if it doesn't exist
+        os.makedirs(output_dir, exist_ok=True)
+    
+    def iter_india_features(self, workers=1):
+        """Yield India-wide land-use features state by state, followed by the FRA claims
+        
+        Each state is built as columns from its own seed drawn from self.rng, serially
+        by default or in a process pool when workers > 1.
+        """
+        print("Generating India-wide sample data...")
+        
+        # States are independent: each worker gets its own seed drawn from self.rng
+        state_tasks = []
+        for state_name, state_info in self.states_data.items():
             print(f"Generating data for {state_name}...")
-            
-            for class_name, class_id in self.class_mapping.items():
-                # Calculate number of features based on distribution and state size
-                num_features = max(1, int(class_distribution[class_name] * state_info['scale'] * 20))
-                
-                for i in range(num_features):
-                    # Create realistic polygon around state center
-                    base_lat = state_info['lat'] + np.random.uniform(-state_info['scale'], state_info['scale'])
-                    base_lon = state_info['lon'] + np.random.uniform(-state_info['scale'], state_info['scale'])
-                    
-                    # Ensure coordinates are within India bounds
-                    base_lat = max(self.india_bounds['south'], min(self.india_bounds['north'], base_lat))
-                    base_lon = max(self.india_bounds['west'], min(self.india_bounds['east'], base_lon))
-                    
-                    # Create polygon with realistic size
-                    size = np.random.uniform(0.01, 0.1) * state_info['scale']
-                    
-                    # Different shapes for different classes
-                    if class_name in ['water', 'wetland']:
-                        # Water bodies are more irregular
-                        coords = self._create_irregular_polygon(base_lat, base_lon, size)
-                    elif class_name in ['urban']:
-                        # Urban areas are more rectangular
-                        coords = self._create_rectangular_polygon(base_lat, base_lon, size)
-                    else:
-                        # Natural areas are more organic
-                        coords = self._create_organic_polygon(base_lat, base_lon, size)
-                    
-                    feature = {
-                        "type": "Feature",
-                        "properties": {
-                            "class": class_name,
-                            "class_id": class_id,
-                            "state": state_name,
-                            "area_km2": round(np.random.uniform(1, 100), 2),
-                            "confidence": round(np.random.uniform(0.75, 0.95), 2),
-                            "population": np.random.randint(0, 10000) if class_name == 'urban' else 0,
-                            "forest_type": self._get_forest_type(class_name),
-                            "crop_type": self._get_crop_type(class_name),
-                            "tribal_area": bool(np.random.choice([True, False], p=[0.3, 0.7]))
-                        },
-                        "geometry": {
-                            "type": "Polygon",
-                            "coordinates": [coords]
-                        }
-                    }
-                    
-                    features.append(feature)
+            state_tasks.append((int(self.rng.integers(2**32)), self.output_dir, state_name, state_info,
+                                self.class_distribution))
+        
+        if workers > 1:
+            with ProcessPoolExecutor(max_workers=min(len(state_tasks), workers, os.cpu_count() or 1)) as executor:
+                for state_columns in executor.map(_generate_state, *zip(*state_tasks)):
+                    yield from _features_from_columns(state_columns)
+        else:
+            for state_columns in map(_generate_state, *zip(*state_tasks)):
+                yield from _features_from_columns(state_columns)
         
         # Add FRA (Forest Rights Act) specific data
-        fra_features = self._generate_fra_data()
-        features.extend(fra_features)
+        yield from self._generate_fra_data()
+    
+    def collection_properties(self, total_features):
+        """FeatureCollection-level properties for the generated data."""
+        return {
+            "generated_at": datetime.now().isoformat(),
+            "description": "Enhanced India land use classification with FRA data",
+            "total_features": total_features,
+            "classes": list(self.class_mapping.keys()),
+            "states": list(self.states_data.keys()),
+            "coverage": "India"
+        }
+    
+    def generate_india_sample_data(self, workers=1):
+        """Generate comprehensive sample data for India with realistic distribution."""
+        features = list(self.iter_india_features(workers))
         
         geojson = {
             "type": "FeatureCollection",
             "features": features,
-            "properties": {
-                "generated_at": pd.Timestamp.now().isoformat(),
-                "description": "Enhanced India land use classification with FRA data",
-                "total_features": len(features),
-                "classes": list(self.class_mapping.keys()),
-                "states": list(states_data.keys()),
-                "coverage": "India"
-            }
+            "properties": self.collection_properties(len(features))
         }
         
         return geojson
     
+    def generate_state_columns(self, state_name, state_info, class_distribution):
+        """Generate one state's land-use features as a struct of arrays
+        
+        Every column is preallocated for the whole state and filled one (class)
+        block at a time; rings are padded to the widest shape with their vertex
+        count in ``ring_sizes``. Feature dicts are only built at write time.
+        """
+        scale = state_info['scale']
+        counts = {class_name: max(1, int(class_distribution[class_name] * scale * 20))
+                  for class_name in self.class_mapping}
+        total = sum(counts.values())
+        columns = {
+            'class': np.empty(total, dtype=object),
+            'class_id': np.empty(total, dtype=np.int64),
+            'state': np.full(total, state_name, dtype=object),
+            'area_km2': np.empty(total),
+            'confidence': np.empty(total),
+            'population': np.zeros(total, dtype=np.int64),
+            'forest_type': np.full(total, None, dtype=object),
+            'crop_type': np.full(total, None, dtype=object),
+            'tribal_area': np.empty(total, dtype=bool),
+            'rings': np.empty((total, _MAX_RING_SIZE, 2)),
+            'ring_sizes': np.empty(total, dtype=np.int64),
+        }
+        
+        offset = 0
+        for class_name, class_id in self.class_mapping.items():
+            num_features = counts[class_name]
+            block = slice(offset, offset + num_features)
+            offset += num_features
+            
+            # Create realistic polygons around state center, kept within India bounds
+            base_lats = np.clip(state_info['lat'] + self.rng.uniform(-scale, scale, num_features),
+                                self.india_bounds['south'], self.india_bounds['north'])
+            base_lons = np.clip(state_info['lon'] + self.rng.uniform(-scale, scale, num_features),
+                                self.india_bounds['west'], self.india_bounds['east'])
+            # Create polygons with realistic size
+            sizes = self.rng.uniform(0.01, 0.1, num_features) * scale
+            columns['class'][block] = class_name
+            columns['class_id'][block] = class_id
+            columns['area_km2'][block] = np.round(self.rng.uniform(1, 100, num_features), 2)
+            columns['confidence'][block] = np.round(self.rng.uniform(0.75, 0.95, num_features), 2)
+            if class_name == 'urban':
+                columns['population'][block] = self.rng.integers(0, 10000, num_features)
+            columns['tribal_area'][block] = self.rng.random(num_features) < 0.3
+            
+            # Different shapes for different classes
+            if class_name in ['water', 'wetland']:
+                # Water bodies are more irregular
+                rings = self._create_irregular_polygon(base_lats, base_lons, sizes)
+            elif class_name in ['urban']:
+                # Urban areas are more rectangular
+                rings = self._create_rectangular_polygon(base_lats, base_lons, sizes)
+            else:
+                # Natural areas are more organic
+                rings = self._create_organic_polygon(base_lats, base_lons, sizes)
+            columns['rings'][block, :rings.shape[1]] = rings
+            columns['ring_sizes'][block] = rings.shape[1]
+            
+            if class_name in _FOREST_TYPES:
+                columns['forest_type'][block] = self._draw_types(_FOREST_TYPES[class_name], num_features)
+            if class_name in _CROP_TYPES:
+                columns['crop_type'][block] = self._draw_types(_CROP_TYPES[class_name], num_features)
+        
+        return columns
+    
     def _create_irregular_polygon(self, lat, lon, size):
-        """Create irregular polygon for water bodies."""
-        angles = np.linspace(0, 2*np.pi, 8)
-        radius = size * np.random.uniform(0.5, 1.5, len(angles))
-        coords = []
-        for angle, r in zip(angles, radius):
-            x = lon + r * np.cos(angle)
-            y = lat + r * np.sin(angle)
-            coords.append([x, y])
-        coords.append(coords[0])  # Close polygon
-        return coords
+        """Create irregular polygon for water bodies (an array of them for arrays of centers)."""
+        size = np.asarray(size)[..., None]
+        radius = size * self.rng.uniform(0.5, 1.5, size.shape[:-1] + (len(_ANGLES_8),))
+        return _radial_ring(lat, lon, radius, _COS_8, _SIN_8)
     
     def _create_rectangular_polygon(self, lat, lon, size):
-        """Create rectangular polygon for urban areas."""
-        half_size = size / 2
-        return [
-            [lon - half_size, lat - half_size],
-            [lon + half_size, lat - half_size],
-            [lon + half_size, lat + half_size],
-            [lon - half_size, lat + half_size],
-            [lon - half_size, lat - half_size]
-        ]
+        """Create rectangular polygon for urban areas (an array of them for arrays of centers)."""
+        half_size = np.asarray(size)[..., None] / 2
+        lat = np.asarray(lat)[..., None]
+        lon = np.asarray(lon)[..., None]
+        return np.stack([lon + half_size * _SQUARE_X, lat + half_size * _SQUARE_Y], axis=-1)
     
     def _create_organic_polygon(self, lat, lon, size):
-        """Create organic polygon for natural areas."""
-        angles = np.linspace(0, 2*np.pi, 12)
-        radius = size * np.random.uniform(0.3, 1.0, len(angles))
-        coords = []
-        for angle, r in zip(angles, radius):
-            x = lon + r * np.cos(angle)
-            y = lat + r * np.sin(angle)
-            coords.append([x, y])
-        coords.append(coords[0])  # Close polygon
-        return coords
+        """Create organic polygon for natural areas (an array of them for arrays of centers)."""
+        size = np.asarray(size)[..., None]
+        radius = size * self.rng.uniform(0.3, 1.0, size.shape[:-1] + (len(_ANGLES_12),))
+        return _radial_ring(lat, lon, radius, _COS_12, _SIN_12)
     
-    def _get_forest_type(self, class_name):
-        """Get forest type based on class."""
-        if class_name == 'forest_dense':
-            return np.random.choice(['Tropical Evergreen', 'Tropical Semi-Evergreen', 'Tropical Moist Deciduous'])
-        elif class_name == 'forest_open':
-            return np.random.choice(['Tropical Dry Deciduous', 'Tropical Thorn', 'Subtropical Pine'])
-        elif class_name == 'mangrove':
-            return 'Mangrove'
-        else:
-            return None
+    def _draw_types(self, types, n):
+        """Draw n entries from a forest or crop type table with one index draw."""
+        if len(types) == 1:
+            return np.repeat(types, n)
+        return types[self.rng.integers(len(types), size=n)]
     
-    def _get_crop_type(self, class_name):
-        """Get crop type based on class."""
-        if class_name == 'agriculture_irrigated':
-            return np.random.choice(['Rice', 'Wheat', 'Sugarcane', 'Cotton', 'Vegetables'])
-        elif class_name == 'agriculture_rainfed':
-            return np.random.choice(['Millets', 'Pulses', 'Oilseeds', 'Maize'])
-        else:
-            return None
+    def _claim_status(self):
+        """Draw a claim status with one uniform draw against the cumulative probabilities."""
+        return _CLAIM_STATUSES[int(np.searchsorted(_CLAIM_STATUS_CDF, self.rng.random(), side='right'))]
     
     def _generate_fra_data(self):
         """Generate Forest Rights Act specific data."""
@@ -248,13 +317,13 @@ class IndiaLandUseClassifier:
         
         for state in tribal_states:
             for fra_type, probability in fra_categories.items():
-                if np.random.random() < probability:
+                if self.rng.random() < probability:
                     # Generate FRA claim area
-                    base_lat = np.random.uniform(15, 25)  # Central India
-                    base_lon = np.random.uniform(75, 85)
+                    base_lat = self.rng.uniform(15, 25)  # Central India
+                    base_lon = self.rng.uniform(75, 85)
                     
-                    size = np.random.uniform(0.05, 0.2)
-                    coords = self._create_organic_polygon(base_lat, base_lon, size)
+                    size = self.rng.uniform(0.05, 0.2)
+                    coords = self._create_organic_polygon(base_lat, base_lon, size).tolist()
                     
                     feature = {
                         "type": "Feature",
@@ -263,12 +332,12 @@ class IndiaLandUseClassifier:
                             "class_id": 11,
                             "state": state,
                             "fra_type": fra_type,
-                            "claim_status": np.random.choice(['pending', 'approved', 'rejected'], p=[0.4, 0.5, 0.1]),
-                            "claim_area_ha": round(np.random.uniform(1, 100), 2),
-                            "tribal_community": np.random.choice(['Gond', 'Santal', 'Munda', 'Oraon', 'Ho', 'Kurukh']),
-                            "village": f"Village_{np.random.randint(1, 1000)}",
-                            "block": f"Block_{np.random.randint(1, 50)}",
-                            "district": f"District_{np.random.randint(1, 20)}"
+                            "claim_status": self._claim_status(),
+                            "claim_area_ha": round(self.rng.uniform(1, 100), 2),
+                            "tribal_community": self.rng.choice(['Gond', 'Santal', 'Munda', 'Oraon', 'Ho', 'Kurukh']),
+                            "village": f"Village_{self.rng.integers(1, 1000)}",
+                            "block": f"Block_{self.rng.integers(1, 50)}",
+                            "district": f"District_{self.rng.integers(1, 20)}"
                         },
                         "geometry": {
                             "type": "Polygon",
@@ -280,8 +349,86 @@ class IndiaLandUseClassifier:
         
         return fra_features
 
+def _generate_state(seed, output_dir, state_name, state_info, class_distribution):
+    """Worker entry point: one state's land-use features with its own seeded rng"""
+    classifier = IndiaLandUseClassifier(output_dir, seed)
+    return classifier.generate_state_columns(state_name, state_info, class_distribution)
+
+def _features_from_columns(columns):
+    """Zip a struct of feature columns into GeoJSON feature dicts"""
+    properties = ('class', 'class_id', 'state', 'area_km2', 'confidence', 'population',
+                  'forest_type', 'crop_type', 'tribal_area')
+    values = [columns[key].tolist() for key in properties]
+    rings, ring_sizes = columns['rings'], columns['ring_sizes'].tolist()
+    return [
+        {
+            "type": "Feature",
+            "properties": dict(zip(properties, row)),
+            "geometry": {
+                "type": "Polygon",
+                "coordinates": [rings[i, :ring_sizes[i]].tolist()]
+            }
+        }
+        for i, row in enumerate(zip(*values))
+    ]
+
+def _to_geodataframe(geojson_data):
+    """GeoDataFrame of the features, building polygons with vectorized shapely calls
+    
+    Rings of equal vertex count (5 urban, 9 irregular, 13 organic) are stacked into one
+    (n, V + 1, 2) array per count and handed to shapely.polygons, and properties are
+    stored column-wise. Collection-level properties are
+    not carried over and properties absent on a class are stored as null.
+    """
+    import geopandas as gpd
+    import shapely
+    
+    features = geojson_data['features']
+    rings = [feature['geometry']['coordinates'][0] for feature in features]
+    lengths = np.fromiter((len(ring) for ring in rings), dtype=np.intp, count=len(rings))
+    polygons = np.empty(len(rings), dtype=object)
+    for length in np.unique(lengths):
+        group = np.flatnonzero(lengths == length)
+        polygons[group] = shapely.polygons(np.array([rings[i] for i in group], dtype=np.float64))
+    
+    columns = {}
+    for feature in features:
+        for key in feature['properties']:
+            columns.setdefault(key, [])
+    for key, values in columns.items():
+        values.extend(feature['properties'].get(key) for feature in features)
+    
+    return gpd.GeoDataFrame(columns, geometry=polygons, crs='EPSG:4326').convert_dtypes()
+
+def write_columnar_geojson(geojson_data, output_path):
+    """Write the features through GeoPandas/pyogrio"""
+    _to_geodataframe(geojson_data).to_file(output_path, driver='GeoJSON', engine='pyogrio')
+
+def write_geoparquet(geojson_data, output_path):
+    """Write the features as zstd-compressed GeoParquet with WKB geometries (requires pyarrow)"""
+    _to_geodataframe(geojson_data).to_parquet(output_path, compression='zstd')
+
+def _print_counts(counts):
+    """Print (value, count) pairs as an aligned two-column table"""
+    width = max((len(str(value)) for value, _ in counts), default=0)
+    for value, count in counts:
+        print(f"{value:<{width}}  {count}")
+
 def main():
     """Generate enhanced India land use data."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--pretty', action='store_true',
+                        help='Indent the output GeoJSON (larger and slower to write)')
+    parser.add_argument('--columnar', action='store_true',
+                        help='Write the GeoJSON through GeoPandas/pyogrio instead of the JSON encoder')
+    parser.add_argument('--parquet', action='store_true',
+                        help='Also write output/india_assets.parquet (GeoParquet with WKB geometries)')
+    parser.add_argument('--seed', type=int, default=None,
+                        help='Random seed for reproducible output')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='Worker processes for state generation (default: 1, serial)')
+    args = parser.parse_args()
+    
     print("=== Enhanced India Land Use Classification ===")
     print("Generating comprehensive sample data for India...\n")
     
@@ -289,39 +436,53 @@ def main():
     os.makedirs('output', exist_ok=True)
     
     # Initialize classifier
-    classifier = IndiaLandUseClassifier('output')
-    
-    # Generate sample data
-    geojson_data = classifier.generate_india_sample_data()
+    classifier = IndiaLandUseClassifier('output', args.seed)
     
-    # Save to file
     output_path = 'output/india_assets.geojson'
-    with open(output_path, 'w') as f:
-        json.dump(geojson_data, f, indent=2)
+    if args.columnar or args.parquet:
+        # The GeoDataFrame writers need the whole collection in memory
+        geojson_data = classifier.generate_india_sample_data(args.workers)
+        features = geojson_data['features']
+    else:
+        features = classifier.iter_india_features(args.workers)
+    
+    # Save to file, keeping only the feature properties for the summary
+    properties = []
+    if args.columnar:
+        write_columnar_geojson(geojson_data, output_path)
+        properties = [f['properties'] for f in features]
+    else:
+        with GeoJSONStreamWriter(output_path, indent=args.pretty) as writer:
+            for feature in features:
+                writer.write_feature(feature)
+                properties.append(feature['properties'])
+            writer.properties = classifier.collection_properties(writer.count)
     
     print(f"Enhanced data saved to: {output_path}")
-    print(f"Total features: {len(geojson_data['features'])}")
-    print(f"Classes: {', '.join(geojson_data['properties']['classes'])}")
-    print(f"States covered: {len(geojson_data['properties']['states'])}")
+    if args.parquet:
+        parquet_path = 'output/india_assets.parquet'
+        write_geoparquet(geojson_data, parquet_path)
+        print(f"GeoParquet copy saved to: {parquet_path}")
+    print(f"Total features: {len(properties)}")
+    print(f"Classes: {', '.join(classifier.class_mapping)}")
+    print(f"States covered: {len(classifier.states_data)}")
     
     # Generate summary statistics
-    df = pd.DataFrame([f['properties'] for f in geojson_data['features']])
-    
     print("\n=== Summary Statistics ===")
     print("Class distribution:")
-    print(df['class'].value_counts())
+    _print_counts(Counter(p['class'] for p in properties).most_common())
     
     print("\nState distribution:")
-    print(df['state'].value_counts().head(10))
+    _print_counts(Counter(p['state'] for p in properties).most_common(10))
     
     print("\nFRA data:")
-    fra_data = df[df['class'] == 'fra_area']
+    fra_data = [p for p in properties if p['class'] == 'fra_area']
     if len(fra_data) > 0:
         print(f"Total FRA claims: {len(fra_data)}")
         print("FRA type distribution:")
-        print(fra_data['fra_type'].value_counts())
+        _print_counts(Counter(p['fra_type'] for p in fra_data).most_common())
         print("Claim status distribution:")
-        print(fra_data['claim_status'].value_counts())
+        _print_counts(Counter(p['claim_status'] for p in fra_data).most_common())
     
     print("\n=== Data Generation Complete ===")
     print("You can now start the enhanced Flask server to view the data:")
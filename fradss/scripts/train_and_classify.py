@@ -9,34 +9,174 @@ and classifies land use into Water, Forest, and Agriculture.
 
 import os
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 import numpy as np
 import pandas as pd
 import rasterio
 import geopandas as gpd
+import shapely
+from shapely.geometry import shape
 from sklearn.ensemble import RandomForestClassifier
 from sklearn.model_selection import train_test_split
 from sklearn.metrics import classification_report, accuracy_score
 import joblib
-import json
-from rasterio.features import shapes
+from rasterio.features import shapes, rasterize, sieve
 from rasterio.transform import from_bounds
 import warnings
 warnings.filterwarnings('ignore')
 
+from fra_common import encode_json
+
+try:
+    from numba import njit  # type: ignore
+except Exception:
+    njit = None
+
+try:
+    import lz4  # type: ignore
+except Exception:
+    lz4 = None
+
+try:
+    from skl2onnx import to_onnx  # type: ignore
+except Exception:
+    to_onnx = None
+
+try:
+    import onnxruntime as ort  # type: ignore
+except Exception:
+    ort = None
+
 # Add project root to path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+def _jit(func):
+    """Compile with Numba, releasing the GIL, when it is installed, otherwise run as plain Python"""
+    if njit is None:
+        return func
+    return njit(nogil=True, cache=True)(func)
+
+def _forest_tables(model):
+    """Stack a fitted forest's trees into padded (n_trees, max_nodes) node tables
+    
+    Returns (feature, threshold, left, right, leaf_proba). Leaves, including the
+    padding, have left == -1 and feature 0; leaf_proba is each node's normalized
+    (n_classes,) class distribution, as averaged by RandomForestClassifier.predict.
+    Feature indices are int16 and child indices int32 to keep the tables cache-sized;
+    thresholds stay float64 so splits compare exactly as in scikit-learn.
+    """
+    trees = [estimator.tree_ for estimator in model.estimators_]
+    n_trees = len(trees)
+    max_nodes = max(tree.node_count for tree in trees)
+    n_classes = len(model.classes_)
+    
+    feature = np.zeros((n_trees, max_nodes), dtype=np.int16)
+    threshold = np.zeros((n_trees, max_nodes), dtype=np.float64)
+    left = np.full((n_trees, max_nodes), -1, dtype=np.int32)
+    right = np.full((n_trees, max_nodes), -1, dtype=np.int32)
+    leaf_proba = np.zeros((n_trees, max_nodes, n_classes), dtype=np.float64)
+    for t, tree in enumerate(trees):
+        n = tree.node_count
+        feature[t, :n] = np.maximum(tree.feature, 0)
+        threshold[t, :n] = tree.threshold
+        left[t, :n] = tree.children_left
+        right[t, :n] = tree.children_right
+        value = tree.value[:, 0, :]
+        leaf_proba[t, :n] = value / value.sum(axis=1, keepdims=True)
+    return feature, threshold, left, right, leaf_proba
+
+def _predict_forest_numpy(X, feature, threshold, left, right, leaf_proba):
+    """NumPy version of _predict_forest_kernel, descending all rows through one tree at a time"""
+    proba = np.zeros((X.shape[0], leaf_proba.shape[2]))
+    for t in range(feature.shape[0]):
+        node = np.zeros(X.shape[0], dtype=np.int64)
+        while True:
+            child_left = left[t, node]
+            internal = child_left != -1
+            if not internal.any():
+                break
+            values = np.take_along_axis(X, feature[t, node][:, None], axis=1)[:, 0]
+            node = np.where(internal,
+                            np.where(values <= threshold[t, node], child_left, right[t, node]),
+                            node)
+        proba += leaf_proba[t, node]
+    return np.argmax(proba, axis=1)
+
+@_jit
+def _predict_forest_kernel(X, feature, threshold, left, right, leaf_proba):
+    """Class index with the highest mean leaf probability over all trees, per row of X"""
+    n_trees = feature.shape[0]
+    n_classes = leaf_proba.shape[2]
+    out = np.empty(X.shape[0], dtype=np.int64)
+    for i in range(X.shape[0]):
+        proba = np.zeros(n_classes)
+        for t in range(n_trees):
+            node = 0
+            while left[t, node] != -1:
+                if X[i, feature[t, node]] <= threshold[t, node]:
+                    node = left[t, node]
+                else:
+                    node = right[t, node]
+            for c in range(n_classes):
+                proba[c] += leaf_proba[t, node, c]
+        out[i] = np.argmax(proba)
+    return out
+
+def _gdal_env(path):
+    """rasterio.Env tuned for reading the raster at path
+    
+    Threaded tile decoding, a larger block cache (unless GDAL_CACHEMAX is set in the
+    environment) and no sidecar directory scans; remote /vsi* and URL paths also get
+    the VSI read cache.
+    """
+    options = {
+        'GDAL_NUM_THREADS': 'ALL_CPUS',
+        'GDAL_DISABLE_READDIR_ON_OPEN': 'EMPTY_DIR',
+    }
+    # An exported value may be a size like 512MB or 10%, so leave it for GDAL to read
+    if 'GDAL_CACHEMAX' not in os.environ:
+        options['GDAL_CACHEMAX'] = '1024'
+    if str(path).startswith(('/vsi', 's3://', 'gs://', 'http://', 'https://')):
+        options.update(VSI_CACHE=True, VSI_CACHE_SIZE=256_000_000)
+    return rasterio.Env(**options)
+
+def _crs_member(crs):
+    """GeoJSON "crs" member naming a rasterio CRS, as GDAL's GeoJSON driver writes it"""
+    epsg = crs.to_epsg()
+    name = f"urn:ogc:def:crs:EPSG::{epsg}" if epsg is not None else crs.to_string()
+    return {"type": "name", "properties": {"name": name}}
+
 class LandUseClassifier:
-    def __init__(self, satellite_image_path, training_data_dir, output_dir):
+    def __init__(self, satellite_image_path, training_data_dir, output_dir, predict_n_jobs=1,
+                 min_pixel_size=16, classify_threads=None, max_samples_per_class=50_000):
         self.satellite_image_path = satellite_image_path
         self.training_data_dir = training_data_dir
         self.output_dir = output_dir
+        # n_jobs for the saved model's predict: small batches don't pay back joblib dispatch
+        self.predict_n_jobs = predict_n_jobs
+        self.onnx_model_path = os.path.join(output_dir, 'land_classifier.onnx')
+        self.onnx_exported = False
+        # Regions smaller than this many pixels are sieved out before vectorizing (0 keeps all)
+        self.min_pixel_size = min_pixel_size
+        # Threads classifying image blocks concurrently (default: one per CPU)
+        self.classify_threads = classify_threads or os.cpu_count() or 1
+        # Training pixels kept per class; the forest's accuracy plateaus long before millions
+        self.max_samples_per_class = max_samples_per_class
         self.model = None
         self.class_mapping = {
             'water': 1,
             'forest': 2,
             'agriculture': 3
         }
+        # Sentinel-2 band positions in the image stack (B2, B3, B4, B8)
+        self.band_indices = {
+            'blue': 0,
+            'green': 1,
+            'red': 2,
+            'nir': 3
+        }
         
         # Create output directory if it doesn't exist
         os.makedirs(output_dir, exist_ok=True)
@@ -48,6 +188,15 @@ class LandUseClassifier:
         training_data = []
         training_labels = []
         
+        # Read every band once, in one pass over the tiles with threaded decoding; each
+        # class then indexes its pixels out of this stack
+        with _gdal_env(self.satellite_image_path), rasterio.open(self.satellite_image_path) as src:
+            image_data = src.read()
+            image_shape = src.shape
+            image_transform = src.transform
+        
+        rng = np.random.default_rng(42)
+        
         for class_name, class_id in self.class_mapping.items():
             shapefile_path = os.path.join(self.training_data_dir, f"{class_name}_training.shp")
             
@@ -59,50 +208,37 @@ class LandUseClassifier:
             gdf = gpd.read_file(shapefile_path)
             print(f"Loaded {len(gdf)} {class_name} training polygons")
             
-            # Load satellite image
-            with rasterio.open(self.satellite_image_path) as src:
-                # Extract pixel values for each polygon
-                for idx, geom in enumerate(gdf.geometry):
-                    try:
-                        # Create a mask for the polygon
-                        mask = rasterio.features.geometry_mask(
-                            [geom], 
-                            out_shape=src.shape, 
-                            transform=src.transform, 
-                            invert=True
-                        )
-                        
-                        # Extract pixel values where mask is True
-                        for band_idx in range(src.count):
-                            band_data = src.read(band_idx + 1)
-                            pixel_values = band_data[mask]
-                            
-                            if len(pixel_values) > 0:
-                                # For each pixel, create a feature vector with all bands
-                                if band_idx == 0:
-                                    feature_vector = pixel_values.reshape(-1, 1)
-                                else:
-                                    feature_vector = np.column_stack([
-                                        feature_vector, 
-                                        pixel_values.reshape(-1, 1)
-                                    ])
-                        
-                        # Add labels for all pixels in this polygon
-                        labels = np.full(len(pixel_values), class_id)
-                        
-                        training_data.append(feature_vector)
-                        training_labels.extend(labels)
-                        
-                    except Exception as e:
-                        print(f"Error processing polygon {idx} in {class_name}: {e}")
-                        continue
+            # Burn every polygon of the class into one mask and extract its pixels at once
+            try:
+                mask = rasterize(
+                    ((geom, 1) for geom in gdf.geometry),
+                    out_shape=image_shape,
+                    transform=image_transform,
+                    fill=0,
+                    dtype=np.uint8
+                ).astype(bool)
+            except Exception as e:
+                print(f"Error rasterizing {class_name} polygons: {e}")
+                continue
+            
+            # One (pixels, bands) feature block for every pixel inside the class polygons,
+            # randomly subsampled down to max_samples_per_class
+            feature_vector = image_data[:, mask].T
+            if len(feature_vector) > self.max_samples_per_class:
+                keep = rng.choice(len(feature_vector), self.max_samples_per_class, replace=False)
+                feature_vector = feature_vector[np.sort(keep)]
+                print(f"Subsampled {class_name} to {self.max_samples_per_class} pixels")
+            feature_vector = self._spectral_features(feature_vector)
+            
+            training_data.append(feature_vector)
+            training_labels.append(np.full(len(feature_vector), class_id, dtype=np.int32))
         
         if not training_data:
             raise ValueError("No training data found. Please check your shapefiles.")
         
         # Combine all training data
         X = np.vstack(training_data)
-        y = np.array(training_labels)
+        y = np.concatenate(training_labels)
         
         print(f"Total training samples: {len(X)}")
         print(f"Feature dimensions: {X.shape[1]}")
@@ -122,9 +258,10 @@ class LandUseClassifier:
         # Train Random Forest
         self.model = RandomForestClassifier(
             n_estimators=100,
-            max_depth=10,
+            max_depth=8,
             min_samples_split=5,
-            min_samples_leaf=2,
+            min_samples_leaf=5,
+            max_features='sqrt',
             random_state=42,
             n_jobs=-1
         )
@@ -140,100 +277,178 @@ class LandUseClassifier:
         print(classification_report(y_test, y_pred, 
                                   target_names=list(self.class_mapping.keys())))
         
-        # Save model
+        # Save model, predicting single-threaded once loaded back
+        self.model.n_jobs = self.predict_n_jobs
         model_path = os.path.join(self.output_dir, 'land_classifier.pkl')
-        joblib.dump(self.model, model_path)
+        # LZ4 keeps compression cheaper than the disk write; zlib when lz4 isn't installed
+        joblib.dump(self.model, model_path, compress=('lz4', 3) if lz4 is not None else ('zlib', 3))
         print(f"Model saved to: {model_path}")
         
+        # Compiled copy of the forest for fast inference, when skl2onnx is installed
+        if to_onnx is not None:
+            try:
+                onnx_model = to_onnx(self.model, X_train[:1], target_opset=17)
+                with open(self.onnx_model_path, 'wb') as f:
+                    f.write(onnx_model.SerializeToString())
+                self.onnx_exported = True
+                print(f"ONNX model saved to: {self.onnx_model_path}")
+            except Exception as e:
+                # Classification falls back to the tree-table kernel
+                self.onnx_exported = False
+                print(f"Warning: ONNX export failed, using the built-in forest kernel: {e}")
+        
         return accuracy
     
+    def _spectral_features(self, pixels):
+        """(pixels, bands) model features: the bands plus NDVI and NDWI columns
+        
+        Returned as C-contiguous float32 (lossless for uint16 bands), the layout the
+        forest predicts on without copying. Images without a NIR band get no indices.
+        """
+        pixels = np.asarray(pixels, dtype=np.float32)
+        if pixels.shape[1] <= max(self.band_indices.values()):
+            return np.ascontiguousarray(pixels)
+        
+        green = pixels[:, self.band_indices['green']]
+        red = pixels[:, self.band_indices['red']]
+        nir = pixels[:, self.band_indices['nir']]
+        ndvi = (nir - red) / (nir + red + 1e-6)
+        ndwi = (green - nir) / (green + nir + 1e-6)
+        return np.column_stack([pixels, ndvi, ndwi])
+    
     def classify_image(self):
         """Classify the entire satellite image."""
         print("Classifying satellite image...")
         
-        with rasterio.open(self.satellite_image_path) as src:
-            # Read all bands
-            image_data = src.read()
-            
-            # Reshape for classification (pixels x bands)
-            original_shape = image_data.shape[1:]  # Height, Width
-            image_2d = image_data.reshape(image_data.shape[0], -1).T
-            
-            print(f"Classifying {len(image_2d)} pixels...")
-            
-            # Classify in batches to manage memory
-            batch_size = 10000
-            predictions = []
-            
-            for i in range(0, len(image_2d), batch_size):
-                batch = image_2d[i:i+batch_size]
-                batch_pred = self.model.predict(batch)
-                predictions.extend(batch_pred)
-                
-                if (i // batch_size) % 10 == 0:
-                    print(f"Processed {i}/{len(image_2d)} pixels")
+        predict = self._block_predictor()
+        
+        with _gdal_env(self.satellite_image_path), rasterio.open(self.satellite_image_path) as src:
+            classified_image = np.zeros(src.shape, dtype=np.uint8)
+            output_path = os.path.join(self.output_dir, 'classified_map.tif')
             
-            # Reshape predictions back to image shape
-            classified_image = np.array(predictions).reshape(original_shape)
+            print(f"Classifying {src.width * src.height} pixels...")
             
-            # Save classified raster
-            output_path = os.path.join(self.output_dir, 'classified_map.tif')
+            # Classify one output tile at a time, so every write fills exactly one compressed block
             with rasterio.open(
                 output_path, 'w',
                 driver='GTiff',
-                height=classified_image.shape[0],
-                width=classified_image.shape[1],
+                height=src.height,
+                width=src.width,
                 count=1,
-                dtype=classified_image.dtype,
+                dtype=rasterio.uint8,
                 crs=src.crs,
-                transform=src.transform
+                transform=src.transform,
+                tiled=True,
+                blockxsize=256,
+                blockysize=256,
+                compress='lzw',
+                predictor=2,
+                BIGTIFF='IF_SAFER'
             ) as dst:
-                dst.write(classified_image, 1)
+                windows = [window for _, window in dst.block_windows(1)]
+                # Dataset handles are not thread-safe, so reads and writes take turns while
+                # the GIL-releasing predictions run concurrently
+                io_lock = threading.Lock()
+                
+                def classify_window(window):
+                    with io_lock:
+                        block = src.read(window=window)
+                    pixels = self._spectral_features(np.moveaxis(block, 0, -1).reshape(-1, block.shape[0]))
+                    pred = predict(pixels).astype(np.uint8, copy=False).reshape(block.shape[1:])
+                    with io_lock:
+                        dst.write(pred, 1, window=window)
+                    
+                    row_slice, col_slice = window.toslices()
+                    classified_image[row_slice, col_slice] = pred
+                
+                with ThreadPoolExecutor(max_workers=min(len(windows), self.classify_threads)) as executor:
+                    for block_idx, _ in enumerate(executor.map(classify_window, windows)):
+                        if block_idx % 100 == 0:
+                            print(f"Processed {block_idx}/{len(windows)} blocks")
             
             print(f"Classified image saved to: {output_path}")
             
             return classified_image, src.crs, src.transform
     
-    def raster_to_geojson(self, classified_image, crs, transform):
-        """Convert classified raster to GeoJSON polygons."""
-        print("Converting raster to GeoJSON...")
+    def _block_predictor(self):
+        """Function mapping a (pixels, bands) block to class ids
         
-        # Create a mask for each class
-        features = []
+        Uses an onnxruntime session over the forest exported by train_model when
+        onnxruntime is available, and otherwise the forest's tree tables, walked by the
+        Numba kernel when numba is installed or level by level in NumPy.
+        """
+        if ort is not None and self.onnx_exported:
+            # Blocks already run on classify_threads threads, so each run stays single-threaded
+            options = ort.SessionOptions()
+            options.intra_op_num_threads = 1
+            session = ort.InferenceSession(self.onnx_model_path, options, providers=['CPUExecutionProvider'])
+            input_name = session.get_inputs()[0].name
+            print(f"Predicting with ONNX Runtime ({self.onnx_model_path})")
+            return lambda pixels: session.run(None, {input_name: pixels})[0]
         
-        for class_name, class_id in self.class_mapping.items():
-            print(f"Processing {class_name} class...")
-            
-            # Create binary mask for this class
-            mask = (classified_image == class_id)
-            
-            if not np.any(mask):
-                print(f"No {class_name} pixels found, skipping...")
-                continue
-            
-            # Convert raster to vector
-            results = (
-                {'properties': {'class': class_name, 'class_id': class_id}, 'geometry': s}
-                for i, (s, v) in enumerate(
-                    shapes(mask.astype(np.uint8), mask=mask, transform=transform)
-                )
-            )
-            
-            # Add to features list
-            features.extend(list(results))
+        tables = _forest_tables(self.model)
+        # Class ids as uint8, so the label gather already yields the output raster's dtype
+        classes = self.model.classes_.astype(np.uint8)
+        if njit is not None:
+            print("Predicting with the compiled tree-table kernel")
+            return lambda pixels: classes[_predict_forest_kernel(pixels, *tables)]
+        
+        print("Predicting with the NumPy tree-table descent")
+        return lambda pixels: classes[_predict_forest_numpy(pixels, *tables)]
+    
+    def _vectorize_class(self, classified_image, transform, class_name, class_id):
+        """Simplified GeoJSON geometry strings for every connected region of one class."""
+        print(f"Processing {class_name} class...")
+        
+        # Binary raster for this class, with speckle regions sieved out; its bool view is
+        # the shapes() mask, without a copy
+        binary = (classified_image == class_id).astype(np.uint8)
+        if self.min_pixel_size > 1:
+            binary = sieve(binary, size=self.min_pixel_size, connectivity=8)
+        mask = binary.view(np.bool_)
         
-        # Create GeoDataFrame
-        gdf = gpd.GeoDataFrame.from_features(features, crs=crs)
+        if not mask.any():
+            print(f"No {class_name} pixels found, skipping...")
+            return np.empty(0, dtype=object)
+        
+        # Convert raster to vector, then simplify the class in one vectorized shapely call,
+        # dropping any geometry that collapses
+        geometries = shapely.simplify(
+            np.array([shape(s) for s, _ in shapes(binary, mask=mask, transform=transform)], dtype=object),
+            tolerance=0.0001, preserve_topology=False
+        )
+        return shapely.to_geojson(geometries[~shapely.is_empty(geometries)])
+    
+    def raster_to_geojson(self, classified_image, crs, transform):
+        """Convert classified raster to GeoJSON polygons."""
+        print("Converting raster to GeoJSON...")
         
-        # Simplify geometries to reduce file size
-        gdf['geometry'] = gdf['geometry'].simplify(tolerance=0.0001)
+        # Classes are independent, so their polygons are traced in parallel threads
+        with ThreadPoolExecutor(max_workers=len(self.class_mapping)) as executor:
+            class_geometries = list(executor.map(partial(self._vectorize_class, classified_image, transform),
+                                                 *zip(*self.class_mapping.items())))
         
-        # Save as GeoJSON
+        # Save as GeoJSON, streaming each class's pre-encoded geometries behind its
+        # properties, encoded once per class
         geojson_path = os.path.join(self.output_dir, 'assets.geojson')
-        gdf.to_file(geojson_path, driver='GeoJSON')
+        total_features = 0
+        with open(geojson_path, 'wb') as f:
+            f.write(b'{"type": "FeatureCollection", ')
+            if crs is not None:
+                f.write(b'"crs": ' + encode_json(_crs_member(crs)) + b', ')
+            f.write(b'"features": [\n')
+            for (class_name, class_id), geometry_json in zip(self.class_mapping.items(), class_geometries):
+                prefix = (b'{"type": "Feature", "properties": '
+                          + encode_json({'class': class_name, 'class_id': class_id}) + b', "geometry": ')
+                for geometry in geometry_json:
+                    if total_features:
+                        f.write(b',\n')
+                    f.write(prefix + geometry.encode('utf-8') + b'}')
+                    total_features += 1
+            f.write(b'\n]}\n')
         
         print(f"GeoJSON saved to: {geojson_path}")
-        print(f"Total features: {len(gdf)}")
+        print(f"Total features: {total_features}")
         
         return geojson_path
 